@@ -0,0 +1,4 @@
+"""
+OmniTool Benchmarks
+Run with: python -m benchmarks.<name>
+"""
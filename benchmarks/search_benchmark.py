@@ -0,0 +1,125 @@
+"""
+Search Benchmark
+Compare the tool search index with the original linear substring scan
+
+Usage:
+    python -m benchmarks.search_benchmark [--tools 10000] [--repeat 20]
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from core.search_index import ToolSearchIndex
+from core.tool_metadata import ToolMetadata
+
+
+CATEGORIES = [
+    "Media & Video", "Productivity", "Utilities", "Networking",
+    "Development", "System Tools", "Other",
+]
+
+WORDS = [
+    "audio", "video", "youtube", "download", "convert", "merge", "split", "image",
+    "resize", "compress", "archive", "backup", "sync", "network", "ping", "scan",
+    "monitor", "process", "memory", "disk", "clean", "format", "json", "yaml",
+    "csv", "excel", "pdf", "markdown", "editor", "viewer", "player", "recorder",
+    "screen", "capture", "clipboard", "password", "generator", "hash", "encrypt",
+    "decrypt", "calculator", "timer", "notes", "calendar", "weather", "translate",
+    "ocr", "barcode", "qrcode", "color", "picker", "font", "icon", "rename",
+]
+
+QUERIES = ["y", "you", "youtube", "tube", "youtbe", "pdf merge", "color picker", "zzz"]
+
+# Cold query time the index aims for (milliseconds)
+TARGET_MS = 1.0
+
+
+def build_catalog(tool_count: int, seed: int = 42) -> List[ToolMetadata]:
+    """Create a reproducible synthetic tool catalog"""
+    rng = random.Random(seed)
+    catalog = []
+    for number in range(tool_count):
+        name_words = rng.sample(WORDS, 2)
+        catalog.append(ToolMetadata(
+            id=f"tool_{number}",
+            name=" ".join(word.title() for word in name_words) + f" {number}",
+            description=" ".join(rng.choice(WORDS) for _ in range(12)),
+            category=rng.choice(CATEGORIES),
+            icon="🔧",
+            keywords=tuple(rng.sample(WORDS, 5)),
+            version="1.0.0",
+            author="Benchmark",
+        ))
+    return catalog
+
+
+def linear_scan(catalog: List[ToolMetadata], query: str) -> List[ToolMetadata]:
+    """The original AppManager.search_tools implementation"""
+    query_lower = query.lower()
+    results = []
+    for tool in catalog:
+        if (query_lower in tool.name.lower() or
+                query_lower in tool.description.lower() or
+                query_lower in tool.category.lower() or
+                any(query_lower in kw.lower() for kw in tool.keywords)):
+            results.append(tool)
+    return results
+
+
+def time_per_call(function: Callable[[str], list], query: str, repeat: int):
+    """Return (mean seconds per call, result count)"""
+    result = function(query)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(query)
+    return (time.perf_counter() - start) / repeat, len(result)
+
+
+def main():
+    """Run the benchmark and print a comparison table"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tools', type=int, default=10000, help='Catalog size')
+    parser.add_argument('--repeat', type=int, default=20, help='Calls per query')
+    args = parser.parse_args()
+
+    catalog = build_catalog(args.tools)
+
+    start = time.perf_counter()
+    index = ToolSearchIndex()
+    for metadata in catalog:
+        index.add(metadata)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Catalog: {args.tools} tools | index build: {build_ms:.1f} ms\n")
+    print(f"{'query':<16}{'scan ms':>10}{'hits':>8}"
+          f"{'cold ms':>10}{'warm ms':>10}{'hits':>8}{'speedup':>10}")
+
+    def cold_search(query):
+        index.clear_cache()
+        return index.search(query)
+
+    missed = []
+    for query in QUERIES:
+        scan_time, scan_hits = time_per_call(lambda q: linear_scan(catalog, q), query, args.repeat)
+        cold_time, index_hits = time_per_call(cold_search, query, args.repeat)
+        warm_time, _ = time_per_call(index.search, query, args.repeat)
+        speedup = scan_time / cold_time if cold_time else float('inf')
+        if cold_time * 1000 > TARGET_MS:
+            missed.append(query)
+        print(f"{query!r:<16}{scan_time * 1000:>10.3f}{scan_hits:>8}"
+              f"{cold_time * 1000:>10.3f}{warm_time * 1000:>10.3f}{index_hits:>8}{speedup:>9.1f}x")
+
+    print("\ncold = per-token memo cleared before each call; speedup is scan vs cold")
+    if missed:
+        print(f"Target of {TARGET_MS:g} ms per cold query NOT met for: {', '.join(map(repr, missed))}"
+              " (ranking thousands of hits dominates)")
+    else:
+        print(f"Target of {TARGET_MS:g} ms per cold query met for every query")
+    print("Hits differ from the scan: the scan matches the whole query as one substring, the index"
+          " matches each word (exact, prefix, else substring/typo) anywhere in a tool")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@ OmniTool - Clean Application Manager
 Simplified manager using the Registry Pattern
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
+from core.tool_metadata import ToolMetadata
 from core.tool_registry import ToolRegistry
 
 
@@ -27,73 +28,88 @@ class AppManager:
     - Handles tool filtering, searching, and categorization
     """
 
-    def __init__(self):
-        """Initialize and discover all tools"""
-        self._discover_tools()
+    def __init__(self, discover: bool = True, isolate_tools: Optional[bool] = None,
+                 warm_processes: int = 1, window_idle_timeout: float = 600.0,
+                 record_usage: bool = True):
+        """
+        Initialize and discover all tools.
 
-    def _discover_tools(self):
+        Args:
+            discover: Run discovery now. Pass False to call discover_tools()
+                      later, e.g. from a background thread after the UI is up.
+            isolate_tools: True runs every tool in a worker process, False
+                           none; None (default) follows each tool's
+                           BaseTool.isolated flag
+            warm_processes: Idle worker processes kept ready for isolated tools
+            window_idle_timeout: Seconds a closed tool window is kept hidden
+                                 for reuse before it is released
+            record_usage: Count launches in the usage stats (off in tool
+                          host processes, whose launches the launcher counted)
         """
-        Automatically discover and import all tools.
+        self.isolate_tools = isolate_tools
+        self.warm_processes = warm_processes
+        self.window_idle_timeout = window_idle_timeout
+        self.record_usage = record_usage
+        self._process_pool = None
+        self._lifecycle = None
+        self._usage_stats = None
+        self._tool_processes = []
+
+        if discover:
+            self.discover_tools()
+
+    def discover_tools(self):
+        """
+        Automatically discover all tools.
 
         Convention: Each tool package must have a tool.py file
-        that registers itself with @ToolRegistry.register
+        that registers itself with @ToolRegistry.register.
+
+        Packages that also ship a manifest.json are registered from the
+        manifest (via the discovery cache) and their tool.py is only
+        imported when the tool is first launched.
         """
         import importlib
-        import pkgutil
         import tools
+        from core.discovery import DiscoveryCache, ToolDiscovery
 
-        # Walk through all packages in the tools directory
-        for importer, modname, ispkg in pkgutil.walk_packages(
-            path=tools.__path__,
-            prefix=tools.__name__ + '.',
-        ):
-            if ispkg:
-                # Try to import tool.py from each package
-                try:
-                    tool_module = f"{modname}.tool"
-                    importlib.import_module(tool_module)
-                except (ImportError, AttributeError) as e:
-                    # Tool doesn't have a tool.py or it has errors
-                    pass
-
-    def get_all_tools(self) -> List[dict]:
+        discovery = ToolDiscovery(tools, cache=DiscoveryCache())
+
+        for discovered in discovery.discover():
+            if discovered.manifest is not None:
+                ToolRegistry.register_manifest(discovered.manifest, discovered.module)
+                continue
+
+            # No manifest: import tool.py so it registers itself
+            try:
+                importlib.import_module(discovered.module)
+            except (ImportError, AttributeError) as e:
+                # Tool doesn't have a tool.py or it has errors
+                pass
+
+    def get_all_tools(self) -> List[ToolMetadata]:
         """Get metadata for all registered tools"""
         return ToolRegistry.get_tool_metadata_list()
 
-    def get_tools_by_category(self, category: str) -> List[dict]:
+    def get_tools_by_category(self, category: str) -> List[ToolMetadata]:
         """Get tools filtered by category"""
-        all_tools = self.get_all_tools()
-        return [t for t in all_tools if t['category'] == category]
-
-    def search_tools(self, query: str) -> List[dict]:
-        """Search tools by query"""
-        if not query:
-            return self.get_all_tools()
+        return ToolRegistry.get_tools_in_category(category)
 
-        query_lower = query.lower()
-        all_tools = self.get_all_tools()
-        results = []
+    def search_tools(self, query: str) -> List[ToolMetadata]:
+        """
+        Search tools by query.
 
-        for tool in all_tools:
-            # Search in name, description, keywords, and category
-            if (query_lower in tool['name'].lower() or
-                query_lower in tool['description'].lower() or
-                query_lower in tool['category'].lower() or
-                any(query_lower in kw.lower() for kw in tool['keywords'])):
-                results.append(tool)
+        Matches name, description, keywords and category, tolerating
+        partial words and small typos. Results are ranked, best first.
+        """
+        if not query.strip():
+            return self.get_all_tools()
 
-        return results
+        return ToolRegistry.search(query)
 
     def get_categories_with_count(self) -> Dict[str, int]:
         """Get all categories with tool counts"""
-        all_tools = self.get_all_tools()
-        categories = {}
-
-        for tool in all_tools:
-            category = tool['category']
-            categories[category] = categories.get(category, 0) + 1
-
-        return categories
+        return ToolRegistry.get_category_counts()
 
     def launch_tool(self, tool_id: str):
         """
@@ -103,10 +119,68 @@ class AppManager:
             tool_id: The unique identifier of the tool
 
         Returns:
-            QMainWindow: The tool's window instance, or None if not found
+            QMainWindow: The tool's window instance, or
+            ToolProcess: a handle to the worker process for isolated tools,
+            or None if not found
+        """
+        tool_class = ToolRegistry.get_tool_class(tool_id)
+        if tool_class is None:
+            return None
+
+        if self.record_usage:
+            self.get_usage_stats().record_launch(tool_id)
+
+        if self.is_isolated(tool_class):
+            tool_process = self.get_process_pool().launch(tool_id)
+            self._tool_processes = [p for p in self._tool_processes if p.is_running()]
+            self._tool_processes.append(tool_process)
+            return tool_process
+
+        return self.get_lifecycle_manager().launch(tool_id, tool_class)
+
+    def is_isolated(self, tool_class) -> bool:
+        """Check whether a tool class should run in a worker process"""
+        if self.isolate_tools is not None:
+            return self.isolate_tools
+        return tool_class.isolated
+
+    def has_isolated_tools(self) -> bool:
+        """Check whether any registered tool would run in a worker process"""
+        if self.isolate_tools is not None:
+            return self.isolate_tools
+        return ToolRegistry.has_isolated_tools()
+
+    def get_lifecycle_manager(self):
+        """Get the manager that tracks in-process tool windows"""
+        if self._lifecycle is None:
+            from core.lifecycle import ToolLifecycleManager
+            self._lifecycle = ToolLifecycleManager(self.window_idle_timeout)
+        return self._lifecycle
+
+    def get_usage_stats(self):
+        """Get the persisted launch counts used to pick tools to prewarm"""
+        if self._usage_stats is None:
+            from core.usage import UsageStats
+            self._usage_stats = UsageStats()
+        return self._usage_stats
+
+    def get_process_pool(self):
+        """Get the worker process pool, creating and warming it on first use"""
+        if self._process_pool is None:
+            from core.process_pool import ToolProcessPool
+            self._process_pool = ToolProcessPool(self.warm_processes)
+            self._process_pool.warm_up()
+        return self._process_pool
+
+    def shutdown(self):
+        """
+        Release idle resources: hidden tool windows and idle worker
+        processes. Visible windows and running tool processes are left alone.
         """
-        tool_instance = ToolRegistry.create_tool_instance(tool_id)
-        if tool_instance:
-            return tool_instance.launch()
-        return None
+        if self._usage_stats is not None:
+            self._usage_stats.flush()
+        if self._lifecycle is not None:
+            self._lifecycle.release_hidden()
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
 
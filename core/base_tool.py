@@ -4,8 +4,11 @@ Define the contract that all tools must implement
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
-from PyQt6.QtWidgets import QMainWindow
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    # Only needed for annotations; keeps `import core` free of Qt
+    from PyQt6.QtWidgets import QMainWindow
 
 
 class BaseTool(ABC):
@@ -15,11 +18,20 @@ class BaseTool(ABC):
     Design Pattern: Template Method Pattern
     - Defines the skeleton of tool operations
     - Subclasses override specific methods
+
+    Set `isolated = True` on a subclass to run it in its own worker
+    process (see core.process_pool) instead of the launcher's process.
     """
+
+    # Run in a separate worker process instead of the launcher's event loop
+    isolated: bool = False
+
+    # Reuse one window per tool; closing it only hides it (see core.lifecycle)
+    single_instance: bool = True
     
     def __init__(self):
         """Initialize the tool"""
-        self.window: Optional[QMainWindow] = None
+        self.window: Optional['QMainWindow'] = None
         
     @abstractmethod
     def get_metadata(self) -> dict:
@@ -41,7 +53,7 @@ class BaseTool(ABC):
         pass
         
     @abstractmethod
-    def create_window(self) -> QMainWindow:
+    def create_window(self) -> 'QMainWindow':
         """
         Create and return the tool's main window.
         
@@ -50,7 +62,7 @@ class BaseTool(ABC):
         """
         pass
         
-    def launch(self) -> QMainWindow:
+    def launch(self) -> 'QMainWindow':
         """
         Launch the tool (Template Method).
         
@@ -68,6 +80,13 @@ class BaseTool(ABC):
         self.window.show()
         return self.window
         
+    def is_busy(self) -> bool:
+        """
+        Return True while the tool has work in progress (e.g. a download)
+        that must not be interrupted by releasing its window.
+        """
+        return False
+
     def cleanup(self):
         """
         Clean up resources when tool is closed.
@@ -75,5 +94,6 @@ class BaseTool(ABC):
         """
         if self.window:
             self.window.close()
+            self.window.deleteLater()
             self.window = None
 
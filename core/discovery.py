@@ -0,0 +1,190 @@
+"""
+OmniTool - Tool Discovery
+Find tool packages and read their static manifests without importing them
+"""
+
+import json
+import os
+import pkgutil
+from pathlib import Path
+from typing import Dict, Iterator, NamedTuple, Optional
+
+from core.paths import get_data_directory
+
+
+MANIFEST_FILENAME = "manifest.json"
+REQUIRED_MANIFEST_FIELDS = (
+    'id', 'name', 'description', 'category', 'icon', 'keywords', 'version', 'author'
+)
+
+
+class ManifestError(ValueError):
+    """Raised when a tool manifest is missing or malformed"""
+
+
+def load_manifest(package_directory) -> dict:
+    """
+    Read and validate a tool's manifest.json.
+
+    Args:
+        package_directory: Directory of the tool package
+
+    Returns:
+        dict: The manifest, containing at least the metadata fields
+              documented in BaseTool.get_metadata
+
+    Raises:
+        ManifestError: If the file is missing, unreadable or incomplete
+    """
+    manifest_path = Path(package_directory) / MANIFEST_FILENAME
+    try:
+        with open(manifest_path, encoding='utf-8') as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError) as error:
+        raise ManifestError(f"Cannot read {manifest_path}: {error}") from error
+
+    if not isinstance(manifest, dict):
+        raise ManifestError(f"{manifest_path} must contain a JSON object")
+
+    missing = [field for field in REQUIRED_MANIFEST_FIELDS if field not in manifest]
+    if missing:
+        raise ManifestError(f"{manifest_path} is missing fields: {', '.join(missing)}")
+
+    return manifest
+
+
+class DiscoveredTool(NamedTuple):
+    """A tool package found on disk"""
+    module: str                 # Module that registers the tool (e.g. tools.x.tool)
+    manifest: Optional[dict]    # Static manifest, or None for import-only tools
+
+
+class DiscoveryCache:
+    """
+    On-disk cache of parsed manifests.
+
+    Entries are keyed by package path and invalidated when the
+    manifest's modification time changes.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_path: Optional[str] = None):
+        if cache_path is None:
+            cache_path = str(get_data_directory() / "discovery_cache.json")
+        self.cache_path = cache_path
+        self._packages: Dict[str, dict] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """Load the cache file, ignoring it if it is stale or corrupt"""
+        try:
+            with open(self.cache_path, encoding='utf-8') as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get('version') == self.VERSION:
+            self._packages = data.get('packages', {})
+
+    def get(self, package_path: str, mtime_ns: int) -> Optional[dict]:
+        """Return the cached manifest if it is still current"""
+        entry = self._packages.get(package_path)
+        if entry and entry.get('mtime_ns') == mtime_ns:
+            return entry['manifest']
+        return None
+
+    def put(self, package_path: str, mtime_ns: int, manifest: dict):
+        """Store a freshly parsed manifest"""
+        self._packages[package_path] = {'mtime_ns': mtime_ns, 'manifest': manifest}
+        self._dirty = True
+
+    def discard(self, package_path: str):
+        """Forget a package (e.g. its manifest was removed)"""
+        if self._packages.pop(package_path, None) is not None:
+            self._dirty = True
+
+    def prune(self, seen_paths):
+        """Drop entries for packages that no longer exist"""
+        for package_path in set(self._packages) - set(seen_paths):
+            self.discard(package_path)
+
+    def save(self):
+        """Write the cache back to disk if anything changed"""
+        if not self._dirty:
+            return
+
+        temp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump({'version': self.VERSION, 'packages': self._packages}, cache_file)
+            os.replace(temp_path, self.cache_path)
+            self._dirty = False
+        except OSError:
+            # A read-only home directory only costs us the cache
+            pass
+
+
+class ToolDiscovery:
+    """
+    Enumerate tool packages without importing them.
+
+    Packages that ship a manifest.json are reported with their manifest
+    so they can be registered lazily; other packages are reported with
+    only the module name of their tool.py, to be imported eagerly.
+    """
+
+    def __init__(self, package, cache: Optional[DiscoveryCache] = None):
+        """
+        Args:
+            package: The package to scan (normally the `tools` package)
+            cache: Manifest cache, or None to disable caching
+        """
+        self.package = package
+        self.cache = cache
+
+    def discover(self) -> Iterator[DiscoveredTool]:
+        """Yield every tool package found under the scanned package"""
+        seen_paths = []
+        try:
+            for module_info in pkgutil.iter_modules(self.package.__path__):
+                if not module_info.ispkg:
+                    continue
+
+                package_path = os.path.join(module_info.module_finder.path, module_info.name)
+                module_name = f"{self.package.__name__}.{module_info.name}.tool"
+                seen_paths.append(package_path)
+
+                manifest = self._read_manifest(package_path)
+                if manifest is not None:
+                    module_name = manifest.get('module', module_name)
+                yield DiscoveredTool(module_name, manifest)
+        finally:
+            if self.cache is not None:
+                self.cache.prune(seen_paths)
+                self.cache.save()
+
+    def _read_manifest(self, package_path: str) -> Optional[dict]:
+        """Return the package's manifest, consulting the cache first"""
+        try:
+            mtime_ns = os.stat(os.path.join(package_path, MANIFEST_FILENAME)).st_mtime_ns
+        except OSError:
+            if self.cache is not None:
+                self.cache.discard(package_path)
+            return None
+
+        if self.cache is not None:
+            manifest = self.cache.get(package_path, mtime_ns)
+            if manifest is not None:
+                return manifest
+
+        try:
+            manifest = load_manifest(package_path)
+        except ManifestError as error:
+            print(f"⚠️ Ignoring manifest: {error}")
+            return None
+
+        if self.cache is not None:
+            self.cache.put(package_path, mtime_ns, manifest)
+        return manifest
@@ -0,0 +1,194 @@
+"""
+Shared HTTP Client
+Connection-pooled HTTP for tools' side fetches (thumbnails, small API calls)
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class HttpResponse:
+    """Body and status of a completed request"""
+
+    url: str
+    status_code: int
+    content: bytes = b''
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 300
+
+
+class HttpClient:
+    """
+    Keep-alive HTTP client shared by everything a tool fetches besides the
+    media itself.
+
+    Connections are pooled per host, up to `pool_size` per host, so
+    repeated requests skip the TCP and TLS handshakes. Uses requests
+    (urllib3) by default; with `http2=True` and httpx[http2] installed,
+    requests are multiplexed over HTTP/2 instead. Safe to use from
+    several threads. requests/httpx are imported on first use.
+    """
+
+    DEFAULT_POOL_SIZE = 4
+    DEFAULT_TIMEOUT = 10.0
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, http2: bool = False,
+                 timeout: float = DEFAULT_TIMEOUT, user_agent: Optional[str] = None):
+        """
+        Args:
+            pool_size: Connections kept per host; match it to the number of
+                       threads fetching concurrently
+            http2: Prefer HTTP/2 (needs httpx with the http2 extra; falls
+                   back to HTTP/1.1 keep-alive without it)
+            timeout: Default per-request timeout in seconds
+            user_agent: User-Agent header sent with every request
+        """
+        self.pool_size = max(1, pool_size)
+        self.http2_requested = http2
+        self.timeout = timeout
+        self.user_agent = user_agent
+
+        self.backend = None
+        self.requests = 0
+        self.errors = 0
+        self._retired_connections = 0
+        self._retired_requests = 0
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def http2(self) -> bool:
+        """True if requests go through the HTTP/2-capable backend"""
+        return self.backend == 'httpx'
+
+    def _get_session(self):
+        """Create the underlying session on first use (lock held)"""
+        if self._session is not None:
+            return self._session
+
+        if self.http2_requested:
+            try:
+                import h2  # noqa: F401 - httpx needs it for HTTP/2
+                import httpx
+            except ImportError:
+                pass
+            else:
+                self._session = httpx.Client(
+                    http2=True, follow_redirects=True,
+                    limits=httpx.Limits(max_connections=None,
+                                        max_keepalive_connections=self.pool_size),
+                    headers={'User-Agent': self.user_agent} if self.user_agent else None,
+                )
+                self.backend = 'httpx'
+                return self._session
+
+        import requests
+        self._session = requests.Session()
+        if self.user_agent:
+            self._session.headers['User-Agent'] = self.user_agent
+        self._mount_adapter()
+        self.backend = 'requests'
+        return self._session
+
+    def _mount_adapter(self):
+        """Mount a pooled adapter sized to pool_size (lock held)"""
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=self.pool_size)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def ensure_pool_size(self, pool_size: int):
+        """
+        Grow the per-host pool to at least `pool_size` connections.
+
+        Callers that fetch on N threads call this with N so no thread
+        waits for, or discards, a pooled connection.
+        """
+        with self._lock:
+            if pool_size <= self.pool_size:
+                return
+            self.pool_size = pool_size
+            if self._session is None or self.backend != 'requests':
+                # httpx limits are fixed per client; HTTP/2 multiplexes anyway
+                return
+            connections, requests_sent = self._pool_counts()
+            self._retired_connections += connections
+            self._retired_requests += requests_sent
+            old_adapter = self._session.get_adapter('https://')
+            self._mount_adapter()
+        old_adapter.close()
+
+    def get(self, url: str, timeout: Optional[float] = None,
+            headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        """
+        GET a URL over a pooled connection.
+
+        Returns:
+            HttpResponse: Any completed response, whatever its status
+
+        Raises:
+            IOError: The request could not be completed
+        """
+        with self._lock:
+            session = self._get_session()
+            self.requests += 1
+
+        try:
+            response = session.get(url, timeout=timeout or self.timeout, headers=headers)
+            content = response.content
+        except Exception as error:
+            with self._lock:
+                self.errors += 1
+            raise IOError(f"GET {url} failed: {error}") from error
+
+        return HttpResponse(str(response.url), response.status_code, content, dict(response.headers))
+
+    def _pool_counts(self):
+        """(connections opened, requests sent) by the live urllib3 pools (lock held)"""
+        connections = requests_sent = 0
+        adapter = self._session.get_adapter('https://')
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+                requests_sent += pool.num_requests
+        return connections, requests_sent
+
+    def get_stats(self) -> Dict:
+        """
+        Connection pool statistics.
+
+        `connections_opened` counts new TCP (and TLS) connections;
+        `connections_reused` is how many requests went over one that was
+        already open.
+        """
+        with self._lock:
+            stats = {
+                'backend': self.backend,
+                'http2': self.http2,
+                'pool_size': self.pool_size,
+                'requests': self.requests,
+                'errors': self.errors,
+            }
+            if self.backend == 'requests':
+                connections, requests_sent = self._pool_counts()
+                connections += self._retired_connections
+                requests_sent += self._retired_requests
+                stats['connections_opened'] = connections
+                stats['connections_reused'] = max(requests_sent - connections, 0)
+            return stats
+
+    def close(self):
+        """Close pooled connections; the client reconnects if used again"""
+        with self._lock:
+            session, self._session = self._session, None
+            self.backend = None
+        if session is not None:
+            session.close()
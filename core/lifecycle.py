@@ -0,0 +1,181 @@
+"""
+OmniTool - Tool Lifecycle Manager
+Track tool instances and release their windows when they are no longer used
+"""
+
+import time
+from typing import Dict, List, Optional, Type
+
+from PyQt6.QtCore import QEvent, QObject, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QMainWindow
+
+from core.base_tool import BaseTool
+
+
+class ToolSession:
+    """A live tool instance and the state of its window"""
+
+    __slots__ = ('tool_id', 'tool', 'hidden_since', 'prewarmed')
+
+    def __init__(self, tool_id: str, tool: BaseTool):
+        self.tool_id = tool_id
+        self.tool = tool
+        self.hidden_since: Optional[float] = None
+        # Window built ahead of time and not shown yet
+        self.prewarmed = False
+
+    @property
+    def window(self) -> Optional[QMainWindow]:
+        return self.tool.window
+
+
+class ToolLifecycleManager(QObject):
+    """
+    Owns every in-process tool instance launched through AppManager.
+
+    - Single-instance tools (BaseTool.single_instance) reuse their live
+      window: launching again just shows and raises it
+    - Closing a window parks it hidden if the tool is single-instance or
+      still busy; otherwise BaseTool.cleanup() runs right away
+    - Parked windows hidden for longer than `idle_timeout` seconds are
+      cleaned up by a periodic eviction pass
+    - prewarm() builds a hidden window ahead of time; the next launch of
+      that tool only has to show it
+    """
+
+    # How often parked windows are checked for eviction (seconds)
+    EVICTION_INTERVAL = 30.0
+
+    # A prewarmed window stopped being prewarmed: tool id, and True if it
+    # was handed to a launch (False if it was released unused)
+    prewarmed_consumed = pyqtSignal(str, bool)
+
+    def __init__(self, idle_timeout: float = 600.0, parent=None):
+        """
+        Args:
+            idle_timeout: Seconds a closed single-instance window is kept
+                          for fast reopening before it is released
+        """
+        super().__init__(parent)
+        self.idle_timeout = idle_timeout
+        self._sessions: Dict[int, ToolSession] = {}
+
+        self._eviction_timer = QTimer(self)
+        self._eviction_timer.setInterval(int(min(self.EVICTION_INTERVAL, idle_timeout) * 1000))
+        self._eviction_timer.timeout.connect(self.evict_idle)
+
+    def launch(self, tool_id: str, tool_class: Type[BaseTool]) -> QMainWindow:
+        """
+        Show a tool's window, reusing a live one for single-instance tools.
+
+        Args:
+            tool_id: The unique identifier of the tool
+            tool_class: The tool's BaseTool subclass
+
+        Returns:
+            QMainWindow: The tool's window instance
+        """
+        session = self._find_reusable(tool_id, tool_class)
+        if session is None:
+            session = ToolSession(tool_id, tool_class())
+
+        window = session.tool.launch()
+        window.raise_()
+        window.activateWindow()
+        session.hidden_since = None
+        was_prewarmed, session.prewarmed = session.prewarmed, False
+        self._track(session)
+        if was_prewarmed:
+            self.prewarmed_consumed.emit(tool_id, True)
+        return window
+
+    def prewarm(self, tool_id: str, tool_class: Type[BaseTool]) -> bool:
+        """
+        Build a tool's window without showing it.
+
+        Returns:
+            bool: False if the tool already has a window that can be reused
+        """
+        if self._find_reusable(tool_id, tool_class) is not None:
+            return False
+
+        session = ToolSession(tool_id, tool_class())
+        session.tool.window = session.tool.create_window()
+        session.prewarmed = True
+        self._track(session)
+        return True
+
+    def _track(self, session: ToolSession):
+        window = session.window
+        if id(window) not in self._sessions:
+            window.installEventFilter(self)
+            self._sessions[id(window)] = session
+
+    def _find_reusable(self, tool_id: str, tool_class: Type[BaseTool]) -> Optional[ToolSession]:
+        for session in self._sessions.values():
+            if session.tool_id != tool_id:
+                continue
+            if session.prewarmed or tool_class.single_instance:
+                return session
+        return None
+
+    def sessions(self, tool_id: Optional[str] = None) -> List[ToolSession]:
+        """Get tracked sessions, optionally for a single tool"""
+        return [
+            session for session in self._sessions.values()
+            if tool_id is None or session.tool_id == tool_id
+        ]
+
+    def eventFilter(self, watched, event):
+        """Notice tool windows being closed"""
+        if event.type() == QEvent.Type.Close:
+            # The window may still refuse the close; decide once it settled
+            QTimer.singleShot(0, lambda window=watched: self._on_window_closed(window))
+        return False
+
+    def _on_window_closed(self, window: QMainWindow):
+        session = self._sessions.get(id(window))
+        if session is None or window.isVisible():
+            return
+
+        if session.tool.single_instance or session.tool.is_busy():
+            session.hidden_since = time.monotonic()
+            if not self._eviction_timer.isActive():
+                self._eviction_timer.start()
+        else:
+            self.release(session)
+
+    def evict_idle(self):
+        """Release parked windows that have been hidden longer than idle_timeout"""
+        now = time.monotonic()
+        parked = [session for session in self._sessions.values() if session.hidden_since is not None]
+
+        for session in parked:
+            if now - session.hidden_since >= self.idle_timeout and not session.tool.is_busy():
+                self.release(session)
+
+        if not any(session.hidden_since is not None for session in self._sessions.values()):
+            self._eviction_timer.stop()
+
+    def release(self, session: ToolSession):
+        """Stop tracking a session and clean up its tool"""
+        window = session.window
+        if window is not None:
+            self._sessions.pop(id(window), None)
+            window.removeEventFilter(self)
+        session.tool.cleanup()
+        if session.prewarmed:
+            session.prewarmed = False
+            self.prewarmed_consumed.emit(session.tool_id, False)
+
+    def release_prewarmed(self):
+        """Release windows that were prewarmed but never shown"""
+        for session in list(self._sessions.values()):
+            if session.prewarmed:
+                self.release(session)
+
+    def release_hidden(self):
+        """Release every parked or prewarmed window that is not busy"""
+        for session in list(self._sessions.values()):
+            if session.prewarmed or (session.hidden_since is not None and not session.tool.is_busy()):
+                self.release(session)
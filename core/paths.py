@@ -0,0 +1,21 @@
+"""
+OmniTool - Application Paths
+Locations for caches and persistent state
+"""
+
+import os
+from pathlib import Path
+
+
+def get_data_directory() -> Path:
+    """
+    Return the directory used for OmniTool caches and state.
+
+    Defaults to ~/.omnitool and can be overridden with the
+    OMNITOOL_HOME environment variable. The directory is created
+    if it does not exist.
+    """
+    override = os.environ.get('OMNITOOL_HOME')
+    data_directory = Path(override) if override else Path.home() / ".omnitool"
+    data_directory.mkdir(parents=True, exist_ok=True)
+    return data_directory
@@ -0,0 +1,174 @@
+"""
+OmniTool - Idle-Time Tool Prewarming
+Import and build the most used tools while the launcher is idle
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+from core.tool_registry import ToolRegistry
+
+
+def get_resident_memory() -> Optional[int]:
+    """Resident set size of this process in bytes, or None if unknown"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def get_available_memory() -> Optional[int]:
+    """Memory available to new allocations system-wide in bytes, or None if unknown"""
+    try:
+        with open('/proc/meminfo') as meminfo:
+            for line in meminfo:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class ToolPrewarmer(QObject):
+    """
+    Prewarm the most launched tools in idle event-loop time.
+
+    Each tool takes two idle steps, so input is handled in between:
+    1. Import its module (ToolRegistry.get_tool_class)
+    2. Build its window hidden (ToolLifecycleManager.prewarm)
+
+    Memory growth from prewarming is capped at `memory_budget_mb`; a tool
+    that pushes it over is released again. Prewarmed windows are dropped
+    when available system memory falls below `low_memory_mb`. A window
+    that is shown or released leaves `prewarmed` and gives its memory
+    back to the budget.
+    """
+
+    # Wait before the first step so startup work finishes first (ms)
+    START_DELAY_MS = 2000
+
+    # How often available memory is checked (ms)
+    PRESSURE_CHECK_MS = 30000
+
+    def __init__(self, app_manager, max_tools: int = 2, memory_budget_mb: int = 150,
+                 low_memory_mb: int = 256, parent=None):
+        """
+        Args:
+            app_manager: AppManager whose usage stats and lifecycle manager are used
+            max_tools: Most tools kept prewarmed (fallback budget when memory
+                       usage cannot be measured)
+            memory_budget_mb: Most resident memory prewarming may add
+            low_memory_mb: Drop prewarmed windows below this much available memory
+        """
+        super().__init__(parent)
+        self.app_manager = app_manager
+        self.max_tools = max_tools
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.low_memory = low_memory_mb * 1024 * 1024
+
+        self.memory_used = 0
+        self.prewarmed: List[str] = []
+        self._costs: Dict[str, int] = {}
+        self._pending: List[str] = []
+        self._imported = False
+
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.timeout.connect(self._step)
+
+        self._pressure_timer = QTimer(self)
+        self._pressure_timer.setInterval(self.PRESSURE_CHECK_MS)
+        self._pressure_timer.timeout.connect(self.check_memory_pressure)
+
+        app_manager.get_lifecycle_manager().prewarmed_consumed.connect(self._on_prewarmed_consumed)
+
+    def start(self):
+        """Queue the most used tools and begin prewarming once idle"""
+        candidates = self.app_manager.get_usage_stats().most_used(self.max_tools)
+        self._pending = [tool_id for tool_id in candidates if tool_id not in self.prewarmed]
+        if self._pending:
+            self._idle_timer.start(self.START_DELAY_MS)
+            self._pressure_timer.start()
+
+    def stop(self):
+        """Stop prewarming and release windows that were never shown"""
+        self._idle_timer.stop()
+        self._pressure_timer.stop()
+        self._pending = []
+        self.release()
+
+    def _step(self):
+        """Do one unit of prewarming work, then yield to the event loop"""
+        if not self._pending or self._over_budget() or self._memory_is_low():
+            self._pending = []
+            return
+
+        tool_id = self._pending[0]
+        tool_class = ToolRegistry.get_tool_class(tool_id)
+
+        if tool_class is None or self.app_manager.is_isolated(tool_class):
+            # Unknown tools and worker-process tools have nothing to prewarm here
+            self._pending.pop(0)
+        elif not self._imported:
+            # get_tool_class() just imported the module; build the window next tick
+            self._imported = True
+        else:
+            self._pending.pop(0)
+            self._imported = False
+            self._prewarm_window(tool_id, tool_class)
+
+        if self._pending:
+            self._idle_timer.start(0)
+
+    def _prewarm_window(self, tool_id: str, tool_class):
+        lifecycle = self.app_manager.get_lifecycle_manager()
+        before = get_resident_memory()
+
+        if not lifecycle.prewarm(tool_id, tool_class):
+            return
+
+        after = get_resident_memory()
+        if before is not None and after is not None:
+            cost = max(after - before, 0)
+            if self.memory_used + cost > self.memory_budget:
+                self._release_tool(tool_id)
+                self._pending = []
+                return
+            self.memory_used += cost
+            self._costs[tool_id] = cost
+
+        self.prewarmed.append(tool_id)
+
+    def _on_prewarmed_consumed(self, tool_id: str, launched: bool):
+        """A prewarmed window was shown or released: it no longer counts"""
+        if tool_id in self.prewarmed:
+            self.prewarmed.remove(tool_id)
+            self.memory_used = max(self.memory_used - self._costs.pop(tool_id, 0), 0)
+
+    def _over_budget(self) -> bool:
+        return len(self.prewarmed) >= self.max_tools or self.memory_used >= self.memory_budget
+
+    def _memory_is_low(self) -> bool:
+        available = get_available_memory()
+        return available is not None and available < self.low_memory
+
+    def check_memory_pressure(self):
+        """Drop prewarmed windows if the system is running low on memory"""
+        if self._memory_is_low():
+            self.stop()
+
+    def _release_tool(self, tool_id: str):
+        lifecycle = self.app_manager.get_lifecycle_manager()
+        for session in lifecycle.sessions(tool_id):
+            if session.prewarmed:
+                lifecycle.release(session)
+
+    def release(self):
+        """Release prewarmed windows that are still unused"""
+        self.app_manager.get_lifecycle_manager().release_prewarmed()
+        self.prewarmed = []
+        self._costs = {}
+        self.memory_used = 0
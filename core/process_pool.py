@@ -0,0 +1,142 @@
+"""
+OmniTool - Tool Process Pool
+Run tools in separate worker processes with a small warm pool
+"""
+
+import os
+import subprocess
+import sys
+import threading
+from typing import List, Optional
+
+
+# Directory containing the `core` and `tools` packages
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ToolProcess:
+    """Handle to a tool running in its own worker process"""
+
+    def __init__(self, tool_id: str, process: subprocess.Popen):
+        self.tool_id = tool_id
+        self.process = process
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def returncode(self) -> Optional[int]:
+        """Exit code, or None while the tool is still running"""
+        return self.process.poll()
+
+    def is_running(self) -> bool:
+        """Check whether the tool process is still alive"""
+        return self.process.poll() is None
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        """Wait for the tool to exit and return its exit code"""
+        return self.process.wait(timeout)
+
+    def terminate(self):
+        """Ask the tool process to exit"""
+        if self.is_running():
+            self.process.terminate()
+
+
+class ToolProcessPool:
+    """
+    Object Pool Pattern: pre-spawned tool host interpreters.
+
+    Each host (core/tool_host.py) imports Qt, creates its QApplication and
+    runs discovery, then waits for a tool ID on stdin. Launching a tool
+    hands it to a warm host and spawns a replacement in the background,
+    so the next launch does not pay interpreter and Qt start-up either.
+
+    Tools in worker processes have their own event loop and GIL: a busy
+    or crashed tool cannot stall or take down the launcher.
+    """
+
+    def __init__(self, size: int = 1):
+        """
+        Args:
+            size: Number of idle hosts to keep ready
+        """
+        self.size = size
+        self._idle: List[subprocess.Popen] = []
+        self._lock = threading.Lock()
+        self._warm_lock = threading.Lock()
+
+    def _spawn(self) -> subprocess.Popen:
+        """Start a new tool host process"""
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            path for path in (PROJECT_ROOT, env.get('PYTHONPATH')) if path
+        )
+        return subprocess.Popen(
+            [sys.executable, '-m', 'core.tool_host'],
+            stdin=subprocess.PIPE,
+            cwd=PROJECT_ROOT,
+            env=env,
+            text=True,
+        )
+
+    def warm_up(self):
+        """Spawn hosts until `size` idle ones are ready"""
+        with self._warm_lock:
+            with self._lock:
+                self._idle = [process for process in self._idle if process.poll() is None]
+                missing = self.size - len(self._idle)
+            for _ in range(missing):
+                process = self._spawn()
+                with self._lock:
+                    self._idle.append(process)
+
+    def launch(self, tool_id: str) -> ToolProcess:
+        """
+        Run a tool in a worker process.
+
+        Args:
+            tool_id: The unique identifier of the tool
+
+        Returns:
+            ToolProcess: Handle to the running tool
+        """
+        process = self._take_idle() or self._spawn()
+        try:
+            self._assign(process, tool_id)
+        except OSError:
+            # The warm host died after we picked it; use a fresh one
+            process = self._spawn()
+            self._assign(process, tool_id)
+
+        # Refill off the caller's thread; spawning takes a few milliseconds
+        threading.Thread(target=self.warm_up, daemon=True).start()
+        return ToolProcess(tool_id, process)
+
+    @staticmethod
+    def _assign(process: subprocess.Popen, tool_id: str):
+        """Send the tool ID to a waiting host"""
+        process.stdin.write(f"{tool_id}\n")
+        process.stdin.flush()
+        process.stdin.close()
+
+    def _take_idle(self) -> Optional[subprocess.Popen]:
+        """Pop a live idle host, discarding any that died"""
+        with self._lock:
+            while self._idle:
+                process = self._idle.pop(0)
+                if process.poll() is None:
+                    return process
+        return None
+
+    def shutdown(self):
+        """Stop idle hosts; tools already running keep running"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for process in idle:
+            # Closing stdin makes the host exit without running a tool
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
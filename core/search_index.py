@@ -0,0 +1,237 @@
+"""
+OmniTool - Tool Search Index
+Inverted index with prefix and trigram postings for ranked, typo-tolerant search
+"""
+
+import re
+from typing import Dict, Iterable, List, Set
+
+from core.tool_metadata import ToolMetadata
+
+
+# How much a match in each field counts towards a tool's score
+FIELD_WEIGHTS = {
+    'name': 3.0,
+    'keywords': 2.0,
+    'category': 1.5,
+    'description': 1.0,
+}
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(token: str) -> Set[str]:
+    """Return the padded trigrams of a token (e.g. '  y', ' yo', 'you', ...)"""
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ToolSearchIndex:
+    """
+    Search index over tool metadata, built incrementally at registration.
+
+    - Token postings map each token to the tools containing it, with the
+      weight of the best field it appears in
+    - Prefix postings map every token prefix to the tokens that start with
+      it, for search-as-you-type
+    - Trigram postings map padded trigrams to tokens, so substrings and
+      misspellings ('tube', 'youtbe') still find 'youtube'; they are only
+      consulted for a query token with no exact or prefix match
+
+    Every query token must match a tool for it to be returned; results are
+    ranked by the sum of field weight times match quality. Per-token scores
+    are memoized until the index changes, since search-as-you-type keeps
+    re-running the leading words of a query. They are kept in registration
+    order (the order of each token's postings), so ranking is one stable
+    sort by score.
+    """
+
+    # Match quality by kind of token match
+    EXACT_MATCH = 1.0
+    PREFIX_MATCH = 0.75
+    TRIGRAM_MATCH = 0.6
+
+    # Share of a query token's trigrams a token must contain to match
+    MIN_TRIGRAM_SIMILARITY = 0.5
+
+    # Number of memoized query tokens kept between index changes
+    TOKEN_CACHE_SIZE = 256
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._prefixes: Dict[str, Set[str]] = {}
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._documents: Dict[str, Dict[str, float]] = {}
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        self._token_cache: Dict[str, Dict[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, metadata: ToolMetadata):
+        """Index (or re-index) a tool"""
+        if metadata.id in self._documents:
+            self.remove(metadata.id)
+
+        fields = {
+            'name': [metadata.name],
+            'keywords': metadata.keywords,
+            'category': [metadata.category],
+            'description': [metadata.description],
+        }
+
+        document: Dict[str, float] = {}
+        for field, values in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            for token in self._tokenize_all(values):
+                if weight > document.get(token, 0.0):
+                    document[token] = weight
+
+        for token, weight in document.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                self._add_token(token)
+            postings[metadata.id] = weight
+
+        self._documents[metadata.id] = document
+        self._order[metadata.id] = self._next_order
+        self._next_order += 1
+        self._token_cache.clear()
+
+    def remove(self, tool_id: str):
+        """Drop a tool from the index"""
+        document = self._documents.pop(tool_id, None)
+        if document is None:
+            return
+
+        del self._order[tool_id]
+        self._token_cache.clear()
+        for token in document:
+            postings = self._postings[token]
+            del postings[tool_id]
+            if not postings:
+                del self._postings[token]
+                self._remove_token(token)
+
+    def clear_cache(self):
+        """Drop memoized per-token scores"""
+        self._token_cache.clear()
+
+    def search(self, query: str) -> List[str]:
+        """
+        Return the IDs of matching tools, best match first.
+
+        Args:
+            query: Free text; each word must match (exactly, as a prefix,
+                   as a substring or approximately) some field of a tool
+        """
+        scores: Dict[str, float] = {}
+
+        for position, query_token in enumerate(dict.fromkeys(tokenize(query))):
+            token_scores = self._score_query_token(query_token)
+            if position == 0:
+                scores = token_scores
+            else:
+                scores = {
+                    tool_id: score + token_scores[tool_id]
+                    for tool_id, score in scores.items()
+                    if tool_id in token_scores
+                }
+            if not scores:
+                return []
+
+        # Scores are in registration order, which the stable sort keeps for ties
+        return sorted(scores, key=scores.__getitem__, reverse=True)
+
+    def _score_query_token(self, query_token: str) -> Dict[str, float]:
+        """Score every tool against one query token"""
+        token_scores = self._token_cache.get(query_token)
+        if token_scores is None:
+            if len(self._token_cache) >= self.TOKEN_CACHE_SIZE:
+                self._token_cache.clear()
+            token_scores = self._token_cache[query_token] = self._compute_token_scores(query_token)
+        return token_scores
+
+    def _compute_token_scores(self, query_token: str) -> Dict[str, float]:
+        """Score every tool against one query token, in registration order, without the cache"""
+        matches = self._match_tokens(query_token)
+        if len(matches) == 1:
+            # Postings are already in registration order: a tool re-indexed
+            # by add() is both re-inserted last and given the next order
+            [(token, quality)] = matches.items()
+            return {tool_id: weight * quality for tool_id, weight in self._postings[token].items()}
+
+        token_scores: Dict[str, float] = {}
+        for token, quality in matches.items():
+            for tool_id, weight in self._postings[token].items():
+                score = weight * quality
+                if score > token_scores.get(tool_id, 0.0):
+                    token_scores[tool_id] = score
+        ordered = sorted(token_scores, key=self._order.__getitem__)
+        return {tool_id: token_scores[tool_id] for tool_id in ordered}
+
+    def _match_tokens(self, query_token: str) -> Dict[str, float]:
+        """Map indexed tokens that match a query token to a match quality"""
+        matches: Dict[str, float] = {}
+
+        for token in self._prefixes.get(query_token, ()):
+            if token == query_token:
+                matches[token] = self.EXACT_MATCH
+            else:
+                # Prefer completions that are close to the typed length
+                matches[token] = self.PREFIX_MATCH + (
+                    (self.EXACT_MATCH - self.PREFIX_MATCH) * len(query_token) / len(token)
+                )
+
+        # Substrings and misspellings only for words nothing starts with
+        if matches or len(query_token) < 3:
+            return matches
+
+        query_trigrams = trigrams(query_token)
+        shared_counts: Dict[str, int] = {}
+        for gram in query_trigrams:
+            for token in self._trigrams.get(gram, ()):
+                shared_counts[token] = shared_counts.get(token, 0) + 1
+
+        for token, shared in shared_counts.items():
+            similarity = shared / len(query_trigrams)
+            if similarity >= self.MIN_TRIGRAM_SIMILARITY:
+                matches[token] = self.TRIGRAM_MATCH * similarity
+
+        return matches
+
+    def _add_token(self, token: str):
+        """Add a new vocabulary token to the prefix and trigram postings"""
+        for length in range(1, len(token) + 1):
+            self._prefixes.setdefault(token[:length], set()).add(token)
+        for gram in trigrams(token):
+            self._trigrams.setdefault(gram, set()).add(token)
+
+    def _remove_token(self, token: str):
+        """Remove a vocabulary token that no tool uses any more"""
+        for length in range(1, len(token) + 1):
+            self._discard(self._prefixes, token[:length], token)
+        for gram in trigrams(token):
+            self._discard(self._trigrams, gram, token)
+
+    @staticmethod
+    def _discard(postings: Dict[str, Set[str]], key: str, token: str):
+        tokens = postings.get(key)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del postings[key]
+
+    @staticmethod
+    def _tokenize_all(values: Iterable[str]) -> List[str]:
+        tokens = []
+        for value in values:
+            tokens.extend(tokenize(value))
+        return tokens
@@ -0,0 +1,138 @@
+"""
+OmniTool - Single Instance
+Forward launch requests to an already running OmniTool over a local socket
+"""
+
+import getpass
+import json
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+
+
+def get_server_name() -> str:
+    """Local socket name, unique per user"""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "default"
+    return f"omnitool-{user}"
+
+
+# Reply status when an instance accepted the request but did not answer in time
+NO_REPLY = "no_reply"
+
+
+def send_to_running_instance(message: dict, timeout_ms: int = 1000) -> Optional[dict]:
+    """
+    Send a request to a running OmniTool instance.
+
+    Works without a QApplication, so callers can try this before paying
+    for Qt GUI start-up.
+
+    Args:
+        message: Request, e.g. {'action': 'launch', 'tool': 'youtube_downloader'}
+        timeout_ms: How long to wait for the connection and the reply
+
+    Returns:
+        dict: The instance's reply; {'status': NO_REPLY, ...} if an
+        instance took the request but did not answer in time (it is
+        busy, not gone); None only if no instance is running
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(get_server_name())
+    if not socket.waitForConnected(timeout_ms):
+        return None
+
+    socket.write((json.dumps(message) + "\n").encode('utf-8'))
+    socket.waitForBytesWritten(timeout_ms)
+
+    reply = b""
+    while not reply.endswith(b"\n") and socket.waitForReadyRead(timeout_ms):
+        reply += bytes(socket.readAll())
+    socket.disconnectFromServer()
+
+    try:
+        return json.loads(reply.decode('utf-8'))
+    except ValueError:
+        return {'status': NO_REPLY, 'message': 'Sent to running OmniTool, which has not answered yet'}
+
+
+def is_instance_running(timeout_ms: int = 200) -> bool:
+    """Check whether an instance is accepting connections"""
+    socket = QLocalSocket()
+    socket.connectToServer(get_server_name())
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.disconnectFromServer()
+    return True
+
+
+class SingleInstanceServer(QObject):
+    """
+    Accepts requests from later `main.py` invocations.
+
+    Each request is one JSON line; the handler's return value is sent
+    back as one JSON line. Handlers must answer at once and defer slow
+    work (e.g. with QTimer.singleShot(0, ...)), or the sender gives up
+    waiting for the reply.
+    """
+
+    def __init__(self, handler: Callable[[dict], dict], parent=None):
+        """
+        Args:
+            handler: Called on the GUI thread with each request dict;
+                     returns the reply, e.g. {'status': 'success'}
+        """
+        super().__init__(parent)
+        self.handler = handler
+        self.server = QLocalServer(self)
+        # Only this user may send launch/show requests (whatever the umask)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self._on_new_connection)
+
+    def listen(self) -> bool:
+        """
+        Start listening. A leftover socket from a crashed instance is
+        removed first, but never the socket of a live instance.
+
+        Returns:
+            bool: False if another instance is listening (or the socket
+            could not be created)
+        """
+        # With socket options set, Qt binds elsewhere and renames the socket
+        # into place, which would replace a live instance's socket
+        if is_instance_running():
+            return False
+        name = get_server_name()
+        if self.server.listen(name):
+            return True
+        QLocalServer.removeServer(name)
+        return self.server.listen(name)
+
+    def close(self):
+        """Stop accepting requests"""
+        self.server.close()
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.setProperty('buffer', b"")
+            socket.readyRead.connect(lambda socket=socket: self._on_ready_read(socket))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def _on_ready_read(self, socket: QLocalSocket):
+        data = socket.property('buffer') + bytes(socket.readAll())
+        if not data.endswith(b"\n"):
+            socket.setProperty('buffer', data)
+            return
+        socket.setProperty('buffer', b"")
+
+        try:
+            reply = self.handler(json.loads(data.decode('utf-8')))
+        except Exception as error:
+            reply = {'status': 'error', 'message': str(error)}
+
+        socket.write((json.dumps(reply) + "\n").encode('utf-8'))
+        socket.flush()
@@ -0,0 +1,43 @@
+"""
+OmniTool - Tool Host Process
+Worker interpreter that runs a single tool for ToolProcessPool
+
+Usage (started by the pool, not by hand):
+    python -m core.tool_host
+
+Qt, the QApplication and tool discovery are set up before a tool is
+assigned, then the host blocks until the launcher writes a tool ID to
+stdin. EOF without an ID means the pool no longer needs this host.
+"""
+
+import contextlib
+import io
+import sys
+
+
+def main() -> int:
+    """Prepare Qt, wait for a tool ID, then run that tool's window"""
+    from PyQt6.QtWidgets import QApplication
+    from core import AppManager
+
+    app = QApplication(sys.argv)
+    app.setStyle('Fusion')
+
+    # The launcher already printed the registrations
+    with contextlib.redirect_stdout(io.StringIO()):
+        app_manager = AppManager(isolate_tools=False, record_usage=False)
+
+    tool_id = sys.stdin.readline().strip()
+    if not tool_id:
+        return 0
+
+    window = app_manager.launch_tool(tool_id)
+    if window is None:
+        print(f"❌ Unknown tool: {tool_id}", file=sys.stderr)
+        return 2
+
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""
+OmniTool - Tool Metadata
+Immutable metadata records captured once per tool registration
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class ToolMetadata:
+    """
+    Compact, immutable snapshot of a tool's metadata.
+
+    Records are shared between every query, so they must never be
+    mutated. Dict-style access (metadata['name']) is supported for
+    code written against the original metadata dicts.
+    """
+
+    __slots__ = ('id', 'name', 'description', 'category', 'icon', 'keywords', 'version', 'author')
+
+    id: str
+    name: str
+    description: str
+    category: str
+    icon: str
+    keywords: Tuple[str, ...]
+    version: str
+    author: str
+
+    @classmethod
+    def from_dict(cls, metadata: dict) -> 'ToolMetadata':
+        """Build a record from a get_metadata() or manifest dict"""
+        return cls(
+            id=metadata['id'],
+            name=metadata['name'],
+            description=metadata.get('description', ''),
+            category=metadata.get('category', 'Other'),
+            icon=metadata.get('icon', ''),
+            keywords=tuple(metadata.get('keywords', ())),
+            version=metadata.get('version', ''),
+            author=metadata.get('author', ''),
+        )
+
+    def to_dict(self) -> dict:
+        """Return a fresh, mutable metadata dict"""
+        metadata = {field: getattr(self, field) for field in self.__slots__}
+        metadata['keywords'] = list(self.keywords)
+        return metadata
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default=None):
+        """Dict-style get"""
+        return getattr(self, key, default) if key in self.__slots__ else default
@@ -3,8 +3,12 @@ OmniTool - Tool Registry
 Centralized tool registration using the Registry Pattern
 """
 
-from typing import Dict, List, Type
+import importlib
+import threading
+from typing import Callable, Dict, List, Optional, Set, Type
 from core.base_tool import BaseTool
+from core.search_index import ToolSearchIndex
+from core.tool_metadata import ToolMetadata
 
 
 class ToolRegistry:
@@ -13,10 +17,28 @@ class ToolRegistry:
     
     This class maintains a registry of all available tools and provides
     methods to query and access them.
+
+    Tools can be registered in two ways:
+    - Eagerly, by importing a module that applies @ToolRegistry.register
+    - Lazily, from a static manifest; the tool's module is imported the
+      first time its class is requested
+
+    Metadata is captured once per registration into ToolMetadata records
+    and a search index, so queries never instantiate tools.
+
+    Registration may happen on a background discovery thread, so state is
+    guarded by a lock and listeners are told about each new tool.
     """
     
     _instance = None
     _tools: Dict[str, Type[BaseTool]] = {}
+    _lazy_modules: Dict[str, str] = {}
+    _lazy_isolated: Set[str] = set()  # Lazy tools whose manifest sets "isolated"
+    _metadata: Dict[str, ToolMetadata] = {}
+    _by_category: Dict[str, Dict[str, ToolMetadata]] = {}
+    _search_index = ToolSearchIndex()
+    _listeners: List[Callable[[ToolMetadata], None]] = []
+    _lock = threading.RLock()
     
     def __new__(cls):
         """Singleton Pattern: Ensure only one registry instance exists"""
@@ -37,34 +59,171 @@ class ToolRegistry:
             class MyTool(BaseTool):
                 ...
         """
-        # Create temporary instance to get metadata
-        temp_instance = tool_class()
-        metadata = temp_instance.get_metadata()
-        tool_id = metadata['id']
+        with cls._lock:
+            metadata = cls._manifest_metadata_for(tool_class)
+        if metadata is None:
+            # No manifest: one instance to read the metadata, then discard it
+            metadata = ToolMetadata.from_dict(tool_class().get_metadata())
+        tool_id = metadata.id
         
-        cls._tools[tool_id] = tool_class
-        print(f"✓ Registered tool: {metadata['name']} (ID: {tool_id})")
+        with cls._lock:
+            cls._tools[tool_id] = tool_class
+            is_new = cls._lazy_modules.pop(tool_id, None) is None
+            cls._lazy_isolated.discard(tool_id)
+            if is_new:
+                cls._store_metadata(metadata)
+
+        if is_new:
+            print(f"✓ Registered tool: {metadata.name} (ID: {tool_id})")
+            cls._notify_listeners(metadata)
         
         return tool_class
+
+    @classmethod
+    def register_manifest(cls, manifest: dict, module_name: str):
+        """
+        Register a tool from its manifest without importing it.
+
+        Args:
+            manifest: Tool metadata as read from the package's manifest.json
+            module_name: Module whose import registers the tool class
+        """
+        tool_id = manifest['id']
+        metadata = ToolMetadata.from_dict(manifest)
+
+        with cls._lock:
+            if tool_id in cls._tools:
+                return
+            cls._lazy_modules[tool_id] = module_name
+            if manifest.get('isolated'):
+                cls._lazy_isolated.add(tool_id)
+            cls._store_metadata(metadata)
+
+        print(f"✓ Registered tool: {metadata.name} (ID: {tool_id})")
+        cls._notify_listeners(metadata)
+
+    @classmethod
+    def add_listener(cls, listener: Callable[[ToolMetadata], None]):
+        """
+        Call `listener(metadata)` whenever a new tool is registered.
+
+        Listeners run on the registering thread.
+        """
+        with cls._lock:
+            cls._listeners.append(listener)
+
+    @classmethod
+    def remove_listener(cls, listener: Callable[[ToolMetadata], None]):
+        """Stop notifying a listener"""
+        with cls._lock:
+            if listener in cls._listeners:
+                cls._listeners.remove(listener)
+
+    @classmethod
+    def _notify_listeners(cls, metadata: ToolMetadata):
+        with cls._lock:
+            listeners = list(cls._listeners)
+        for listener in listeners:
+            listener(metadata)
+
+    @classmethod
+    def _manifest_metadata_for(cls, tool_class: Type[BaseTool]) -> Optional[ToolMetadata]:
+        """Return the manifest record of a lazily registered class, if any"""
+        matches = [
+            tool_id for tool_id, module_name in cls._lazy_modules.items()
+            if module_name == tool_class.__module__
+        ]
+        if len(matches) == 1:
+            return cls._metadata[matches[0]]
+        return None
+
+    @classmethod
+    def _store_metadata(cls, metadata: ToolMetadata):
+        """Insert or replace a metadata record and its index entries"""
+        previous = cls._metadata.get(metadata.id)
+        if previous is not None:
+            category_tools = cls._by_category[previous.category]
+            del category_tools[previous.id]
+            if not category_tools:
+                del cls._by_category[previous.category]
+
+        cls._metadata[metadata.id] = metadata
+        cls._by_category.setdefault(metadata.category, {})[metadata.id] = metadata
+        cls._search_index.add(metadata)
+
+    @classmethod
+    def _load_lazy_tool(cls, tool_id: str):
+        """Import the module of a manifest-registered tool"""
+        with cls._lock:
+            module_name = cls._lazy_modules[tool_id]
+        importlib.import_module(module_name)
+
+        with cls._lock:
+            is_loaded = tool_id in cls._tools
+        if not is_loaded:
+            raise ImportError(
+                f"Module '{module_name}' did not register a tool with ID '{tool_id}'"
+            )
         
     @classmethod
     def get_tool_class(cls, tool_id: str) -> Type[BaseTool]:
-        """Get a tool class by ID"""
+        """Get a tool class by ID, importing it first if it is lazy"""
+        with cls._lock:
+            is_lazy = tool_id not in cls._tools and tool_id in cls._lazy_modules
+        if is_lazy:
+            cls._load_lazy_tool(tool_id)
         return cls._tools.get(tool_id)
         
     @classmethod
     def get_all_tools(cls) -> Dict[str, Type[BaseTool]]:
-        """Get all registered tools"""
-        return cls._tools.copy()
+        """Get all registered tools whose classes have been imported"""
+        with cls._lock:
+            return cls._tools.copy()
+
+    @classmethod
+    def has_isolated_tools(cls) -> bool:
+        """
+        Check whether any tool sets BaseTool.isolated, without importing
+        lazy tools (their manifest's "isolated" key stands in for the class)
+        """
+        with cls._lock:
+            return bool(cls._lazy_isolated) or any(
+                tool_class.isolated for tool_class in cls._tools.values()
+            )
+
+    @classmethod
+    def is_registered(cls, tool_id: str) -> bool:
+        """Check whether a tool is known, imported or not"""
+        return tool_id in cls._metadata
+
+    @classmethod
+    def get_tool_metadata(cls, tool_id: str) -> Optional[ToolMetadata]:
+        """Get the metadata record of one tool"""
+        return cls._metadata.get(tool_id)
         
     @classmethod
-    def get_tool_metadata_list(cls) -> List[dict]:
-        """Get metadata for all registered tools"""
-        metadata_list = []
-        for tool_class in cls._tools.values():
-            instance = tool_class()
-            metadata_list.append(instance.get_metadata())
-        return metadata_list
+    def get_tool_metadata_list(cls) -> List[ToolMetadata]:
+        """Get metadata for all registered tools, in registration order"""
+        with cls._lock:
+            return list(cls._metadata.values())
+
+    @classmethod
+    def get_tools_in_category(cls, category: str) -> List[ToolMetadata]:
+        """Get metadata for the tools of one category"""
+        with cls._lock:
+            return list(cls._by_category.get(category, {}).values())
+
+    @classmethod
+    def search(cls, query: str) -> List[ToolMetadata]:
+        """Get metadata for the tools matching a query, best match first"""
+        with cls._lock:
+            return [cls._metadata[tool_id] for tool_id in cls._search_index.search(query)]
+
+    @classmethod
+    def get_category_counts(cls) -> Dict[str, int]:
+        """Get the number of registered tools per category"""
+        with cls._lock:
+            return {category: len(tools) for category, tools in cls._by_category.items()}
         
     @classmethod
     def create_tool_instance(cls, tool_id: str) -> BaseTool:
@@ -73,4 +232,3 @@ class ToolRegistry:
         if tool_class:
             return tool_class()
         return None
-
@@ -0,0 +1,97 @@
+"""
+OmniTool - Tool Usage Statistics
+Persist how often each tool is launched
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from core.paths import get_data_directory
+
+
+class UsageStats:
+    """
+    Launch counts per tool, stored in the data directory.
+
+    Used to decide which tools are worth prewarming. Launches are written
+    to disk SAVE_DELAY seconds later on a background thread, several
+    launches at once; flush() (also run at exit) writes pending counts now.
+    """
+
+    VERSION = 1
+
+    # Seconds between a launch and writing the stats
+    SAVE_DELAY = 2.0
+
+    def __init__(self, stats_path: Optional[str] = None):
+        if stats_path is None:
+            stats_path = str(get_data_directory() / "usage.json")
+        self.stats_path = stats_path
+        self._tools: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._load()
+        atexit.register(self.flush)
+
+    def _load(self):
+        """Load the stats file, ignoring it if it is stale or corrupt"""
+        try:
+            with open(self.stats_path, encoding='utf-8') as stats_file:
+                data = json.load(stats_file)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get('version') == self.VERSION:
+            self._tools = data.get('tools', {})
+
+    def record_launch(self, tool_id: str):
+        """Count a launch; it is written to disk shortly after"""
+        with self._lock:
+            entry = self._tools.setdefault(tool_id, {'launches': 0, 'last_launch': 0.0})
+            entry['launches'] += 1
+            entry['last_launch'] = time.time()
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self):
+        """Write counts not saved yet"""
+        with self._lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+        self.save()
+
+    def get_launch_count(self, tool_id: str) -> int:
+        """Get how many times a tool has been launched"""
+        return self._tools.get(tool_id, {}).get('launches', 0)
+
+    def most_used(self, limit: int) -> List[str]:
+        """Get the ids of the most launched tools, most recent first on ties"""
+        with self._lock:
+            tools = list(self._tools.items())
+        ranked = sorted(
+            tools,
+            key=lambda item: (item[1]['launches'], item[1]['last_launch']),
+            reverse=True
+        )
+        return [tool_id for tool_id, _ in ranked[:limit]]
+
+    def save(self):
+        """Write the stats to disk"""
+        with self._lock:
+            data = json.dumps({'version': self.VERSION, 'tools': self._tools})
+        temp_path = f"{self.stats_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as stats_file:
+                stats_file.write(data)
+            os.replace(temp_path, self.stats_path)
+        except OSError:
+            # A read-only home directory only costs us the stats
+            pass
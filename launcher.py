@@ -4,113 +4,454 @@ Refactored to use the new clean architecture
 """
 
 import sys
+import time
+from typing import Dict, List, Optional
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QScrollArea, QFrame, QGridLayout,
-    QButtonGroup, QRadioButton, QGraphicsDropShadowEffect
+    QLabel, QLineEdit, QFrame, QListView, QStyle,
+    QStyledItemDelegate, QStyleOptionViewItem, QButtonGroup, QRadioButton,
+    QGraphicsScene, QGraphicsPixmapItem, QGraphicsDropShadowEffect
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize, QThread, QTimer, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QColor, QImage, QPainter, QPainterPath, QPen, QPixmap, QPixmapCache
+
+from core import AppManager, ToolCategory, ToolMetadata, ToolRegistry
+from core.prewarm import ToolPrewarmer
+from core.single_instance import SingleInstanceServer
+
+
+# One application-level stylesheet for the whole launcher, scoped by
+# object name so it does not leak into tool windows
+LAUNCHER_STYLESHEET = """
+    OmniToolLauncher {
+        background-color: #ecf0f1;
+    }
+    #launcherHeader {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #667eea, stop:1 #764ba2);
+    }
+    #launcherTitle {
+        color: white;
+    }
+    #launcherSubtitle {
+        color: rgba(255, 255, 255, 0.9);
+    }
+    #launcherSearch {
+        background-color: rgba(255, 255, 255, 0.95);
+        border: none;
+        border-radius: 22px;
+        padding: 12px 20px;
+        color: #2c3e50;
+    }
+    #launcherSearch:focus {
+        background-color: white;
+    }
+    #launcherSidebar {
+        background-color: #f8f9fa;
+        border-radius: 10px;
+    }
+    #categoriesTitle, #resultsLabel {
+        color: #2c3e50;
+    }
+    #statsFrame {
+        background-color: white;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    #statsLabel {
+        color: #3498db;
+    }
+    #noResultsLabel {
+        color: #95a5a6;
+        padding: 40px;
+    }
+    #toolsView {
+        border: none;
+        background-color: transparent;
+    }
+    #launcherFooter {
+        background-color: #2c3e50;
+    }
+    #launcherFooter QLabel {
+        color: white;
+        padding: 15px;
+    }
+    OmniToolLauncher QRadioButton {
+        padding: 8px;
+        color: #2c3e50;
+    }
+    OmniToolLauncher QRadioButton:hover {
+        background-color: rgba(52, 152, 219, 0.1);
+        border-radius: 4px;
+    }
+    OmniToolLauncher QRadioButton::indicator {
+        width: 16px;
+        height: 16px;
+    }
+    OmniToolLauncher QRadioButton::indicator:checked {
+        background-color: #3498db;
+        border: 2px solid #3498db;
+        border-radius: 8px;
+    }
+    OmniToolLauncher QRadioButton::indicator:unchecked {
+        background-color: white;
+        border: 2px solid #bdc3c7;
+        border-radius: 8px;
+    }
+"""
 
-from core import AppManager, ToolCategory
 
+class RenderMode:
+    """Tool card rendering modes"""
+    QUALITY = "quality"        # Cached cards with a pre-rendered drop shadow
+    LOW_POWER = "low_power"    # Cached flat cards, no effects
 
-class ToolCard(QFrame):
-    """Modern card widget for displaying a tool"""
-    clicked = pyqtSignal(str)
 
-    def __init__(self, tool_metadata: dict, parent=None):
-        super().__init__(parent)
-        self.tool_metadata = tool_metadata
-        self.setup_ui()
+class ToolListModel(QAbstractListModel):
+    """
+    List model holding the tools currently shown in the launcher grid.
 
-    def setup_ui(self):
-        """Setup the card UI"""
-        self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
+    Filtering replaces the model's contents; the view only paints the
+    rows that are visible. When the new tools are a subset or superset of
+    the current ones (in the same relative order), only the affected rows
+    are removed or inserted instead of resetting the whole model.
+    """
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(15, 15, 15, 15)
-        layout.setSpacing(10)
+    ToolIdRole = Qt.ItemDataRole.UserRole + 1
+    MetadataRole = Qt.ItemDataRole.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tools: List[ToolMetadata] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of tools (flat list, so no children)"""
+        return 0 if parent.isValid() else len(self._tools)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return tool data for the delegate and the view"""
+        if not index.isValid():
+            return None
+
+        tool = self._tools[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return tool.name
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return tool.description
+        if role == self.ToolIdRole:
+            return tool.id
+        if role == self.MetadataRole:
+            return tool
+        return None
+
+    def set_tools(self, tools: List[ToolMetadata]):
+        """Replace the displayed tools, applying a row diff when possible"""
+        tools = list(tools)
+        old_ids = [tool.id for tool in self._tools]
+        new_ids = [tool.id for tool in tools]
+        if old_ids == new_ids:
+            self._tools = tools
+            return
+
+        old_set = set(old_ids)
+        new_set = set(new_ids)
+
+        if new_set <= old_set and [i for i in old_ids if i in new_set] == new_ids:
+            self._remove_rows_not_in(new_set)
+        elif old_set <= new_set and [i for i in new_ids if i in old_set] == old_ids:
+            self._insert_rows_from(tools, old_set)
+        else:
+            self.beginResetModel()
+            self._tools = tools
+            self.endResetModel()
+
+    def _remove_rows_not_in(self, keep_ids: set):
+        """Remove rows whose tool is not kept, one contiguous run at a time"""
+        row = len(self._tools) - 1
+        while row >= 0:
+            if self._tools[row].id in keep_ids:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._tools[row].id not in keep_ids:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._tools[row + 1:last + 1]
+            self.endRemoveRows()
+
+    def _insert_rows_from(self, tools: List[ToolMetadata], existing_ids: set):
+        """Insert the tools that are not shown yet, one contiguous run at a time"""
+        row = 0
+        while row < len(tools):
+            if tools[row].id in existing_ids:
+                row += 1
+                continue
+            first = row
+            while row < len(tools) and tools[row].id not in existing_ids:
+                row += 1
+            self.beginInsertRows(QModelIndex(), first, row - 1)
+            self._tools[first:first] = tools[first:row]
+            self.endInsertRows()
+
+
+class ToolCardDelegate(QStyledItemDelegate):
+    """
+    Paints a tool card for each visible row of the launcher grid.
+
+    Cards are rendered once into pixmaps kept in QPixmapCache (keyed by
+    tool, hover state, render mode and device pixel ratio), so scrolling
+    and hovering cost one blit per card. The card background, including
+    its drop shadow in QUALITY mode, is rendered once and shared by all
+    cards.
+    """
+
+    CARD_SIZE = QSize(220, 240)
+    CARD_MARGIN = 10
+    PADDING = 15
+    SHADOW_BLUR_RADIUS = 15
+    SHADOW_OFFSET_Y = 2
+    SHADOW_COLOR = QColor(0, 0, 0, 30)
+
+    def __init__(self, render_mode: str = RenderMode.QUALITY, parent=None):
+        super().__init__(parent)
+        self.render_mode = render_mode
+        self.icon_font = QFont("Segoe UI", 36)
+        self.name_font = QFont("Segoe UI", 12, QFont.Weight.Bold)
+        self.description_font = QFont("Segoe UI", 9)
+        self.category_font = QFont("Segoe UI", 8)
+        self._backgrounds = {}
+
+    def set_render_mode(self, render_mode: str):
+        """Switch rendering mode; cards are re-rendered on next paint"""
+        if render_mode != self.render_mode:
+            self.render_mode = render_mode
+            self._backgrounds.clear()
+
+    def sizeHint(self, option, index):
+        """Card size plus the gap between cards"""
+        return self.CARD_SIZE + QSize(2 * self.CARD_MARGIN, 2 * self.CARD_MARGIN)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        """Blit the cached card pixmap, rendering it first if needed"""
+        tool = index.data(ToolListModel.MetadataRole)
+        if tool is None:
+            return
+
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        device_pixel_ratio = painter.device().devicePixelRatioF()
+        cache_key = (
+            f"omnitool-card/{self.render_mode}/{int(hovered)}/"
+            f"{device_pixel_ratio}/{tool.id}/{hash(tool)}"
+        )
+
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is None:
+            pixmap = self._render_card(tool, hovered, device_pixel_ratio)
+            QPixmapCache.insert(cache_key, pixmap)
+
+        painter.drawPixmap(option.rect.topLeft(), pixmap)
+
+    def _render_card(self, tool: ToolMetadata, hovered: bool, device_pixel_ratio: float) -> QPixmap:
+        """Render one complete card (background, shadow and text)"""
+        pixmap = self._background(hovered, device_pixel_ratio).copy()
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+
+        card_rect = QRect(self.CARD_MARGIN, self.CARD_MARGIN,
+                          self.CARD_SIZE.width(), self.CARD_SIZE.height())
+        content = card_rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        center = Qt.AlignmentFlag.AlignHCenter
+        wrap = Qt.TextFlag.TextWordWrap
 
         # Icon
-        icon_label = QLabel(self.tool_metadata['icon'])
-        icon_label.setFont(QFont("Segoe UI", 36))
-        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        painter.setPen(QColor("#2c3e50"))
+        painter.setFont(self.icon_font)
+        icon_rect = QRect(content.left(), content.top(), content.width(), 60)
+        painter.drawText(icon_rect, center | Qt.AlignmentFlag.AlignVCenter, tool.icon)
 
         # Name
-        name_label = QLabel(self.tool_metadata['name'])
-        name_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        name_label.setWordWrap(True)
+        painter.setFont(self.name_font)
+        name_rect = QRect(content.left(), icon_rect.bottom() + 10, content.width(), 44)
+        painter.drawText(name_rect, center | Qt.AlignmentFlag.AlignTop | wrap, tool.name)
 
         # Description
-        desc_label = QLabel(self.tool_metadata['description'])
-        desc_label.setFont(QFont("Segoe UI", 9))
-        desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #7f8c8d;")
+        painter.setPen(QColor("#7f8c8d"))
+        painter.setFont(self.description_font)
+        description_rect = QRect(content.left(), name_rect.bottom() + 6, content.width(), 56)
+        painter.drawText(description_rect, center | Qt.AlignmentFlag.AlignTop | wrap, tool.description)
 
         # Category badge
-        category_label = QLabel(self.tool_metadata['category'])
-        category_label.setFont(QFont("Segoe UI", 8))
-        category_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        category_label.setStyleSheet("""
-            QLabel {
-                background-color: #3498db;
-                color: white;
-                padding: 4px 8px;
-                border-radius: 10px;
-            }
-        """)
-
-        layout.addWidget(icon_label)
-        layout.addWidget(name_label)
-        layout.addWidget(desc_label)
-        layout.addStretch()
-        layout.addWidget(category_label)
-
-        self.setStyleSheet("""
-            ToolCard {
-                background-color: white;
-                border: 2px solid #e0e0e0;
-                border-radius: 12px;
-            }
-            ToolCard:hover {
-                border: 2px solid #3498db;
-                background-color: #f8f9fa;
-            }
-        """)
-
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(2)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        self.setGraphicsEffect(shadow)
-
-        self.setFixedSize(220, 240)
-
-    def mousePressEvent(self, event):
-        """Handle mouse click"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit(self.tool_metadata['id'])
-        super().mousePressEvent(event)
+        painter.setFont(self.category_font)
+        badge_width = min(painter.fontMetrics().horizontalAdvance(tool.category) + 16, content.width())
+        badge_rect = QRect(0, 0, badge_width, 22)
+        badge_rect.moveCenter(content.center())
+        badge_rect.moveBottom(content.bottom())
+        badge_path = QPainterPath()
+        badge_path.addRoundedRect(badge_rect.toRectF(), 10, 10)
+        painter.fillPath(badge_path, QColor("#3498db"))
+        painter.setPen(QColor("white"))
+        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, tool.category)
+
+        painter.end()
+        return pixmap
+
+    def _background(self, hovered: bool, device_pixel_ratio: float) -> QPixmap:
+        """Return the shared card background, rendering it on first use"""
+        key = (hovered, device_pixel_ratio)
+        background = self._backgrounds.get(key)
+        if background is None:
+            background = self._render_background(hovered, device_pixel_ratio)
+            self._backgrounds[key] = background
+        return background
+
+    def _render_background(self, hovered: bool, device_pixel_ratio: float) -> QPixmap:
+        """Render the card face and, in QUALITY mode, its blurred shadow"""
+        full_size = self.sizeHint(None, None)
+        card = QPixmap(self.CARD_SIZE * device_pixel_ratio)
+        card.setDevicePixelRatio(device_pixel_ratio)
+        card.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(card)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(1, 1, self.CARD_SIZE.width() - 2, self.CARD_SIZE.height() - 2), 12, 12)
+        painter.fillPath(path, QColor("#f8f9fa" if hovered else "white"))
+        painter.setPen(QPen(QColor("#3498db" if hovered else "#e0e0e0"), 2))
+        painter.drawPath(path)
+        painter.end()
+
+        image = QImage(full_size * device_pixel_ratio, QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(device_pixel_ratio)
+        image.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(image)
+        if self.render_mode == RenderMode.QUALITY:
+            # Apply the drop shadow once, offscreen, instead of per widget
+            scene = QGraphicsScene()
+            scene.setSceneRect(0, 0, full_size.width(), full_size.height())
+            item = QGraphicsPixmapItem(card)
+            item.setPos(self.CARD_MARGIN, self.CARD_MARGIN)
+            shadow = QGraphicsDropShadowEffect()
+            shadow.setBlurRadius(self.SHADOW_BLUR_RADIUS)
+            shadow.setOffset(0, self.SHADOW_OFFSET_Y)
+            shadow.setColor(self.SHADOW_COLOR)
+            item.setGraphicsEffect(shadow)
+            scene.addItem(item)
+            scene.render(painter, QRectF(0, 0, full_size.width(), full_size.height()), scene.sceneRect())
+        else:
+            painter.drawPixmap(self.CARD_MARGIN, self.CARD_MARGIN, card)
+        painter.end()
+
+        return QPixmap.fromImage(image)
+
+
+class DiscoveryThread(QThread):
+    """Background thread running tool discovery"""
+    tool_registered = pyqtSignal(object)
+
+    def __init__(self, app_manager: AppManager, parent=None):
+        super().__init__(parent)
+        self.app_manager = app_manager
+        self._listener = self.tool_registered.emit
+
+    def run(self):
+        """Discover tools, streaming each registration to the GUI thread"""
+        ToolRegistry.add_listener(self._listener)
+        try:
+            self.app_manager.discover_tools()
+        finally:
+            ToolRegistry.remove_listener(self._listener)
+
+
+class StartupReport:
+    """Records startup milestones and prints them once startup is complete"""
+
+    MILESTONES = [
+        ('first_paint', "Time to first paint"),
+        ('first_tool', "First tool shown"),
+        ('discovery_done', "Discovery finished"),
+    ]
+
+    def __init__(self, start_time: float):
+        """
+        Args:
+            start_time: time.perf_counter() value when the process started
+        """
+        self.start_time = start_time
+        self.milestones: Dict[str, float] = {}
+        self.tool_count = 0
+        self.printed = False
+
+    def mark(self, milestone: str):
+        """Record a milestone the first time it is reached"""
+        self.milestones.setdefault(milestone, time.perf_counter())
+
+    def is_complete(self) -> bool:
+        return 'first_paint' in self.milestones and 'discovery_done' in self.milestones
+
+    def print_report(self):
+        """Print the elapsed time of each milestone"""
+        self.printed = True
+        print("\n📊 Startup report")
+        for milestone, label in self.MILESTONES:
+            if milestone in self.milestones:
+                elapsed_ms = (self.milestones[milestone] - self.start_time) * 1000
+                print(f"  {label + ':':<24}{elapsed_ms:>8.1f} ms")
+            else:
+                print(f"  {label + ':':<24}{'-':>8}")
+        print(f"  {'Tools registered:':<24}{self.tool_count:>8}")
 
 
 class OmniToolLauncher(QMainWindow):
     """Main launcher application"""
 
-    def __init__(self):
+    # Delay between the last keystroke and running the search
+    SEARCH_DEBOUNCE_MS = 150
+
+    # Coalescing delay for tools streamed in by background discovery
+    DISCOVERY_REFRESH_MS = 30
+
+    def __init__(self, search_debounce_ms: int = SEARCH_DEBOUNCE_MS,
+                 render_mode: str = RenderMode.QUALITY,
+                 startup_report: Optional[StartupReport] = None,
+                 isolate_tools: Optional[bool] = None,
+                 prewarm_tools: bool = True):
         super().__init__()
-        self.app_manager = AppManager()
+        self.render_mode = render_mode
+        self.startup_report = startup_report
+        # Discovery runs after the window is up, see start_discovery()
+        self.app_manager = AppManager(discover=False, isolate_tools=isolate_tools)
         self.current_category = None
         self.current_search = ""
-        self.open_tool_windows = []
+        self.category_buttons: Dict[str, QRadioButton] = {}
+        self._last_card_click = (None, 0.0)
+        self.discovery_thread: Optional[DiscoveryThread] = None
+
+        # Build the most used tools' windows in idle time after discovery
+        self.prewarmer = ToolPrewarmer(self.app_manager, parent=self) if prewarm_tools else None
+
+        # Coalesce keystrokes into one search once typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(search_debounce_ms)
+        self.search_timer.timeout.connect(self.apply_search)
+
+        # Coalesce tools registered during discovery into one refresh
+        self.discovery_refresh_timer = QTimer(self)
+        self.discovery_refresh_timer.setSingleShot(True)
+        self.discovery_refresh_timer.setInterval(self.DISCOVERY_REFRESH_MS)
+        self.discovery_refresh_timer.timeout.connect(self.refresh_discovered_tools)
 
         self.init_ui()
         self.apply_theme()
-        self.refresh_tools()
+        self.refresh_discovered_tools()
+
+        QTimer.singleShot(0, self.start_discovery)
 
     def init_ui(self):
         """Initialize UI"""
@@ -141,41 +482,27 @@ class OmniToolLauncher(QMainWindow):
     def create_header(self, parent_layout):
         """Create header"""
         header = QWidget()
-        header.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-            }
-        """)
+        header.setObjectName("launcherHeader")
+        header.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
         header_layout = QVBoxLayout(header)
         header_layout.setContentsMargins(30, 20, 30, 20)
         header_layout.setSpacing(15)
 
         title = QLabel("🛠️ OmniTool")
+        title.setObjectName("launcherTitle")
         title.setFont(QFont("Segoe UI", 32, QFont.Weight.Bold))
-        title.setStyleSheet("color: white;")
 
         subtitle = QLabel("Your All-in-One Toolkit")
+        subtitle.setObjectName("launcherSubtitle")
         subtitle.setFont(QFont("Segoe UI", 14))
-        subtitle.setStyleSheet("color: rgba(255, 255, 255, 0.9);")
 
         self.search_input = QLineEdit()
+        self.search_input.setObjectName("launcherSearch")
         self.search_input.setPlaceholderText("🔍 Search tools... (e.g., 'youtube', 'pdf', 'calculator')")
         self.search_input.setFont(QFont("Segoe UI", 11))
         self.search_input.setMinimumHeight(45)
         self.search_input.textChanged.connect(self.on_search)
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: rgba(255, 255, 255, 0.95);
-                border: none;
-                border-radius: 22px;
-                padding: 12px 20px;
-                color: #2c3e50;
-            }
-            QLineEdit:focus {
-                background-color: white;
-            }
-        """)
+        self.search_input.returnPressed.connect(self.apply_search)
 
         header_layout.addWidget(title)
         header_layout.addWidget(subtitle)
@@ -185,16 +512,17 @@ class OmniToolLauncher(QMainWindow):
     def create_sidebar(self, parent_layout):
         """Create sidebar with categories"""
         sidebar = QWidget()
+        sidebar.setObjectName("launcherSidebar")
+        sidebar.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
         sidebar.setMaximumWidth(250)
-        sidebar.setStyleSheet("QWidget { background-color: #f8f9fa; border-radius: 10px; }")
 
         sidebar_layout = QVBoxLayout(sidebar)
         sidebar_layout.setContentsMargins(15, 15, 15, 15)
         sidebar_layout.setSpacing(10)
 
         cat_title = QLabel("📂 Categories")
+        cat_title.setObjectName("categoriesTitle")
         cat_title.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
-        cat_title.setStyleSheet("color: #2c3e50;")
         sidebar_layout.addWidget(cat_title)
 
         self.category_group = QButtonGroup()
@@ -206,27 +534,22 @@ class OmniToolLauncher(QMainWindow):
         self.category_group.addButton(all_btn)
         sidebar_layout.addWidget(all_btn)
 
-        categories_count = self.app_manager.get_categories_with_count()
-
-        for category, count in categories_count.items():
-            btn = QRadioButton(f"{category} ({count})")
-            btn.setFont(QFont("Segoe UI", 10))
-            btn.toggled.connect(
-                lambda checked, cat=category: self.filter_by_category(cat) if checked else None
-            )
-            self.category_group.addButton(btn)
-            sidebar_layout.addWidget(btn)
+        # Category buttons are added as tools are discovered
+        self.categories_layout = QVBoxLayout()
+        self.categories_layout.setContentsMargins(0, 0, 0, 0)
+        self.categories_layout.setSpacing(10)
+        sidebar_layout.addLayout(self.categories_layout)
 
         sidebar_layout.addStretch()
 
         stats_frame = QFrame()
-        stats_frame.setStyleSheet("QFrame { background-color: white; border-radius: 8px; padding: 10px; }")
+        stats_frame.setObjectName("statsFrame")
         stats_layout = QVBoxLayout(stats_frame)
 
-        total_tools = len(self.app_manager.get_all_tools())
-        stats_label = QLabel(f"📊 Total Tools: {total_tools}")
+        stats_label = QLabel()
+        stats_label.setObjectName("statsLabel")
         stats_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        stats_label.setStyleSheet("color: #3498db;")
+        self.stats_label = stats_label
 
         stats_layout.addWidget(stats_label)
         sidebar_layout.addWidget(stats_frame)
@@ -234,53 +557,124 @@ class OmniToolLauncher(QMainWindow):
 
     def create_main_content(self, parent_layout):
         """Create main content area"""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
-
         self.content_widget = QWidget()
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         self.content_layout.setSpacing(20)
 
         self.results_label = QLabel()
+        self.results_label.setObjectName("resultsLabel")
         self.results_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        self.results_label.setStyleSheet("color: #2c3e50;")
         self.content_layout.addWidget(self.results_label)
 
-        self.tools_container = QWidget()
-        self.tools_grid = QGridLayout(self.tools_container)
-        self.tools_grid.setSpacing(20)
-        self.tools_grid.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-
-        self.content_layout.addWidget(self.tools_container)
-        self.content_layout.addStretch()
-
-        scroll.setWidget(self.content_widget)
-        parent_layout.addWidget(scroll)
+        # Model/view grid: cards are painted by the delegate, not built as widgets
+        self.tools_model = ToolListModel(self)
+        self.tools_view = QListView()
+        self.tools_view.setObjectName("toolsView")
+        self.tools_view.setModel(self.tools_model)
+        self.card_delegate = ToolCardDelegate(self.render_mode, self.tools_view)
+        self.tools_view.setItemDelegate(self.card_delegate)
+        self.tools_view.setViewMode(QListView.ViewMode.IconMode)
+        self.tools_view.setFlow(QListView.Flow.LeftToRight)
+        self.tools_view.setWrapping(True)
+        self.tools_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.tools_view.setMovement(QListView.Movement.Static)
+        self.tools_view.setUniformItemSizes(True)
+        self.tools_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.tools_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.tools_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.tools_view.setMouseTracking(True)
+        self.tools_view.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self.tools_view.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        # Cards launch on a single click, like the old card widgets did
+        self.tools_view.clicked.connect(self.on_tool_clicked)
+
+        self.no_results_label = QLabel("😕 No tools found matching your search")
+        self.no_results_label.setObjectName("noResultsLabel")
+        self.no_results_label.setFont(QFont("Segoe UI", 14))
+        self.no_results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.no_results_label.hide()
+
+        self.content_layout.addWidget(self.no_results_label)
+        self.content_layout.addWidget(self.tools_view, 1)
+
+        parent_layout.addWidget(self.content_widget, 1)
 
     def create_footer(self, parent_layout):
         """Create footer"""
         footer = QWidget()
-        footer.setStyleSheet("QWidget { background-color: #2c3e50; padding: 15px; }")
+        footer.setObjectName("launcherFooter")
+        footer.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
         footer.setMaximumHeight(60)
 
         footer_layout = QHBoxLayout(footer)
         footer_text = QLabel("OmniTool v1.0 | All you need in one place.")
         footer_text.setFont(QFont("Segoe UI", 9))
-        footer_text.setStyleSheet("color: white;")
 
         footer_layout.addWidget(footer_text)
         footer_layout.addStretch()
         parent_layout.addWidget(footer)
 
+    def update_categories(self):
+        """Add buttons for new categories and refresh counts"""
+        categories_count = self.app_manager.get_categories_with_count()
+
+        for category, count in categories_count.items():
+            btn = self.category_buttons.get(category)
+            if btn is None:
+                btn = QRadioButton()
+                btn.setFont(QFont("Segoe UI", 10))
+                btn.toggled.connect(
+                    lambda checked, cat=category: self.filter_by_category(cat) if checked else None
+                )
+                self.category_group.addButton(btn)
+                self.categories_layout.addWidget(btn)
+                self.category_buttons[category] = btn
+            btn.setText(f"{category} ({count})")
+
+        total_tools = sum(categories_count.values())
+        self.stats_label.setText(f"📊 Total Tools: {total_tools}")
+
+    def start_discovery(self):
+        """Discover tools off the GUI thread, streaming them into the grid"""
+        self.discovery_thread = DiscoveryThread(self.app_manager, self)
+        self.discovery_thread.tool_registered.connect(self.on_tool_registered)
+        self.discovery_thread.finished.connect(self.on_discovery_finished)
+        self.discovery_thread.start()
+
+    def on_tool_registered(self, metadata):
+        """Schedule a refresh for a tool registered by discovery"""
+        if not self.discovery_refresh_timer.isActive():
+            self.discovery_refresh_timer.start()
+
+    def on_discovery_finished(self):
+        """Show the final tool list and complete the startup report"""
+        self.discovery_refresh_timer.stop()
+        self.refresh_discovered_tools()
+
+        if self.app_manager.has_isolated_tools():
+            # Pre-spawn worker interpreters while the user is browsing
+            self.app_manager.get_process_pool()
+
+        if self.prewarmer is not None:
+            self.prewarmer.start()
+
+        if self.startup_report is not None:
+            self.startup_report.mark('discovery_done')
+            self.startup_report.tool_count = len(self.app_manager.get_all_tools())
+            self._maybe_print_startup_report()
+
+    def is_discovering(self) -> bool:
+        """Check whether background discovery is still running"""
+        return self.discovery_thread is not None and self.discovery_thread.isRunning()
+
+    def refresh_discovered_tools(self):
+        """Refresh the sidebar and grid after tools were registered"""
+        self.update_categories()
+        self.refresh_tools()
+
     def refresh_tools(self):
         """Refresh tools display"""
-        while self.tools_grid.count():
-            item = self.tools_grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
         if self.current_search:
             tools = self.app_manager.search_tools(self.current_search)
             self.results_label.setText(f"🔍 Search results for '{self.current_search}' ({len(tools)} found)")
@@ -291,29 +685,41 @@ class OmniToolLauncher(QMainWindow):
             tools = self.app_manager.get_all_tools()
             self.results_label.setText(f"🛠️ All Tools ({len(tools)} available)")
 
-        if tools:
-            row, col = 0, 0
-            max_cols = 4
-
-            for tool in tools:
-                card = ToolCard(tool)
-                card.clicked.connect(self.launch_tool)
-                self.tools_grid.addWidget(card, row, col)
-
-                col += 1
-                if col >= max_cols:
-                    col = 0
-                    row += 1
+        self.tools_model.set_tools(tools)
+        if tools or not self.is_discovering():
+            self.no_results_label.setText("😕 No tools found matching your search")
         else:
-            no_results = QLabel("😕 No tools found matching your search")
-            no_results.setFont(QFont("Segoe UI", 14))
-            no_results.setStyleSheet("color: #95a5a6; padding: 40px;")
-            no_results.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.tools_grid.addWidget(no_results, 0, 0)
+            self.no_results_label.setText("⏳ Loading tools...")
+        self.no_results_label.setVisible(not tools)
+        self.tools_view.setVisible(bool(tools))
+
+        if tools and self.startup_report is not None:
+            self.startup_report.mark('first_tool')
+
+    def on_tool_clicked(self, index):
+        """Launch the tool whose card was clicked (a double-click launches once)"""
+        tool_id = index.data(ToolListModel.ToolIdRole)
+        if not tool_id:
+            return
+        now = time.monotonic()
+        last_tool_id, last_click = self._last_card_click
+        self._last_card_click = (tool_id, now)
+        if tool_id == last_tool_id and (now - last_click) * 1000 < QApplication.doubleClickInterval():
+            return
+        self.launch_tool(tool_id)
 
     def on_search(self, text):
-        """Handle search"""
-        self.current_search = text.strip()
+        """Handle search input: (re)start the debounce timer"""
+        self.search_timer.start()
+
+    def apply_search(self):
+        """Run the search for the current input, unless it has not changed"""
+        self.search_timer.stop()
+        search = self.search_input.text().strip()
+        if search == self.current_search:
+            return
+
+        self.current_search = search
         self.refresh_tools()
 
     def filter_by_category(self, category):
@@ -326,9 +732,7 @@ class OmniToolLauncher(QMainWindow):
     def launch_tool(self, tool_id):
         """Launch a tool"""
         try:
-            window = self.app_manager.launch_tool(tool_id)
-            if window:
-                self.open_tool_windows.append(window)
+            self.app_manager.launch_tool(tool_id)
         except Exception as e:
             from PyQt6.QtWidgets import QMessageBox
             import traceback
@@ -338,45 +742,98 @@ class OmniToolLauncher(QMainWindow):
                 f"Failed to launch tool:\n{str(e)}\n\n{traceback.format_exc()}"
             )
 
+    def handle_instance_request(self, request: dict) -> dict:
+        """Handle a request forwarded by a later `main.py` invocation"""
+        action = request.get('action')
+
+        if action == 'show':
+            self.showNormal()
+            self.raise_()
+            self.activateWindow()
+            return {'status': 'success', 'message': 'Showing running OmniTool'}
+
+        if action == 'launch':
+            # Reply first; launching (imports, window) would outlast the sender's wait
+            tool_id = request.get('tool', '')
+            if not self.is_discovering() and not ToolRegistry.is_registered(tool_id):
+                return {'status': 'error', 'message': f"Unknown tool: {tool_id}"}
+
+            QTimer.singleShot(0, lambda: self._launch_requested_tool(tool_id))
+            return {'status': 'success', 'message': f"Launching {tool_id} in running OmniTool"}
+
+        return {'status': 'error', 'message': f"Unsupported request: {action}"}
+
+    def _launch_requested_tool(self, tool_id: str):
+        """Launch a tool requested by another invocation, once discovery is done"""
+        if self.is_discovering():
+            self.discovery_thread.wait()
+        if not ToolRegistry.is_registered(tool_id):
+            print(f"❌ Unknown tool requested: {tool_id}")
+            return
+        self.launch_tool(tool_id)
+
+    def paintEvent(self, event):
+        """Record the first paint for the startup report"""
+        super().paintEvent(event)
+        if self.startup_report is not None and 'first_paint' not in self.startup_report.milestones:
+            self.startup_report.mark('first_paint')
+            self._maybe_print_startup_report()
+
+    def _maybe_print_startup_report(self):
+        if self.startup_report.is_complete() and not self.startup_report.printed:
+            self.startup_report.print_report()
+
+    def closeEvent(self, event):
+        """Let background discovery finish and release idle windows and worker processes"""
+        if self.discovery_thread is not None:
+            self.discovery_thread.wait()
+        if self.prewarmer is not None:
+            self.prewarmer.stop()
+        self.app_manager.shutdown()
+        super().closeEvent(event)
+
     def apply_theme(self):
-        """Apply theme"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #ecf0f1;
-            }
-            QRadioButton {
-                padding: 8px;
-                color: #2c3e50;
-            }
-            QRadioButton:hover {
-                background-color: rgba(52, 152, 219, 0.1);
-                border-radius: 4px;
-            }
-            QRadioButton::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            QRadioButton::indicator:checked {
-                background-color: #3498db;
-                border: 2px solid #3498db;
-                border-radius: 8px;
-            }
-            QRadioButton::indicator:unchecked {
-                background-color: white;
-                border: 2px solid #bdc3c7;
-                border-radius: 8px;
-            }
-        """)
-
-
-def main():
-    """Main entry point"""
+        """Apply the launcher stylesheet once, at application level"""
+        app = QApplication.instance()
+        if LAUNCHER_STYLESHEET not in app.styleSheet():
+            app.setStyleSheet(app.styleSheet() + LAUNCHER_STYLESHEET)
+
+    def set_render_mode(self, render_mode: str):
+        """Switch card rendering (e.g. RenderMode.LOW_POWER on machines without a GPU)"""
+        self.render_mode = render_mode
+        self.card_delegate.set_render_mode(render_mode)
+        self.tools_view.viewport().update()
+
+
+def main(low_power: bool = False, startup_time: Optional[float] = None,
+         isolate_tools: Optional[bool] = None, listen_for_instances: bool = False):
+    """
+    Main entry point
+
+    Args:
+        low_power: Render flat cards without shadow effects
+        startup_time: time.perf_counter() at process start; when given,
+                      a startup timing report is printed
+        isolate_tools: Run tools in worker processes (None: per-tool setting)
+        listen_for_instances: Accept requests from later `main.py` runs;
+                              only pass True if no other instance is running
+    """
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
 
-    launcher = OmniToolLauncher()
+    render_mode = RenderMode.LOW_POWER if low_power else RenderMode.QUALITY
+    startup_report = StartupReport(startup_time) if startup_time is not None else None
+    launcher = OmniToolLauncher(
+        render_mode=render_mode,
+        startup_report=startup_report,
+        isolate_tools=isolate_tools
+    )
     launcher.show()
 
+    if listen_for_instances:
+        server = SingleInstanceServer(launcher.handle_instance_request, launcher)
+        server.listen()
+
     sys.exit(app.exec())
 
 
@@ -3,6 +3,11 @@ OmniTool - Multi-Tool Application Launcher
 Main entry point for the application
 """
 
+import time
+
+# Taken before anything heavy is imported, for --startup-report
+STARTUP_TIME = time.perf_counter()
+
 import sys
 import argparse
 
@@ -16,6 +21,12 @@ def main():
 Examples:
   python main.py                         # Launch main app with tool selector
   python main.py --tool youtube_downloader  # Launch YouTube Downloader directly
+  python main.py --low-power             # Flat launcher cards without effects
+  python main.py --startup-report        # Print launcher startup timings
+  python main.py --isolated              # Run each tool in its own process
+
+If OmniTool is already running, the request is forwarded to it instead of
+starting a second copy (use --new-instance to opt out).
         '''
     )
 
@@ -25,8 +36,52 @@ Examples:
         help='Launch a specific tool directly by ID'
     )
 
+    parser.add_argument(
+        '--low-power',
+        action='store_true',
+        help='Disable launcher visual effects (for software rendering / no GPU)'
+    )
+
+    parser.add_argument(
+        '--startup-report',
+        action='store_true',
+        help='Print time to first paint and tool discovery timings (launcher only)'
+    )
+
+    parser.add_argument(
+        '--isolated',
+        action='store_true',
+        help='Run every tool in a separate worker process (launcher only)'
+    )
+
+    parser.add_argument(
+        '--new-instance',
+        action='store_true',
+        help='Always start a new OmniTool instance instead of reusing a running one'
+    )
+
     args = parser.parse_args()
 
+    # Reuse a running instance if there is one
+    listen_for_instances = not args.new_instance
+    if not args.new_instance:
+        from core.single_instance import NO_REPLY, send_to_running_instance
+
+        if args.tool:
+            request = {'action': 'launch', 'tool': args.tool}
+        else:
+            request = {'action': 'show'}
+
+        reply = send_to_running_instance(request)
+        if reply is not None:
+            listen_for_instances = False
+            if reply.get('status') in ('success', NO_REPLY):
+                print(f"✓ {reply.get('message', 'Forwarded to running OmniTool')}")
+                sys.exit(0)
+            if args.tool:
+                print(f"❌ {reply.get('message', 'Running OmniTool rejected the request')}")
+                sys.exit(1)
+
     # Direct tool launch
     if args.tool:
         from core import AppManager
@@ -38,13 +93,38 @@ Examples:
 
         print(f"Launching {args.tool}...")
         app_manager.launch_tool(args.tool)
+
+        if listen_for_instances:
+            from core.single_instance import SingleInstanceServer
+
+            from PyQt6.QtCore import QTimer
+            from core.tool_registry import ToolRegistry
+
+            def handle_request(request):
+                """Launch tools requested by later invocations (after replying)"""
+                if request.get('action') != 'launch':
+                    return {'status': 'error', 'message': 'Only tool launches are supported'}
+                tool_id = request.get('tool', '')
+                if not ToolRegistry.is_registered(tool_id):
+                    return {'status': 'error', 'message': f"Unknown tool: {tool_id}"}
+                QTimer.singleShot(0, lambda: app_manager.launch_tool(tool_id))
+                return {'status': 'success', 'message': f"Launching {tool_id} in running OmniTool"}
+
+            server = SingleInstanceServer(handle_request)
+            server.listen()
+
         sys.exit(app.exec())
 
     else:
         # Launch main app launcher
         from launcher import main as launcher_main
         print("Launching OmniTool Launcher...")
-        launcher_main()
+        launcher_main(
+            low_power=args.low_power,
+            startup_time=STARTUP_TIME if args.startup_report else None,
+            isolate_tools=True if args.isolated else None,
+            listen_for_instances=listen_for_instances
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,75 @@
+"""
+DownloadQueue listeners, and the YouTube window unregistering its own.
+"""
+
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+from tools.youtube_downloader.download_queue import DownloadQueue, JobStatus
+
+
+class _FakeJournal:
+    def create_job(self, *args, **kwargs):
+        return None
+
+
+class _FakeDownloader:
+    """Finishes every download at once"""
+
+    download_directory = '/tmp'
+    journal = _FakeJournal()
+
+    def download_video(self, url, quality, progress_callback=None, **kwargs):
+        return {'status': 'success', 'message': f'Downloaded {url}'}
+
+
+class _Signals(QObject):
+    job_changed = pyqtSignal(object)
+
+
+def test_removed_listener_is_not_notified():
+    queue = DownloadQueue(_FakeDownloader(), max_workers=1)
+    kept, removed = [], []
+    queue.add_listener(kept.append)
+    listener = removed.append
+    queue.add_listener(listener)
+    queue.remove_listener(listener)
+
+    job = queue.submit('https://example.com/video')
+    assert queue.wait(5)
+    queue.shutdown()
+
+    assert removed == []
+    assert kept[-1].job_id == job.job_id and kept[-1].status == JobStatus.FINISHED
+
+
+def test_signal_emit_must_be_removed_by_the_same_reference():
+    # Every `.emit` access is a new object, so only a stored one can be removed
+    signals = _Signals()
+    queue = DownloadQueue(_FakeDownloader())
+    queue.add_listener(signals.job_changed.emit)
+    queue.remove_listener(signals.job_changed.emit)
+    assert len(queue._listeners) == 1
+
+    listener = signals.job_changed.emit
+    queue.add_listener(listener)
+    queue.remove_listener(listener)
+    assert len(queue._listeners) == 1
+    queue.shutdown()
+
+
+def test_window_shutdown_unregisters_its_listener(tmp_path, monkeypatch):
+    monkeypatch.setenv('OMNITOOL_HOME', str(tmp_path))
+    app = QApplication.instance() or QApplication([])
+    from tools.youtube_downloader.window import YouTubeDownloaderWindow
+
+    window = YouTubeDownloaderWindow()
+    assert window.download_queue._listeners == [window._queue_listener]
+    window.shutdown()
+    assert window.download_queue._listeners == []
+    window.deleteLater()
+    app.processEvents()
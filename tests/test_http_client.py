@@ -0,0 +1,111 @@
+"""
+HttpClient connection reuse against a local HTTP/1.1 keep-alive server.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.http_client import HttpClient
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every GET with a small body; records client sockets"""
+
+    protocol_version = 'HTTP/1.1'
+    client_sockets = set()
+
+    def do_GET(self):
+        self.client_sockets.add(self.client_address)
+        body = self.path.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _KeepAliveHandler.client_sockets = set()
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_sequential_requests_reuse_one_connection(server):
+    client = HttpClient(pool_size=2)
+    try:
+        for index in range(10):
+            response = client.get(f"{server}/item/{index}")
+            assert response.ok
+            assert response.content == f"/item/{index}".encode()
+        stats = client.get_stats()
+    finally:
+        client.close()
+
+    assert stats['backend'] == 'requests'
+    assert stats['requests'] == 10
+    assert stats['connections_reused'] > 0
+    assert stats['connections_opened'] <= stats['pool_size']
+    assert len(_KeepAliveHandler.client_sockets) == stats['connections_opened']
+
+
+def test_concurrent_requests_stay_within_pool(server):
+    client = HttpClient(pool_size=4)
+    try:
+        with ThreadPoolExecutor(4) as executor:
+            responses = list(executor.map(lambda index: client.get(f"{server}/item/{index}"), range(40)))
+        stats = client.get_stats()
+    finally:
+        client.close()
+
+    assert all(response.ok for response in responses)
+    assert stats['connections_opened'] <= 4
+    assert stats['connections_opened'] + stats['connections_reused'] == 40
+
+
+def test_ensure_pool_size_keeps_counting_retired_pools(server):
+    client = HttpClient(pool_size=1)
+    try:
+        for index in range(5):
+            client.get(f"{server}/before/{index}")
+        before = client.get_stats()
+
+        client.ensure_pool_size(1)  # Not larger: the pool is kept
+        assert client.get_stats() == before
+
+        client.ensure_pool_size(3)
+        grown = client.get_stats()
+        for index in range(5):
+            client.get(f"{server}/after/{index}")
+        after = client.get_stats()
+    finally:
+        client.close()
+
+    assert before['connections_opened'] == 1
+    assert before['connections_reused'] == 4
+    # The retired pool's counts survive the new adapter being mounted
+    assert grown['pool_size'] == 3
+    assert grown['connections_opened'] == 1
+    assert grown['connections_reused'] == 4
+    assert after['connections_opened'] == 2
+    assert after['connections_reused'] == 8
+
+
+def test_unreachable_host_raises_ioerror():
+    client = HttpClient(pool_size=1, timeout=2.0)
+    try:
+        with pytest.raises(IOError):
+            client.get("http://127.0.0.1:1/")
+        assert client.get_stats()['errors'] == 1
+    finally:
+        client.close()
@@ -0,0 +1,31 @@
+"""
+Registering a tool must not import its heavy dependencies; they are
+loaded only when the tool's window is created.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that tool.py files must leave to their windows
+HEAVY_MODULES = ('yt_dlp', 'PIL', 'requests')
+
+
+def _imported_modules(module: str) -> set:
+    """Import `module` in a fresh interpreter and return its sys.modules"""
+    script = f"import json, sys, {module}; print(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, '-c', script], cwd=REPO_ROOT,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+
+def test_youtube_downloader_tool_import_is_light():
+    modules = _imported_modules('tools.youtube_downloader.tool')
+    loaded = [name for name in HEAVY_MODULES
+              if any(module == name or module.startswith(name + '.') for module in modules)]
+    assert not loaded, f"importing tool.py loaded {loaded}"
@@ -0,0 +1,62 @@
+"""
+ToolSearchIndex matching and ranking.
+"""
+
+from core.search_index import ToolSearchIndex
+from core.tool_metadata import ToolMetadata
+
+
+def _tool(tool_id, name, description='', keywords=()):
+    return ToolMetadata(id=tool_id, name=name, description=description, category='Other',
+                        icon='🔧', keywords=tuple(keywords), version='1.0.0', author='Test')
+
+
+def _index(*tools):
+    index = ToolSearchIndex()
+    for tool in tools:
+        index.add(tool)
+    return index
+
+
+def test_every_query_word_must_match():
+    index = _index(
+        _tool('merge', 'PDF Merge'),
+        _tool('split', 'PDF Split'),
+        _tool('audio', 'Audio Merge'),
+    )
+    assert index.search('pdf merge') == ['merge']
+    assert index.search('pdf') == ['merge', 'split']
+
+
+def test_trigrams_only_without_exact_or_prefix_match():
+    index = _index(
+        _tool('yt', 'YouTube Downloader'),
+        _tool('tuber', 'Tuberculosis Notes'),
+    )
+    # 'tube' starts a token, so substrings of other tokens are not tried
+    assert index.search('tube') == ['tuber']
+    # Nothing starts with these: substring and misspelling still match
+    assert index.search('outube') == ['yt']
+    assert index.search('youtbe') == ['yt']
+    assert index.search('zzz') == []
+
+
+def test_ties_keep_registration_order_after_reindexing():
+    first, second, third = (_tool(tool_id, f'Player {tool_id}') for tool_id in ('a', 'b', 'c'))
+    index = _index(first, second, third)
+    assert index.search('player') == ['a', 'b', 'c']
+
+    index.add(first)  # Re-indexing moves a tool to the end
+    assert index.search('player') == ['b', 'c', 'a']
+    assert index.search('play') == ['b', 'c', 'a']
+
+    index.remove('b')
+    assert index.search('player') == ['c', 'a']
+
+
+def test_better_fields_rank_first():
+    index = _index(
+        _tool('desc', 'Notes', description='an image viewer'),
+        _tool('name', 'Image Viewer'),
+    )
+    assert index.search('image') == ['name', 'desc']
@@ -0,0 +1,169 @@
+"""
+ThumbnailLoader against a local thumbnail server: variant fallback and
+the disk cache.
+"""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QSize
+from PyQt6.QtGui import QColor, QImage
+from PyQt6.QtWidgets import QApplication
+
+from tools.youtube_downloader.thumbnails import ThumbnailLoader
+
+SIZE = QSize(160, 90)
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor('red'))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, 'JPEG')
+    return bytes(data)
+
+
+class _ThumbnailHandler(BaseHTTPRequestHandler):
+    """Serves only the hqdefault variant; every request path is recorded"""
+
+    protocol_version = 'HTTP/1.1'
+    image = b''
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        if self.path.endswith('/hqdefault.jpg'):
+            body, status = self.image, 200
+        else:
+            body, status = b'not found', 404
+        self.send_response(status)
+        self.send_header('Content-Type', 'image/jpeg' if status == 200 else 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def server():
+    _ThumbnailHandler.image = _jpeg(480, 360)
+    _ThumbnailHandler.requests = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _ThumbnailHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/vi"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _wait_for(loader: ThumbnailLoader, video_id: str, timeout: float = 5.0):
+    """Run the event loop until the loader reports on `video_id`"""
+    results = []
+    loader.thumbnail_loaded.connect(lambda vid, size, pixmap: results.append((vid, size, pixmap)))
+    loader.thumbnail_failed.connect(lambda vid, size, message: results.append((vid, size, message)))
+    deadline = time.monotonic() + timeout
+    while not any(result[0] == video_id for result in results):
+        assert time.monotonic() < deadline, "thumbnail was not delivered"
+        QApplication.processEvents()
+        time.sleep(0.01)
+    return next(result for result in results if result[0] == video_id)
+
+
+def _loader(base_url, cache_directory):
+    return ThumbnailLoader(base_url=base_url, cache_directory=str(cache_directory), max_workers=2)
+
+
+def _started_loader(base_url, cache_directory, disk_limit):
+    """A one-worker loader whose startup prune has finished"""
+    loader = ThumbnailLoader(base_url=base_url, cache_directory=str(cache_directory),
+                             max_workers=1, disk_limit=disk_limit)
+    loader._executor.submit(lambda: None).result(timeout=5)
+    return loader
+
+
+def test_falls_back_to_smaller_variant(qapp, server, tmp_path):
+    loader = _loader(server, tmp_path)
+    try:
+        assert loader.load('abc', SIZE) is None
+        video_id, size, pixmap = _wait_for(loader, 'abc')
+    finally:
+        loader.shutdown()
+
+    assert size == SIZE
+    assert pixmap.size() == SIZE
+    assert _ThumbnailHandler.requests == [
+        '/vi/abc/maxresdefault.jpg', '/vi/abc/sddefault.jpg', '/vi/abc/hqdefault.jpg'
+    ]
+    assert (tmp_path / 'abc.jpg').read_bytes() == _ThumbnailHandler.image
+    assert loader.get_cached('abc', SIZE) is not None
+
+
+def test_disk_cache_skips_network(qapp, server, tmp_path):
+    (tmp_path / 'cached.jpg').write_bytes(_jpeg(320, 180))
+    loader = _loader(server, tmp_path)
+    try:
+        loader.load('cached', SIZE)
+        _, size, pixmap = _wait_for(loader, 'cached')
+    finally:
+        loader.shutdown()
+
+    assert size == SIZE and pixmap.size() == SIZE
+    assert _ThumbnailHandler.requests == []
+
+
+def test_missing_thumbnail_fails_with_size(qapp, server, tmp_path):
+    _ThumbnailHandler.image = b''
+    loader = _loader(server, tmp_path)
+    try:
+        loader.load('gone', SIZE)
+        _, size, message = _wait_for(loader, 'gone')
+    finally:
+        loader.shutdown()
+
+    assert size == SIZE
+    assert 'HTTP 404' in message
+    assert not (tmp_path / 'gone.jpg').exists()
+
+
+def test_prune_disk_deletes_least_recently_used(qapp, server, tmp_path):
+    now = time.time()
+    for age, video_id in enumerate(('newest', 'middle', 'oldest')):
+        path = tmp_path / f'{video_id}.jpg'
+        path.write_bytes(b'x' * 1000)
+        os.utime(path, (now - age * 60, now - age * 60))
+    loader = _started_loader(server, tmp_path, disk_limit=10000)
+    try:
+        loader.disk_limit = 2500
+        assert loader.prune_disk() == 1
+        assert sorted(path.name for path in tmp_path.iterdir()) == ['middle.jpg', 'newest.jpg']
+
+        # Reading a thumbnail from disk makes it the most recently used
+        assert loader._read_disk('middle') is not None
+        loader.disk_limit = 1000
+        assert loader.prune_disk() == 1
+        assert [path.name for path in tmp_path.iterdir()] == ['middle.jpg']
+    finally:
+        loader.shutdown()
+
+
+def test_loader_prunes_disk_cache_on_start(qapp, server, tmp_path):
+    for video_id in ('a', 'b', 'c'):
+        (tmp_path / f'{video_id}.jpg').write_bytes(b'x' * 1000)
+    loader = _started_loader(server, tmp_path, disk_limit=1500)
+    loader.shutdown()
+    assert len(list(tmp_path.iterdir())) == 1
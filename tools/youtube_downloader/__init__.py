@@ -1,12 +1,33 @@
 """
 YouTube Downloader Tool
 A complete solution for downloading YouTube videos and audio
+
+Submodules are imported on first attribute access so that importing the
+package (as tool discovery does) does not pull in yt_dlp, requests or Qt.
 """
-from .downloader import YouTubeDownloader
-from .window import YouTubeDownloaderWindow
-from .tool import YouTubeDownloaderTool
+
+import importlib
+
+_LAZY_EXPORTS = {
+    'YouTubeDownloader': '.downloader',
+    'YouTubeDownloaderWindow': '.window',
+    'YouTubeDownloaderTool': '.tool',
+}
+
 __all__ = [
     'YouTubeDownloader',
     'YouTubeDownloaderWindow',
     'YouTubeDownloaderTool'
 ]
+
+
+def __getattr__(name):
+    """Import exported classes on first use (PEP 562)"""
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
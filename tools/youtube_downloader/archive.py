@@ -0,0 +1,180 @@
+"""
+YouTube Downloader Archive
+Index of downloaded videos, checked before anything is extracted
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+from yt_dlp.utils import make_archive_id
+
+from core.paths import get_data_directory
+
+
+class DownloadArchive:
+    """
+    SQLite index of downloaded videos, keyed by extractor and video id.
+
+    Keys are yt-dlp archive ids ("youtube dQw4w9WgXcQ"), so the archive
+    behaves like the set yt-dlp accepts as its `download_archive` option
+    (`in`, add(), len()) and converts to and from yt-dlp's archive text
+    file with import_file()/export_file(). Unlike that file it also keeps
+    each video's title, file and download time, and can be queried.
+
+    Video and audio downloads are kept apart by `category`, so having a
+    video does not skip downloading its audio. Database errors are
+    swallowed: without an archive, everything is simply downloaded.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, category: str = 'video'):
+        """
+        Args:
+            db_path: SQLite file (default: youtube_archive.sqlite3 in the data
+                     directory); ':memory:' keeps nothing on disk
+            category: Which downloads this archive covers ('video' or 'audio')
+        """
+        if db_path is None:
+            db_path = str(get_data_directory() / "youtube_archive.sqlite3")
+        self.db_path = db_path
+        self.category = category
+        self._lock = threading.Lock()
+        self._connection = self._open_database()
+
+    def _open_database(self) -> Optional[sqlite3.Connection]:
+        try:
+            connection = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+            connection.row_factory = sqlite3.Row
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS archive ("
+                " category TEXT NOT NULL,"
+                " extractor TEXT NOT NULL,"
+                " video_id TEXT NOT NULL,"
+                " title TEXT,"
+                " filepath TEXT,"
+                " downloaded_at REAL NOT NULL,"
+                " PRIMARY KEY (category, extractor, video_id))"
+            )
+            connection.commit()
+            return connection
+        except sqlite3.Error:
+            return None
+
+    @staticmethod
+    def make_key(extractor: str, video_id: str) -> str:
+        """Archive key of a video, as yt-dlp writes it ("youtube <id>")"""
+        return make_archive_id(extractor, video_id)
+
+    @staticmethod
+    def _split_key(key: str):
+        extractor, _, video_id = key.strip().partition(' ')
+        return extractor.lower(), video_id.strip()
+
+    def _execute(self, sql: str, parameters=(), commit: bool = False) -> List[Dict]:
+        """Run one statement; errors give an empty result"""
+        with self._lock:
+            if self._connection is None:
+                return []
+            try:
+                rows = [dict(row) for row in self._connection.execute(sql, parameters)]
+                if commit:
+                    self._connection.commit()
+                return rows
+            except sqlite3.Error:
+                return []
+
+    def __contains__(self, key: str) -> bool:
+        extractor, video_id = self._split_key(key)
+        return self.get(extractor, video_id) is not None
+
+    def __len__(self) -> int:
+        rows = self._execute("SELECT COUNT(*) AS count FROM archive WHERE category = ?", (self.category,))
+        return rows[0]['count'] if rows else 0
+
+    def __iter__(self) -> Iterator[str]:
+        for entry in self.get_entries():
+            yield self.make_key(entry['extractor'], entry['video_id'])
+
+    def add(self, key: str):
+        """Record an archive key (the set interface yt-dlp uses)"""
+        self.record(*self._split_key(key))
+
+    def discard(self, key: str):
+        """Forget an archive key, so the video is downloaded again"""
+        extractor, video_id = self._split_key(key)
+        self._execute("DELETE FROM archive WHERE category = ? AND extractor = ? AND video_id = ?",
+                      (self.category, extractor, video_id), commit=True)
+
+    def record(self, extractor: str, video_id: str, title: Optional[str] = None,
+               filepath: Optional[str] = None):
+        """Record a downloaded video (again, if it was already recorded)"""
+        self._execute(
+            "INSERT OR REPLACE INTO archive (category, extractor, video_id, title, filepath, downloaded_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (self.category, extractor.lower(), video_id, title, filepath, time.time()), commit=True
+        )
+
+    def get(self, extractor: str, video_id: str) -> Optional[Dict]:
+        """Get a video's archive entry, or None if it was never downloaded"""
+        rows = self._execute(
+            "SELECT * FROM archive WHERE category = ? AND extractor = ? AND video_id = ?",
+            (self.category, extractor.lower(), video_id)
+        )
+        return rows[0] if rows else None
+
+    def get_entries(self, extractor: Optional[str] = None) -> List[Dict]:
+        """Archive entries (optionally of one extractor), oldest first"""
+        if extractor is None:
+            return self._execute("SELECT * FROM archive WHERE category = ? ORDER BY downloaded_at",
+                                 (self.category,))
+        return self._execute(
+            "SELECT * FROM archive WHERE category = ? AND extractor = ? ORDER BY downloaded_at",
+            (self.category, extractor.lower())
+        )
+
+    def import_file(self, path: str) -> int:
+        """
+        Add the keys of a yt-dlp archive file (one "extractor id" per line).
+
+        Returns:
+            int: Number of keys not already in the archive
+        """
+        with open(path, encoding='utf-8') as archive_file:
+            keys = [self._split_key(line) for line in archive_file if line.strip()]
+        now = time.time()
+        before = len(self)
+        self._execute_many(
+            "INSERT OR IGNORE INTO archive (category, extractor, video_id, downloaded_at) VALUES (?, ?, ?, ?)",
+            [(self.category, extractor, video_id, now) for extractor, video_id in keys if video_id]
+        )
+        return len(self) - before
+
+    def export_file(self, path: str) -> int:
+        """
+        Write the archive as a yt-dlp archive file.
+
+        Returns:
+            int: Number of keys written
+        """
+        keys = list(self)
+        with open(path, 'w', encoding='utf-8') as archive_file:
+            archive_file.writelines(f"{key}\n" for key in keys)
+        return len(keys)
+
+    def _execute_many(self, sql: str, rows: List[tuple]):
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._connection.executemany(sql, rows)
+                self._connection.commit()
+            except sqlite3.Error:
+                pass
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,359 @@
+"""
+YouTube Downloader Job Queue
+Run many downloads concurrently on a bounded number of worker threads
+"""
+
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Callable, Deque, Dict, List, Optional
+
+
+class JobStatus:
+    """Download job state constants"""
+    QUEUED = "queued"
+    DOWNLOADING = "downloading"
+    PROCESSING = "processing"
+    FINISHED = "finished"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class DownloadJob:
+    """One URL to download and its live progress"""
+
+    job_id: int
+    url: str
+    download_type: str = 'video'
+    quality: str = 'best'
+    audio_format: str = 'mp3'
+    journal_id: Optional[int] = None  # Row in the downloader's JobJournal
+    skip_archived: bool = True  # False downloads archived videos again
+    status: str = JobStatus.QUEUED
+    percentage: float = 0.0
+    downloaded: int = 0
+    total: int = 0
+    speed: float = 0.0  # bytes per second
+    filename: str = ''
+    result: Optional[Dict] = None
+    # Playlist jobs only
+    items_completed: int = 0
+    items_enumerated: int = 0
+    items_failed: int = 0
+    items_total: Optional[int] = None
+
+    @property
+    def is_playlist(self) -> bool:
+        return self.items_enumerated > 0
+
+    @property
+    def is_done(self) -> bool:
+        return self.status in (JobStatus.FINISHED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class DownloadQueue:
+    """
+    FIFO queue of download jobs run by up to `max_workers` threads.
+
+    Jobs are executed with YouTubeDownloader.download_video/download_audio,
+    each with its own progress callback. Listeners are called with a
+    snapshot (copy) of the DownloadJob whenever it changes, from the worker
+    thread that changed it, so a late update never shows a newer state.
+
+    Every job is recorded in the downloader's journal when submitted; jobs
+    left unfinished by a crash or shutdown are queued again with
+    resume_unfinished().
+    """
+
+    # Minimum time between progress notifications for one job (seconds)
+    PROGRESS_INTERVAL = 0.1
+
+    def __init__(self, downloader, max_workers: int = 3):
+        """
+        Args:
+            downloader: YouTubeDownloader that performs the downloads
+            max_workers: Number of downloads running at the same time
+        """
+        self.downloader = downloader
+        self.max_workers = max(1, max_workers)
+
+        self._jobs: Dict[int, DownloadJob] = {}
+        self._pending: Deque[DownloadJob] = deque()
+        self._active = 0
+        self._job_ids = itertools.count(1)
+        self._listeners: List[Callable[[DownloadJob], None]] = []
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def add_listener(self, listener: Callable[[DownloadJob], None]):
+        """Call `listener(job)` whenever a job is added or changes"""
+        with self._condition:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[DownloadJob], None]):
+        """Stop notifying a previously added listener"""
+        with self._condition:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify(self, job: DownloadJob):
+        with self._condition:
+            listeners = list(self._listeners)
+            snapshot = replace(job)
+        for listener in listeners:
+            listener(snapshot)
+
+    def submit(self, url: str, download_type: str = 'video', quality: str = 'best',
+               audio_format: str = 'mp3', journal_id: Optional[int] = None,
+               skip_archived: bool = True) -> DownloadJob:
+        """
+        Queue a download.
+
+        Args:
+            url: YouTube video or playlist URL
+            download_type: 'video' or 'audio'
+            quality: Video quality preference (see download_video)
+            audio_format: Audio format for audio jobs (see download_audio)
+            journal_id: Journaled job to resume (default: journal a new one)
+            skip_archived: Skip videos in the download archive (see download_video)
+
+        Returns:
+            DownloadJob: The queued job
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Download queue has been shut down")
+        if journal_id is None:
+            journal_id = self.downloader.journal.create_job(
+                url, download_type, self.downloader.download_directory,
+                quality=quality, audio_format=audio_format if download_type == 'audio' else None,
+                skip_archived=skip_archived
+            )
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Download queue has been shut down")
+            job = DownloadJob(next(self._job_ids), url, download_type, quality, audio_format, journal_id,
+                              skip_archived=skip_archived)
+            self._jobs[job.job_id] = job
+            self._pending.append(job)
+
+        self._notify(job)
+        self._dispatch()
+        return job
+
+    def resume_unfinished(self) -> List[DownloadJob]:
+        """
+        Queue the journal's unfinished jobs that are not already queued.
+
+        Their finished entries are skipped and partial files continued.
+
+        Returns:
+            List[DownloadJob]: The resumed jobs
+        """
+        with self._condition:
+            known = {job.journal_id for job in self._jobs.values() if job.journal_id is not None}
+        resumed = []
+        for record in self.downloader.journal.get_unfinished_jobs():
+            if record['job_id'] in known:
+                continue
+            resumed.append(self.submit(
+                record['url'], record['download_type'], record['quality'] or 'best',
+                record['audio_format'] or 'mp3', journal_id=record['job_id'],
+                skip_archived=bool(record['skip_archived'])
+            ))
+        return resumed
+
+    def get_resumable_count(self) -> int:
+        """Number of unfinished journal jobs resume_unfinished() would queue"""
+        with self._condition:
+            known = {job.journal_id for job in self._jobs.values() if job.journal_id is not None}
+        return sum(1 for record in self.downloader.journal.get_unfinished_jobs()
+                   if record['job_id'] not in known)
+
+    def set_max_workers(self, max_workers: int):
+        """Change the number of parallel downloads (running jobs are not interrupted)"""
+        with self._condition:
+            self.max_workers = max(1, max_workers)
+        self._dispatch()
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a job that has not started yet"""
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JobStatus.QUEUED:
+                return False
+            self._pending.remove(job)
+            job.status = JobStatus.CANCELLED
+            self._condition.notify_all()
+
+        if job.journal_id is not None:
+            self.downloader.journal.set_job_status(job.journal_id, JobStatus.CANCELLED)
+        self._notify(job)
+        return True
+
+    def _dispatch(self):
+        """Start queued jobs while there are free workers"""
+        while True:
+            with self._condition:
+                if not self._pending or self._active >= self.max_workers:
+                    return
+                job = self._pending.popleft()
+                job.status = JobStatus.DOWNLOADING
+                self._active += 1
+
+            self._notify(job)
+            worker = threading.Thread(
+                target=self._run_job, args=(job,),
+                name=f"download-job-{job.job_id}", daemon=True
+            )
+            worker.start()
+
+    def _run_job(self, job: DownloadJob):
+        """Download one job on a worker thread"""
+        progress_callback = self._make_progress_callback(job)
+        try:
+            if job.download_type == 'audio':
+                result = self.downloader.download_audio(
+                    job.url, job.audio_format, progress_callback=progress_callback,
+                    journal_id=job.journal_id, skip_archived=job.skip_archived
+                )
+            else:
+                result = self.downloader.download_video(
+                    job.url, job.quality, progress_callback=progress_callback,
+                    journal_id=job.journal_id, skip_archived=job.skip_archived
+                )
+        except Exception as error:
+            result = {'status': 'error', 'message': f'Unexpected error: {str(error)}'}
+
+        with self._condition:
+            job.result = result
+            job.speed = 0.0
+            if result.get('status') == 'success':
+                job.status = JobStatus.FINISHED
+                job.percentage = 100.0
+            else:
+                job.status = JobStatus.FAILED
+            self._active -= 1
+            self._condition.notify_all()
+
+        self._notify(job)
+        self._dispatch()
+
+    def _make_progress_callback(self, job: DownloadJob) -> Callable[[Dict], None]:
+        """
+        Build a progress callback that updates `job` and throttles notifications.
+
+        Playlist items download in parallel and report with an 'item'
+        index; their progress and speed are combined into the job's.
+        """
+        last_notified = [0.0]
+        item_progress: Dict[Optional[int], float] = {}
+        item_speed: Dict[Optional[int], float] = {}
+
+        def on_progress(progress_data: Dict):
+            item = progress_data.get('item')
+
+            # The queue's lock, so snapshots in _notify never see a half-applied update
+            with self._condition:
+                if progress_data['status'] == 'downloading':
+                    item_progress[item] = progress_data['percentage']
+                    item_speed[item] = progress_data.get('speed_bytes') or 0.0
+                    job.status = JobStatus.DOWNLOADING
+                    job.speed = sum(item_speed.values())
+                    job.downloaded = progress_data['downloaded']
+                    job.total = progress_data['total']
+                    if job.items_total:
+                        # Whole-playlist progress: finished items plus those in flight
+                        in_flight = sum(item_progress.values()) / 100
+                        job.percentage = min((job.items_completed + in_flight) / job.items_total * 100, 100.0)
+                    else:
+                        job.percentage = progress_data['percentage']
+
+                    now = time.monotonic()
+                    if now - last_notified[0] < self.PROGRESS_INTERVAL:
+                        return
+                    last_notified[0] = now
+
+                elif progress_data['status'] == 'finished':
+                    item_speed.pop(item, None)
+                    job.speed = sum(item_speed.values())
+                    if not item_speed:
+                        job.status = JobStatus.PROCESSING
+                    job.filename = progress_data.get('filename', '')
+
+                elif progress_data['status'] == 'playlist':
+                    # `item` is the playlist item that just completed or failed
+                    item_progress.pop(item, None)
+                    item_speed.pop(item, None)
+                    job.items_completed = progress_data['completed']
+                    job.items_enumerated = progress_data['enumerated']
+                    job.items_failed = progress_data.get('failed', 0)
+                    job.items_total = progress_data['total']
+
+            self._notify(job)
+
+        return on_progress
+
+    def get_job(self, job_id: int) -> Optional[DownloadJob]:
+        """Get a job by ID"""
+        return self._jobs.get(job_id)
+
+    def get_jobs(self) -> List[DownloadJob]:
+        """Get all jobs in submission order"""
+        with self._condition:
+            return list(self._jobs.values())
+
+    def get_active_count(self) -> int:
+        """Number of jobs currently running"""
+        with self._condition:
+            return self._active
+
+    def get_pending_count(self) -> int:
+        """Number of jobs waiting for a worker"""
+        with self._condition:
+            return len(self._pending)
+
+    def has_unfinished_jobs(self) -> bool:
+        """Check whether any job is running or waiting"""
+        with self._condition:
+            return self._active > 0 or bool(self._pending)
+
+    def get_aggregate_speed(self) -> float:
+        """Combined download speed of all running jobs in bytes per second"""
+        with self._condition:
+            return sum(job.speed for job in self._jobs.values()
+                       if job.status == JobStatus.DOWNLOADING)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every job has finished.
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._active == 0 and not self._pending, timeout
+            )
+
+    def shutdown(self):
+        """
+        Cancel queued jobs and refuse new ones; running downloads finish.
+
+        Cancelled jobs stay unfinished in the journal, so they can be
+        resumed next time.
+        """
+        with self._condition:
+            self._closed = True
+            cancelled = list(self._pending)
+            self._pending.clear()
+            for job in cancelled:
+                job.status = JobStatus.CANCELLED
+            self._condition.notify_all()
+
+        for job in cancelled:
+            self._notify(job)
@@ -4,20 +4,77 @@ Handles video/audio downloading using yt-dlp with progress tracking
 """
 
 import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import yt_dlp
+from yt_dlp.utils import PlaylistEntries
+
+from core.http_client import HttpClient
+from .archive import DownloadArchive
+from .download_queue import JobStatus
+from .formats import (
+    AUDIO_BITRATES, AUDIO_FORMATS, DEFAULT_AUDIO_FORMAT, FORMAT_SORT,
+    build_format_selector, estimate_format_size, select_formats
+)
+from .journal import JobJournal
+from .metadata_cache import MetadataCache
+from .transcoder import Conversion, TranscodePool
 
 
 class YouTubeDownloader:
     """Core YouTube downloader class with progress tracking"""
 
-    def __init__(self, download_directory: Optional[str] = None):
+    # Resolve URLs without expanding playlist entries; entries are
+    # enumerated page by page and each video is extracted on demand
+    FLAT_OPTIONS = {
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': 'in_playlist',
+        'lazy_playlist': True,
+    }
+
+    # Playlist items downloaded at the same time
+    PLAYLIST_WORKERS = 3
+
+    # Extra attempts for a playlist item that fails, and the first delay
+    # between attempts in seconds (doubled for each further attempt)
+    ITEM_RETRIES = 2
+    RETRY_BACKOFF = 1.0
+
+    # Playlist entries returned by get_video_info for the preview
+    PLAYLIST_PREVIEW_LIMIT = 1000
+
+    def __init__(self, download_directory: Optional[str] = None,
+                 metadata_cache: Optional[MetadataCache] = None,
+                 playlist_workers: int = PLAYLIST_WORKERS,
+                 item_retries: int = ITEM_RETRIES,
+                 http_client: Optional[HttpClient] = None,
+                 transcode_pool: Optional[TranscodePool] = None,
+                 journal: Optional[JobJournal] = None,
+                 archives: Optional[Dict[str, DownloadArchive]] = None):
         """
         Initialize the YouTube downloader
 
         Args:
             download_directory: Directory to save downloads (defaults to ~/Downloads/YouTube)
+            metadata_cache: Cache of extracted video info (defaults to the
+                            shared on-disk cache in the OmniTool data directory)
+            playlist_workers: Playlist items downloaded in parallel
+            item_retries: Extra attempts for a failing playlist item
+            http_client: Pooled HTTP client for side fetches such as
+                         thumbnails (defaults to a new one sized to
+                         playlist_workers)
+            transcode_pool: Pool converting downloaded audio (defaults to
+                            one ffmpeg process per CPU core)
+            journal: Persistent record of jobs for resuming after a restart
+                     (defaults to the shared journal in the data directory)
+            archives: DownloadArchive per download type ('video', 'audio');
+                      archived videos are skipped (defaults to the shared
+                      archive in the data directory)
         """
         if download_directory is None:
             home = Path.home()
@@ -27,41 +84,65 @@ class YouTubeDownloader:
 
         os.makedirs(self.download_directory, exist_ok=True)
         self._progress_callback = None
+        self.playlist_workers = max(1, playlist_workers)
+        self.item_retries = item_retries
+        self.metadata_cache = metadata_cache if metadata_cache is not None else MetadataCache()
+        self.metadata_cache.prune()
+        self.http_client = http_client or HttpClient(pool_size=self.playlist_workers)
+        self.transcode_pool = transcode_pool or TranscodePool()
+        self.journal = journal if journal is not None else JobJournal()
+        self.journal.prune()
+        self.archives = archives if archives is not None else {
+            download_type: DownloadArchive(category=download_type) for download_type in ('video', 'audio')
+        }
 
     def set_progress_callback(self, callback: Callable[[Dict], None]):
         """Set a callback function to receive progress updates"""
         self._progress_callback = callback
 
-    def _progress_hook(self, progress_data: Dict):
-        """Internal progress hook for yt-dlp"""
-        if progress_data['status'] == 'downloading':
-            total_bytes = (progress_data.get('total_bytes') or
-                          progress_data.get('total_bytes_estimate') or 0)
-            downloaded_bytes = progress_data.get('downloaded_bytes', 0)
-            speed = progress_data.get('speed', 0)
-            eta = progress_data.get('eta', 0)
-
-            percentage = (downloaded_bytes / total_bytes * 100) if total_bytes > 0 else 0
-            speed_str = f"{self._format_bytes(speed)}/s" if speed else 'N/A'
+    def _make_progress_hook(self, callback: Optional[Callable[[Dict], None]] = None):
+        """
+        Build a yt-dlp progress hook reporting to `callback`.
 
-            if self._progress_callback:
-                self._progress_callback({
+        Without a callback, the one from set_progress_callback is used.
+        A callback per download lets concurrent downloads report separately.
+        """
+        def progress_hook(progress_data: Dict):
+            target = callback or self._progress_callback
+            if target is None:
+                return
+
+            if progress_data['status'] == 'downloading':
+                total_bytes = (progress_data.get('total_bytes') or
+                              progress_data.get('total_bytes_estimate') or 0)
+                downloaded_bytes = progress_data.get('downloaded_bytes', 0)
+                speed = progress_data.get('speed', 0)
+                eta = progress_data.get('eta', 0)
+
+                percentage = (downloaded_bytes / total_bytes * 100) if total_bytes > 0 else 0
+                speed_str = f"{self.format_bytes(speed)}/s" if speed else 'N/A'
+
+                target({
                     'status': 'downloading',
                     'percentage': percentage,
                     'downloaded': downloaded_bytes,
                     'total': total_bytes,
                     'speed': speed_str,
-                    'eta': eta
+                    'speed_bytes': speed or 0,
+                    'eta': eta,
+                    'tmpfilename': progress_data.get('tmpfilename'),
+                    'format_id': (progress_data.get('info_dict') or {}).get('format_id')
                 })
 
-        elif progress_data['status'] == 'finished':
-            if self._progress_callback:
-                self._progress_callback({
+            elif progress_data['status'] == 'finished':
+                target({
                     'status': 'finished',
                     'filename': progress_data.get('filename', 'Unknown')
                 })
 
-    def _format_bytes(self, byte_size: float) -> str:
+        return progress_hook
+
+    def format_bytes(self, byte_size: float) -> str:
         """Format bytes to human readable format"""
         for unit in ['B', 'KB', 'MB', 'GB']:
             if byte_size < 1024.0:
@@ -69,22 +150,36 @@ class YouTubeDownloader:
             byte_size /= 1024.0
         return f"{byte_size:.2f} TB"
 
-    def download_video(self, url: str, quality: str = 'best') -> Dict:
+    def download_video(self, url: str, quality: str = 'best',
+                       progress_callback: Optional[Callable[[Dict], None]] = None,
+                       journal_id: Optional[int] = None, skip_archived: bool = True) -> Dict:
         """
         Download video in specified quality
 
         Args:
             url: YouTube video or playlist URL
-            quality: Quality preference ('best', '2160p', '1440p', '1080p', '720p', '480p', '360p', '240p')
+            quality: Quality preference ('best', '2160p', '1440p', '1080p', '720p', '480p', '360p', '240p'
+                     or a selector label such as '720p (HD)'); caps the video height
+            progress_callback: Receives progress updates for this download only
+            journal_id: Journal job to run (or resume); a new one is
+                        created if not given
+            skip_archived: Skip videos in the download archive; if False
+                           they are downloaded again (in any quality or
+                           directory) and still recorded
 
         Returns:
             dict: Download result with status and message
         """
+        format_selector = build_format_selector(quality)
+        journal_id, directory = self._begin_job(journal_id, url, 'video', format_selector, quality=quality,
+                                                skip_archived=skip_archived)
+        progress_callback = self._journal_progress(journal_id, progress_callback)
         try:
             options = {
-                'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
-                'outtmpl': os.path.join(self.download_directory, '%(title)s.%(ext)s'),
-                'progress_hooks': [self._progress_hook],
+                'format': format_selector,
+                'format_sort': FORMAT_SORT,
+                'outtmpl': os.path.join(directory, '%(title)s.%(ext)s'),
+                'progress_hooks': [self._make_progress_hook(progress_callback)],
                 'quiet': False,
                 'no_warnings': False,
                 'ignoreerrors': False,
@@ -92,83 +187,176 @@ class YouTubeDownloader:
                 'nooverwrites': True,
             }
 
-            with yt_dlp.YoutubeDL(options) as ydl:
-                info = ydl.extract_info(url, download=False)
-
-                is_playlist = 'entries' in info
-                video_count = len(list(info['entries'])) if is_playlist else 1
-
-                ydl.download([url])
-
-                return {
-                    'status': 'success',
-                    'message': f'Successfully downloaded {video_count} video(s)',
-                    'is_playlist': is_playlist,
-                    'count': video_count
-                }
+            is_playlist, video_count, failures, skipped = self._download(
+                url, options, progress_callback, journal_id=journal_id, archive=self.archives.get('video'),
+                skip_archived=skip_archived
+            )
+            return self._end_job(journal_id, self._build_result('video(s)', is_playlist, video_count,
+                                                                failures, skipped))
 
         except yt_dlp.utils.DownloadError as error:
-            return {
+            return self._end_job(journal_id, {
                 'status': 'error',
                 'message': f'Download error: {str(error)}'
-            }
+            })
         except Exception as error:
-            return {
+            return self._end_job(journal_id, {
                 'status': 'error',
                 'message': f'Unexpected error: {str(error)}'
-            }
+            })
 
-    def download_audio(self, url: str) -> Dict:
+    def download_audio(self, url: str, audio_format: str = DEFAULT_AUDIO_FORMAT,
+                       progress_callback: Optional[Callable[[Dict], None]] = None,
+                       journal_id: Optional[int] = None, skip_archived: bool = True) -> Dict:
         """
-        Download audio only in MP3 format
+        Download audio only
+
+        The best stream already in the requested codec is preferred, so it
+        can be kept as is or only remuxed; other sources are re-encoded.
+        Each file is handed to the transcode pool as soon as it is
+        downloaded, so converting one item overlaps downloading the next.
 
         Args:
             url: YouTube video or playlist URL
+            audio_format: 'm4a', 'opus' or 'mp3' (see AUDIO_FORMATS)
+            progress_callback: Receives progress updates for this download only
+            journal_id: Journal job to run (or resume), as for download_video
+            skip_archived: Skip archived videos, as for download_video
 
         Returns:
-            dict: Download result with status and message
+            dict: Download result with status and message; 'files' lists
+            each file with the Conversion it took
         """
+        if audio_format not in AUDIO_FORMATS:
+            return {'status': 'error', 'message': f'Unsupported audio format: {audio_format}'}
+
+        format_selector = build_format_selector(audio_only=True, audio_format=audio_format)
+        journal_id, directory = self._begin_job(journal_id, url, 'audio', format_selector,
+                                                audio_format=audio_format, skip_archived=skip_archived)
+        progress_callback = self._journal_progress(journal_id, progress_callback)
         try:
             options = {
-                'format': 'bestaudio/best',
-                'outtmpl': os.path.join(self.download_directory, '%(title)s.%(ext)s'),
-                'progress_hooks': [self._progress_hook],
+                'format': format_selector,
+                'format_sort': FORMAT_SORT,
+                'outtmpl': os.path.join(directory, '%(title)s.%(ext)s'),
+                'progress_hooks': [self._make_progress_hook(progress_callback)],
                 'quiet': False,
                 'no_warnings': False,
                 'ignoreerrors': False,
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '192',
-                }],
                 'nooverwrites': True,
             }
 
-            with yt_dlp.YoutubeDL(options) as ydl:
-                info = ydl.extract_info(url, download=False)
-
-                is_playlist = 'entries' in info
-                audio_count = len(list(info['entries'])) if is_playlist else 1
-
-                ydl.download([url])
-
-                return {
-                    'status': 'success',
-                    'message': f'Successfully downloaded {audio_count} audio file(s)',
-                    'is_playlist': is_playlist,
-                    'count': audio_count
-                }
+            conversions = []
+
+            def hand_off(filepath: str, item: Optional[int]) -> Future:
+                future = self.transcode_pool.convert_audio(filepath, audio_format)
+                if journal_id is not None:
+                    future.add_done_callback(lambda done: self._journal_conversion(journal_id, item, done))
+                conversions.append((item, filepath, future))
+                return future
+
+            is_playlist, audio_count, failures, skipped = self._download(
+                url, options, progress_callback, hand_off, journal_id, self.archives.get('audio'),
+                skip_archived
+            )
+            audio_count, failures, files = self._collect_conversions(conversions, audio_count, failures)
+            result = self._build_result('audio file(s)', is_playlist, audio_count, failures, skipped)
+            result['files'] = files
+            if result['status'] == 'success' and files:
+                result['message'] += f' ({self.describe_conversions(files)})'
+            return self._end_job(journal_id, result)
 
         except yt_dlp.utils.DownloadError as error:
-            return {
+            return self._end_job(journal_id, {
                 'status': 'error',
                 'message': f'Download error: {str(error)}'
-            }
+            })
         except Exception as error:
-            return {
+            return self._end_job(journal_id, {
                 'status': 'error',
                 'message': f'Unexpected error: {str(error)}'
-            }
+            })
+
+    def _begin_job(self, journal_id: Optional[int], url: str, download_type: str,
+                   format_selector: str, quality: Optional[str] = None,
+                   audio_format: Optional[str] = None,
+                   skip_archived: bool = True) -> Tuple[Optional[int], str]:
+        """
+        Mark a journal job as running, creating it if needed.
+
+        Returns:
+            (journal job id or None without a journal, download directory);
+            a resumed job keeps the directory it was queued with, so its
+            partial files are found again
+        """
+        if journal_id is None:
+            journal_id = self.journal.create_job(url, download_type, self.download_directory,
+                                                 quality=quality, audio_format=audio_format,
+                                                 skip_archived=skip_archived)
+        job = self.journal.get_job(journal_id) if journal_id is not None else None
+        if job is None:
+            return None, self.download_directory
+
+        self.journal.set_job_status(journal_id, JobStatus.DOWNLOADING, format_selector=format_selector)
+        os.makedirs(job['download_directory'], exist_ok=True)
+        return journal_id, job['download_directory']
+
+    def _end_job(self, journal_id: Optional[int], result: Dict) -> Dict:
+        """Record a job's result in the journal and return the result"""
+        if journal_id is not None:
+            status = JobStatus.FINISHED if result.get('status') == 'success' else JobStatus.FAILED
+            self.journal.set_job_status(journal_id, status, result.get('message'))
+        return result
+
+    def _journal_progress(self, journal_id: Optional[int],
+                          progress_callback: Optional[Callable[[Dict], None]]) -> Optional[Callable[[Dict], None]]:
+        """Wrap a progress callback so each item's format and .part file are journaled"""
+        if journal_id is None:
+            return progress_callback
+        recorded = set()
+
+        def on_progress(progress_data: Dict):
+            if progress_data['status'] == 'downloading' and progress_data.get('tmpfilename'):
+                item = progress_data.get('item', JobJournal.VIDEO_ITEM)
+                key = (item, progress_data['tmpfilename'])
+                if key not in recorded:
+                    recorded.add(key)
+                    self.journal.update_entry(journal_id, item, status=JobStatus.DOWNLOADING,
+                                              part_path=progress_data['tmpfilename'],
+                                              format_id=progress_data.get('format_id'))
+            target = progress_callback or self._progress_callback
+            if target is not None:
+                target(progress_data)
+
+        return on_progress
+
+    def _journal_conversion(self, journal_id: int, item: Optional[int], future: Future):
+        """Journal the outcome of an entry's audio conversion"""
+        item = JobJournal.VIDEO_ITEM if item is None else item
+        try:
+            converted = future.result()
+        except Exception as error:
+            self.journal.update_entry(journal_id, item, status=JobStatus.FAILED, error=str(error))
+            return
+        self.journal.update_entry(journal_id, item, status=JobStatus.FINISHED, filepath=converted['filepath'])
+
+    def resume_job(self, journal_id: int,
+                   progress_callback: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Run an unfinished journal job again.
+
+        Finished entries are skipped without being extracted, and partial
+        (.part) files in the job's directory are continued.
+        """
+        job = self.journal.get_job(journal_id)
+        if job is None:
+            return {'status': 'error', 'message': f'No journaled job {journal_id}'}
+        skip_archived = bool(job['skip_archived'])
+        if job['download_type'] == 'audio':
+            return self.download_audio(job['url'], job['audio_format'] or DEFAULT_AUDIO_FORMAT,
+                                       progress_callback, journal_id, skip_archived)
+        return self.download_video(job['url'], job['quality'] or 'best', progress_callback, journal_id,
+                                   skip_archived)
 
     def get_video_info(self, url: str) -> Dict:
         """
@@ -181,40 +369,475 @@ class YouTubeDownloader:
             dict: Video information or error
         """
         try:
-            options = {
-                'quiet': True,
-                'no_warnings': True,
-            }
-
-            with yt_dlp.YoutubeDL(options) as ydl:
-                info = ydl.extract_info(url, download=False)
-
-                if 'entries' in info:
-                    # Playlist
+            with self._resolve(url) as (info, entries):
+                if entries is not None:
+                    # Playlist: list the flat entries for the preview (a
+                    # complete listing is cached for the download)
+                    count = info.get('playlist_count')
+                    listed = 0
+                    preview = []
+                    for index, entry in entries:
+                        listed += 1
+                        if len(preview) < self.PLAYLIST_PREVIEW_LIMIT:
+                            preview.append({
+                                'playlist_index': index,
+                                'id': entry.get('id'),
+                                'extractor': entry.get('ie_key') or entry.get('extractor_key', ''),
+                                'title': entry.get('title') or entry.get('id') or 'Unknown',
+                                'duration': entry.get('duration'),
+                            })
+                        elif count is not None:
+                            break
                     return {
                         'status': 'success',
                         'type': 'playlist',
                         'title': info.get('title', 'Unknown Playlist'),
-                        'count': len(list(info['entries'])),
-                        'uploader': info.get('uploader', 'Unknown')
-                    }
-                else:
-                    # Single video
-                    return {
-                        'status': 'success',
-                        'type': 'video',
-                        'title': info.get('title', 'Unknown'),
-                        'duration': info.get('duration', 0),
+                        'count': count if count is not None else listed,
                         'uploader': info.get('uploader', 'Unknown'),
-                        'view_count': info.get('view_count', 0)
+                        'entries': preview
                     }
 
+            # Single video
+            return {
+                'status': 'success',
+                'type': 'video',
+                'id': info.get('id'),
+                'extractor': info.get('extractor_key', ''),
+                'title': info.get('title', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'uploader': info.get('uploader', 'Unknown'),
+                'view_count': info.get('view_count', 0)
+            }
+
         except Exception as error:
             return {
                 'status': 'error',
                 'message': f'Invalid URL or connection error: {str(error)}'
             }
 
+    def estimate_download(self, url: str, quality: str = 'best', download_type: str = 'video',
+                          audio_format: str = DEFAULT_AUDIO_FORMAT) -> Dict:
+        """
+        Pick the formats a download would use and estimate its size.
+
+        Works from the metadata cache only (call get_video_info first), so
+        it never touches the network.
+
+        Args:
+            url: YouTube video URL
+            quality: Quality preference, as for download_video
+            download_type: 'video' or 'audio'
+            audio_format: Audio format, as for download_audio
+
+        Returns:
+            dict: {'status', 'format_id', 'resolution', 'size'} where size
+            is in bytes, or None if it cannot be estimated
+        """
+        info = self.metadata_cache.get(url)
+        if info is None or self._is_playlist(info):
+            return {'status': 'error', 'message': 'No cached formats for this URL'}
+
+        selected = select_formats(info, build_format_selector(quality, download_type == 'audio', audio_format))
+        if not selected:
+            return {'status': 'error', 'message': 'Requested format is not available'}
+
+        chosen = selected[0]
+        duration = info.get('duration')
+        if download_type == 'audio':
+            acodec = chosen.get('acodec')
+            if acodec and acodec.startswith(AUDIO_FORMATS[audio_format][0]):
+                # Kept without re-encoding: the stream's own size and bitrate
+                size = estimate_format_size(chosen, duration)
+                bitrate = round(chosen['abr']) if chosen.get('abr') else '?'
+                resolution = f'{audio_format.upper()} {bitrate} kbps, no re-encode'
+            else:
+                bitrate = AUDIO_BITRATES[audio_format]
+                size = int(duration * bitrate * 1000 / 8) if duration else None
+                # Without a known codec, ffprobe decides after the download
+                resolution = f'{audio_format.upper()} {bitrate} kbps' + (', re-encoded' if acodec else '')
+        else:
+            size = estimate_format_size(chosen, duration)
+            resolution = chosen.get('resolution') or (
+                f"{chosen.get('width')}x{chosen.get('height')}" if chosen.get('height') else 'unknown'
+            )
+
+        return {
+            'status': 'success',
+            'format_id': chosen.get('format_id'),
+            'resolution': resolution,
+            'size': size
+        }
+
+    @contextmanager
+    def _resolve(self, url: str):
+        """
+        Resolve a URL with a single flat extraction.
+
+        Yields:
+            (info, entries): For a video, its unprocessed info dict and None.
+            For a playlist, its info dict and an iterator of
+            (index, flat entry) pairs that fetches further pages only as it
+            is consumed. A fully consumed listing is cached.
+        """
+        info = self.metadata_cache.get(url)
+        if info is not None:
+            entries = None
+            if self._is_playlist(info):
+                # Original indexes: the listing may have skipped unavailable entries
+                entries = ((entry.get('playlist_index') or position, entry)
+                           for position, entry in enumerate(info['entries'], 1))
+            yield info, entries
+            return
+
+        with yt_dlp.YoutubeDL(self.FLAT_OPTIONS) as ydl:
+            info = ydl.extract_info(url, download=False, process=False)
+            while info.get('_type') in ('url', 'url_transparent'):
+                # e.g. a channel URL redirecting to its videos tab
+                info = ydl.extract_info(info['url'], download=False, process=False,
+                                        ie_key=info.get('ie_key'))
+
+            if not self._is_playlist(info):
+                yield self.metadata_cache.put(url, info), None
+                return
+
+            yield info, self._stream_entries(ydl, url, info)
+
+    def _stream_entries(self, ydl: yt_dlp.YoutubeDL, url: str,
+                        info: Dict) -> Iterator[Tuple[int, Dict]]:
+        """Enumerate a playlist lazily, caching the listing once complete"""
+        listed = []
+        for index, entry in PlaylistEntries(ydl, info).get_requested_items():
+            if not entry:
+                continue
+            listed.append(dict(entry, playlist_index=index))
+            yield index, entry
+        self.metadata_cache.put(url, dict(info, entries=listed))
+
+    @staticmethod
+    def _is_playlist(info: Dict) -> bool:
+        return info.get('_type') in ('playlist', 'multi_video') or 'entries' in info
+
+    def _download(self, url: str, options: Dict,
+                  progress_callback: Optional[Callable[[Dict], None]],
+                  on_file: Optional[Callable[[str, Optional[int]], Optional[Future]]] = None,
+                  journal_id: Optional[int] = None,
+                  archive: Optional[DownloadArchive] = None, skip_archived: bool = True
+                  ) -> Tuple[bool, int, List[Dict], int]:
+        """
+        Download a video, or stream a playlist into a bounded pool.
+
+        `on_file(filepath, item)` is called on the download thread with
+        each finished file (item is the playlist index, None for a video);
+        it may return a Future of further work on the file. With a
+        `journal_id`, entries the journal already has as finished are
+        skipped before anything is extracted, and so are videos in
+        `archive` unless `skip_archived` is False; downloaded videos are
+        added to `archive` once done either way.
+
+        Returns:
+            (is_playlist, number of downloaded items, failed items,
+            number of items skipped as already archived)
+        """
+        finished = self.journal.get_finished_items(journal_id) if journal_id is not None else set()
+        if JobJournal.VIDEO_ITEM in finished:
+            # Only single-video jobs have this item; playlists count from 1
+            return False, 1, [], 0
+        on_file = self._journal_files(journal_id, on_file)
+
+        with self._resolve(url) as (info, entries):
+            if entries is None:
+                if skip_archived and self._is_archived(archive, info):
+                    return False, 0, [], 1
+                if journal_id is not None:
+                    self.journal.add_entry(journal_id, JobJournal.VIDEO_ITEM, info.get('id'),
+                                           url, info.get('title'))
+                handed_off = []
+                if on_file is not None:
+                    options = dict(options, post_hooks=[
+                        lambda filepath: handed_off.append(on_file(filepath, None))
+                    ])
+                try:
+                    with yt_dlp.YoutubeDL(options) as ydl:
+                        downloaded = self._extract_and_download(ydl, url, info)
+                except Exception as error:
+                    if journal_id is not None:
+                        self.journal.update_entry(journal_id, JobJournal.VIDEO_ITEM,
+                                                  status=JobStatus.FAILED, error=str(error))
+                    raise
+                self._archive_download(archive, downloaded, handed_off)
+                return False, 1, [], 0
+
+            completed, failures, skipped = self._download_playlist(
+                entries, info.get('playlist_count'), options, progress_callback, on_file,
+                journal_id, finished, archive, skip_archived
+            )
+            return True, completed, failures, skipped
+
+    @staticmethod
+    def _is_archived(archive: Optional[DownloadArchive], info: Dict) -> bool:
+        """
+        Check a video, resolved or a flat playlist entry, against the archive.
+
+        The record alone decides: files may since have been moved, renamed
+        or converted, so they are not looked for.
+        """
+        extractor = info.get('extractor_key') or info.get('ie_key')
+        if archive is None or not extractor or not info.get('id'):
+            return False
+        return archive.get(extractor, info['id']) is not None
+
+    @staticmethod
+    def _archive_download(archive: Optional[DownloadArchive], info: Optional[Dict],
+                          handed_off: List[Optional[Future]]):
+        """Record a downloaded video, after the work handed off on its file succeeds"""
+        extractor = (info or {}).get('extractor_key')
+        if archive is None or not extractor or not info.get('id'):
+            return
+        downloads = info.get('requested_downloads') or [info]
+        filepath = downloads[-1].get('filepath')
+        pending = [future for future in handed_off if future is not None]
+        if not pending:
+            archive.record(extractor, info['id'], info.get('title'), filepath)
+            return
+
+        def on_done(future: Future):
+            if future.exception() is None:
+                result = future.result()
+                archive.record(extractor, info['id'], info.get('title'),
+                               result.get('filepath', filepath) if isinstance(result, dict) else filepath)
+
+        pending[-1].add_done_callback(on_done)
+
+    def _journal_files(self, journal_id: Optional[int],
+                       on_file: Optional[Callable[[str, Optional[int]], Optional[Future]]]
+                       ) -> Optional[Callable[[str, Optional[int]], Optional[Future]]]:
+        """
+        Wrap `on_file` so each finished file is journaled: FINISHED, or
+        PROCESSING when `on_file` still has work to do on it.
+        """
+        if journal_id is None:
+            return on_file
+
+        def journal_file(filepath: str, item: Optional[int]) -> Optional[Future]:
+            self.journal.update_entry(
+                journal_id, JobJournal.VIDEO_ITEM if item is None else item, filepath=filepath,
+                status=JobStatus.FINISHED if on_file is None else JobStatus.PROCESSING
+            )
+            return on_file(filepath, item) if on_file is not None else None
+
+        return journal_file
+
+    def _download_playlist(self, entries: Iterator[Tuple[int, Dict]], total: Optional[int],
+                           options: Dict, progress_callback: Optional[Callable[[Dict], None]],
+                           on_file: Optional[Callable[[str, Optional[int]], Optional[Future]]] = None,
+                           journal_id: Optional[int] = None, finished: Iterable[int] = (),
+                           archive: Optional[DownloadArchive] = None, skip_archived: bool = True
+                           ) -> Tuple[int, List[Dict], int]:
+        """
+        Download playlist items on up to `playlist_workers` threads.
+
+        Items are submitted as they are enumerated, at most two per worker
+        ahead, so a long listing is never materialized. Every item gets its
+        own YoutubeDL and retries; a failed item is recorded and the rest of
+        the playlist continues. `progress_callback` receives per-item
+        progress (with an 'item' index) and {'status': 'playlist', ...}
+        updates with the running counts. Indexes in `finished` (from the
+        journal) and, with `skip_archived`, entries in `archive` count as
+        done without being extracted.
+
+        Returns:
+            (number of downloaded items, failed items as {'index', 'title', 'error'},
+            number of archived items skipped)
+        """
+        lock = threading.Lock()
+        counts = {'completed': 0, 'enumerated': 0}
+        skipped = 0
+        failures: List[Dict] = []
+
+        def report(item: Optional[int] = None, listed_total: Optional[int] = total):
+            with lock:
+                update = dict(counts, failed=len(failures), total=listed_total, item=item)
+            self._report_playlist_progress(progress_callback, update)
+
+        def run_item(index: int, entry: Dict):
+            error = self._download_playlist_item(index, entry, options, progress_callback, on_file, archive)
+            if error is not None and journal_id is not None:
+                self.journal.update_entry(journal_id, index, status=JobStatus.FAILED, error=error)
+            with lock:
+                if error is None:
+                    counts['completed'] += 1
+                else:
+                    failures.append({'index': index, 'title': entry.get('title') or entry.get('id'),
+                                     'error': error})
+            report(item=index)
+
+        with ThreadPoolExecutor(self.playlist_workers, thread_name_prefix='playlist-item') as pool:
+            in_flight = set()
+            for index, entry in entries:
+                with lock:
+                    counts['enumerated'] += 1
+                    if index in finished:
+                        counts['completed'] += 1
+                if index in finished:
+                    report(item=index)
+                    continue
+                if skip_archived and self._is_archived(archive, entry):
+                    with lock:
+                        counts['completed'] += 1
+                        skipped += 1
+                    report(item=index)
+                    continue
+                if journal_id is not None:
+                    self.journal.add_entry(journal_id, index, entry.get('id'),
+                                           entry.get('url'), entry.get('title'))
+                in_flight.add(pool.submit(run_item, index, entry))
+                report()
+                if len(in_flight) >= self.playlist_workers * 2:
+                    _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            wait(in_flight)
+
+        report(listed_total=counts['enumerated'])
+        failures.sort(key=lambda failure: failure['index'])
+        return counts['completed'] - skipped, failures, skipped
+
+    def _download_playlist_item(self, index: int, entry: Dict, options: Dict,
+                                progress_callback: Optional[Callable[[Dict], None]],
+                                on_file: Optional[Callable[[str, Optional[int]], Optional[Future]]] = None,
+                                archive: Optional[DownloadArchive] = None
+                                ) -> Optional[str]:
+        """
+        Download one playlist item with retries, adding it to `archive` once done.
+
+        Returns:
+            str: The last error message, or None on success
+        """
+        target = progress_callback or self._progress_callback
+        item_callback = (lambda data: target(dict(data, item=index))) if target else None
+        item_options = dict(options, progress_hooks=[self._make_progress_hook(item_callback)])
+        handed_off = []
+        if on_file is not None:
+            item_options['post_hooks'] = [lambda filepath: handed_off.append(on_file(filepath, index))]
+        url = entry.get('url') or entry['id']
+
+        for attempt in range(self.item_retries + 1):
+            if attempt:
+                time.sleep(self.RETRY_BACKOFF * 2 ** (attempt - 1))
+            try:
+                with yt_dlp.YoutubeDL(item_options) as ydl:
+                    downloaded = self._extract_and_download(ydl, url)
+                self._archive_download(archive, downloaded, handed_off)
+                return None
+            except yt_dlp.utils.DownloadError as error:
+                last_error = str(error)
+            except Exception as error:
+                return f'Unexpected error: {str(error)}'
+        return last_error
+
+    def _report_playlist_progress(self, callback: Optional[Callable[[Dict], None]], counts: Dict):
+        target = callback or self._progress_callback
+        if target is not None:
+            target(dict(counts, status='playlist'))
+
+    @staticmethod
+    def _collect_conversions(conversions: List[Tuple[Optional[int], str, Future]], count: int,
+                             failures: List[Dict]) -> Tuple[int, List[Dict], List[Dict]]:
+        """
+        Wait for handed-off conversions; failed ones move from `count` to `failures`.
+
+        Returns:
+            (count, failures, converted files as {'index', 'filename', 'conversion'})
+        """
+        failures = list(failures)
+        files = []
+        for item, filepath, future in conversions:
+            try:
+                converted = future.result()
+            except Exception as error:
+                count -= 1
+                failures.append({'index': item or 1, 'title': Path(filepath).stem, 'error': str(error)})
+                continue
+            files.append({'index': item or 1, 'filename': os.path.basename(converted['filepath']),
+                          'conversion': converted['conversion']})
+        failures.sort(key=lambda failure: failure['index'])
+        files.sort(key=lambda converted: converted['index'])
+        return count, failures, files
+
+    @staticmethod
+    def describe_conversions(files: List[Dict]) -> str:
+        """Summary such as '2 kept as is, 1 remuxed, 3 re-encoded'"""
+        labels = [(Conversion.COPY, 'kept as is'), (Conversion.REMUX, 'remuxed'),
+                  (Conversion.TRANSCODE, 're-encoded')]
+        counts = [(sum(1 for f in files if f['conversion'] == conversion), label)
+                  for conversion, label in labels]
+        return ', '.join(f'{count} {label}' for count, label in counts if count)
+
+    @staticmethod
+    def _build_result(noun: str, is_playlist: bool, count: int, failures: List[Dict],
+                      skipped: int = 0) -> Dict:
+        """Result dict for a finished download, including failed and archived items"""
+        if failures and count == 0 and not skipped:
+            return {
+                'status': 'error',
+                'message': f'Download error: all {len(failures)} item(s) failed '
+                           f'(first: {failures[0]["error"]})',
+                'is_playlist': is_playlist,
+                'count': 0,
+                'failed': failures,
+                'skipped': 0
+            }
+
+        if skipped and count == 0 and not failures:
+            message = f'Already downloaded: {skipped} {noun} in the download archive'
+        else:
+            message = f'Successfully downloaded {count} {noun}'
+            if skipped:
+                message += f', {skipped} already downloaded'
+            if failures:
+                message += f', {len(failures)} failed'
+        return {
+            'status': 'success',
+            'message': message,
+            'is_playlist': is_playlist,
+            'count': count,
+            'failed': failures,
+            'skipped': skipped
+        }
+
+    def _extract_and_download(self, ydl: yt_dlp.YoutubeDL, url: str,
+                              info: Optional[Dict] = None) -> Dict:
+        """
+        Download a single video, extracting it only if needed.
+
+        Resolved info (`info`, or the metadata cache's entry) is downloaded
+        without extracting again; if downloading from it fails (e.g. its
+        media URLs expired), the entry is invalidated and the URL is
+        extracted afresh.
+        """
+        if info is None:
+            info = self.metadata_cache.get(url)
+        if info is not None:
+            try:
+                return ydl.process_ie_result(ydl.sanitize_info(info), download=True)
+            except yt_dlp.utils.DownloadError:
+                self.metadata_cache.invalidate(url)
+
+        info = ydl.extract_info(url, download=True)
+        self.metadata_cache.put(url, info)
+        return info
+
+    def create_queue(self, max_workers: int = 3):
+        """
+        Create a job queue that runs downloads with this downloader.
+
+        Args:
+            max_workers: Number of downloads running at the same time
+
+        Returns:
+            DownloadQueue: Submit URLs with queue.submit(url, 'video' or 'audio')
+        """
+        from .download_queue import DownloadQueue
+        return DownloadQueue(self, max_workers)
+
     def set_download_directory(self, directory: str):
         """Change the download directory"""
         self.download_directory = directory
@@ -0,0 +1,122 @@
+"""
+YouTube Downloader Format Selection
+Turn quality labels into yt-dlp format selectors and pick formats from cached info
+"""
+
+import re
+from typing import Dict, List, Optional
+
+# Best quality without a height limit
+BEST_VIDEO_FORMAT = 'bestvideo+bestaudio/best'
+
+# Best audio stream of any codec
+BEST_AUDIO_FORMAT = 'bestaudio/best'
+
+# Format ordering passed to yt-dlp as 'format_sort': highest resolution
+# first, and at equal resolution MP4 video with M4A audio (cheap to merge)
+FORMAT_SORT = ['res', 'ext:mp4:m4a']
+
+# MP3 bitrate used for audio downloads (kbps)
+MP3_BITRATE = 192
+
+# Audio download formats: file extension -> (yt-dlp acodec prefix, codec
+# name as reported by ffprobe). A source already in the codec is kept as is.
+AUDIO_FORMATS = {
+    'm4a': ('mp4a', 'aac'),
+    'opus': ('opus', 'opus'),
+    'mp3': ('mp3', 'mp3'),
+}
+DEFAULT_AUDIO_FORMAT = 'mp3'
+
+# Bitrate (kbps) when a source has to be re-encoded to the audio format
+AUDIO_BITRATES = {'m4a': 192, 'opus': 160, 'mp3': MP3_BITRATE}
+
+_HEIGHT_PATTERN = re.compile(r'(\d{3,4})p\b')
+
+
+def parse_quality(quality: Optional[str]) -> Optional[int]:
+    """
+    Get the maximum video height from a quality label.
+
+    Examples:
+        '720p (HD)' -> 720, '2160p (4K)' -> 2160, '480p' -> 480,
+        'Best Available' / 'best' / None -> None (no limit)
+    """
+    if not quality:
+        return None
+    match = _HEIGHT_PATTERN.search(quality)
+    return int(match.group(1)) if match else None
+
+
+def build_format_selector(quality: Optional[str] = None, audio_only: bool = False,
+                          audio_format: Optional[str] = None) -> str:
+    """
+    Build a yt-dlp format selector for a quality label.
+
+    Video is capped at the label's height (separate video and audio
+    streams, else a single pre-merged file). If nothing is available at or
+    below the cap, the smallest format above it is used instead. Use with
+    FORMAT_SORT so the highest resolution under the cap wins.
+
+    Audio prefers the best stream already in `audio_format`'s codec (see
+    AUDIO_FORMATS), so it can be kept without re-encoding.
+    """
+    if audio_only:
+        if audio_format not in AUDIO_FORMATS:
+            return BEST_AUDIO_FORMAT
+        codec_prefix = AUDIO_FORMATS[audio_format][0]
+        return f'bestaudio[acodec^={codec_prefix}]/{BEST_AUDIO_FORMAT}'
+
+    height = parse_quality(quality)
+    if height is None:
+        return BEST_VIDEO_FORMAT
+
+    cap = f'[height<=?{height}]'
+    return '/'.join([
+        f'bestvideo{cap}+bestaudio',
+        f'best{cap}',
+        'worstvideo+bestaudio',
+        'worst',
+    ])
+
+
+def select_formats(info: Dict, format_selector: str) -> List[Dict]:
+    """
+    Run yt-dlp's format selection on an already extracted info dict.
+
+    No network access: the info's format list is sorted (by FORMAT_SORT)
+    and filtered locally, exactly as a download with the same selector would.
+
+    Returns:
+        list: Selected formats; a merged selection is one dict whose
+        'requested_formats' holds the video and audio parts
+    """
+    import yt_dlp
+
+    formats = [dict(media_format) for media_format in info.get('formats') or ()]
+    if not formats:
+        return []
+
+    with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True, 'format_sort': FORMAT_SORT}) as ydl:
+        ydl.sort_formats({'formats': formats, '_format_sort_fields': info.get('_format_sort_fields')})
+        selector = ydl.build_format_selector(format_selector)
+        return list(selector({
+            'formats': formats,
+            'has_merged_format': any('none' not in (f.get('acodec'), f.get('vcodec')) for f in formats),
+            'incomplete_formats': (all(f.get('vcodec') == 'none' for f in formats)
+                                   or all(f.get('acodec') == 'none' for f in formats)),
+        }))
+
+
+def estimate_format_size(media_format: Dict, duration: Optional[float]) -> Optional[int]:
+    """Size of a (possibly merged) format in bytes, estimated from bitrate if unknown"""
+    parts = media_format.get('requested_formats') or [media_format]
+    total = 0
+    for part in parts:
+        size = part.get('filesize') or part.get('filesize_approx')
+        if not size and part.get('tbr') and duration:
+            size = part['tbr'] * 1000 / 8 * duration
+        if not size:
+            return None
+        total += size
+    return int(total)
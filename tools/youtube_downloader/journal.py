@@ -0,0 +1,198 @@
+"""
+YouTube Downloader Job Journal
+Persist download jobs and their entries so unfinished work survives a restart
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+from core.paths import get_data_directory
+
+from .download_queue import JobStatus
+
+
+class JobJournal:
+    """
+    SQLite record of every download job and playlist entry.
+
+    A job row keeps what is needed to run it again (URL, type, quality,
+    audio format, format selector, directory, whether archived videos are
+    skipped); an entry row keeps one
+    video's id, title, chosen format, `.part` path, final file and status.
+    Entries use JobStatus values: QUEUED when listed, DOWNLOADING once
+    data arrives, PROCESSING while converting, then FINISHED or FAILED.
+
+    Jobs still QUEUED or DOWNLOADING when the app stopped are returned by
+    get_unfinished_jobs(). Every write is committed immediately, so a
+    crash loses at most the write in progress. Database errors are
+    swallowed: without a journal, downloads still work.
+    """
+
+    # Job states that mean "not done yet" after a restart
+    UNFINISHED = (JobStatus.QUEUED, JobStatus.DOWNLOADING, JobStatus.PROCESSING)
+
+    # Entry item of a single-video job (playlist entries use their index)
+    VIDEO_ITEM = 0
+
+    # Entry columns that update_entry() may change
+    ENTRY_FIELDS = ('status', 'format_id', 'part_path', 'filepath', 'error')
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Args:
+            db_path: SQLite file (default: youtube_jobs.sqlite3 in the data
+                     directory); ':memory:' keeps nothing on disk
+        """
+        if db_path is None:
+            db_path = str(get_data_directory() / "youtube_jobs.sqlite3")
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connection = self._open_database()
+
+    def _open_database(self) -> Optional[sqlite3.Connection]:
+        try:
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.executescript(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " job_id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " url TEXT NOT NULL,"
+                " download_type TEXT NOT NULL,"
+                " quality TEXT,"
+                " audio_format TEXT,"
+                " format_selector TEXT,"
+                " download_directory TEXT NOT NULL,"
+                " skip_archived INTEGER NOT NULL DEFAULT 1,"
+                " status TEXT NOT NULL,"
+                " message TEXT,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " job_id INTEGER NOT NULL REFERENCES jobs(job_id) ON DELETE CASCADE,"
+                " item INTEGER NOT NULL,"
+                " entry_id TEXT,"
+                " url TEXT,"
+                " title TEXT,"
+                " format_id TEXT,"
+                " part_path TEXT,"
+                " filepath TEXT,"
+                " status TEXT NOT NULL,"
+                " error TEXT,"
+                " PRIMARY KEY (job_id, item));"
+                "CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status);"
+            )
+            columns = {row['name'] for row in connection.execute("PRAGMA table_info(jobs)")}
+            if 'skip_archived' not in columns:
+                # Journal written before jobs could ignore the archive
+                connection.execute("ALTER TABLE jobs ADD COLUMN skip_archived INTEGER NOT NULL DEFAULT 1")
+            connection.commit()
+            return connection
+        except sqlite3.Error:
+            return None
+
+    def _write(self, sql: str, parameters=()) -> Optional[sqlite3.Cursor]:
+        """Execute and commit one statement (errors are ignored)"""
+        with self._lock:
+            if self._connection is None:
+                return None
+            try:
+                cursor = self._connection.execute(sql, parameters)
+                self._connection.commit()
+                return cursor
+            except sqlite3.Error:
+                return None
+
+    def _read(self, sql: str, parameters=()) -> List[Dict]:
+        with self._lock:
+            if self._connection is None:
+                return []
+            try:
+                return [dict(row) for row in self._connection.execute(sql, parameters)]
+            except sqlite3.Error:
+                return []
+
+    def create_job(self, url: str, download_type: str, download_directory: str,
+                   quality: Optional[str] = None, audio_format: Optional[str] = None,
+                   format_selector: Optional[str] = None, skip_archived: bool = True) -> Optional[int]:
+        """
+        Record a new QUEUED job.
+
+        Returns:
+            int: Journal job id, or None if the journal is unavailable
+        """
+        now = time.time()
+        cursor = self._write(
+            "INSERT INTO jobs (url, download_type, quality, audio_format, format_selector,"
+            " download_directory, skip_archived, status, created_at, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (url, download_type, quality, audio_format, format_selector,
+             download_directory, int(skip_archived), JobStatus.QUEUED, now, now)
+        )
+        return cursor.lastrowid if cursor is not None else None
+
+    def set_job_status(self, job_id: int, status: str, message: Optional[str] = None,
+                       format_selector: Optional[str] = None):
+        """Update a job's status (and result message or format selector)"""
+        self._write(
+            "UPDATE jobs SET status = ?, message = COALESCE(?, message),"
+            " format_selector = COALESCE(?, format_selector), updated_at = ? WHERE job_id = ?",
+            (status, message, format_selector, time.time(), job_id)
+        )
+
+    def add_entry(self, job_id: int, item: int, entry_id: Optional[str] = None,
+                  url: Optional[str] = None, title: Optional[str] = None):
+        """Record a listed entry; an entry already journaled keeps its state"""
+        self._write(
+            "INSERT OR IGNORE INTO entries (job_id, item, entry_id, url, title, status)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (job_id, item, entry_id, url, title, JobStatus.QUEUED)
+        )
+
+    def update_entry(self, job_id: int, item: int, **fields):
+        """Change entry columns (see ENTRY_FIELDS), creating the entry if needed"""
+        fields = {key: value for key, value in fields.items() if key in self.ENTRY_FIELDS}
+        if not fields:
+            return
+        self.add_entry(job_id, item)
+        assignments = ', '.join(f"{key} = ?" for key in fields)
+        self._write(f"UPDATE entries SET {assignments} WHERE job_id = ? AND item = ?",
+                    (*fields.values(), job_id, item))
+
+    def get_job(self, job_id: int) -> Optional[Dict]:
+        """Get a job row as a dict"""
+        rows = self._read("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+        return rows[0] if rows else None
+
+    def get_entries(self, job_id: int) -> List[Dict]:
+        """Get a job's entries in playlist order"""
+        return self._read("SELECT * FROM entries WHERE job_id = ? ORDER BY item", (job_id,))
+
+    def get_finished_items(self, job_id: int) -> Set[int]:
+        """Playlist indexes of a job's entries that are complete"""
+        rows = self._read("SELECT item FROM entries WHERE job_id = ? AND status = ?",
+                          (job_id, JobStatus.FINISHED))
+        return {row['item'] for row in rows}
+
+    def get_unfinished_jobs(self) -> List[Dict]:
+        """Jobs that were queued or running when the app last stopped, oldest first"""
+        placeholders = ', '.join('?' for _ in self.UNFINISHED)
+        return self._read(f"SELECT * FROM jobs WHERE status IN ({placeholders}) ORDER BY job_id",
+                          self.UNFINISHED)
+
+    def prune(self, max_age: float = 30 * 24 * 3600):
+        """Delete finished, failed and cancelled jobs older than `max_age` seconds"""
+        placeholders = ', '.join('?' for _ in self.UNFINISHED)
+        cutoff = time.time() - max_age
+        self._write(f"DELETE FROM entries WHERE job_id IN (SELECT job_id FROM jobs"
+                    f" WHERE status NOT IN ({placeholders}) AND updated_at < ?)", (*self.UNFINISHED, cutoff))
+        self._write(f"DELETE FROM jobs WHERE status NOT IN ({placeholders}) AND updated_at < ?",
+                    (*self.UNFINISHED, cutoff))
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
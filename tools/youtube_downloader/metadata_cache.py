@@ -0,0 +1,244 @@
+"""
+YouTube Downloader Metadata Cache
+Keep extracted yt-dlp info dicts in memory and on disk
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from core.paths import get_data_directory
+
+# 11-character YouTube video id in the usual URL shapes
+_VIDEO_ID_PATTERN = re.compile(
+    r'(?:youtube(?:-nocookie)?\.com/(?:watch\?(?:.*&)?v=|shorts/|embed/|live/|v/)|youtu\.be/)'
+    r'([0-9A-Za-z_-]{11})'
+)
+
+# Keys describing a finished download rather than the video itself
+_DOWNLOAD_KEYS = {
+    'requested_downloads', 'requested_formats', 'requested_subtitles',
+    'filepath', '_filename', 'filename', 'infojson_filename',
+}
+
+
+def canonical_key(url: str) -> str:
+    """
+    Map the different URL shapes of one video or playlist to one cache key.
+
+    Examples:
+        https://youtu.be/ID?t=5 and https://www.youtube.com/watch?v=ID&feature=x
+        both map to 'youtube:ID'. URLs with a list= parameter are playlists
+        (as yt-dlp treats them) and map to 'youtube:playlist:LIST'.
+    """
+    url = url.strip()
+    query = parse_qs(urlparse(url).query)
+    if 'youtube.com' in url or 'youtu.be' in url:
+        if query.get('list'):
+            return f"youtube:playlist:{query['list'][0]}"
+        match = _VIDEO_ID_PATTERN.search(url)
+        if match:
+            return f"youtube:{match.group(1)}"
+    return url
+
+
+def clean_info(info: Dict) -> Dict:
+    """JSON-safe copy of an info dict without per-download keys"""
+    import yt_dlp
+
+    def strip(obj):
+        if isinstance(obj, dict):
+            return {key: strip(value) for key, value in obj.items()
+                    if key not in _DOWNLOAD_KEYS and not key.startswith('__')}
+        if isinstance(obj, list):
+            return [strip(item) for item in obj]
+        return obj
+
+    return strip(yt_dlp.YoutubeDL.sanitize_info(info))
+
+
+class MetadataCache:
+    """
+    Two-level cache of extracted info dicts keyed by canonical video id.
+
+    - Memory: LRU of the `capacity` most recently used entries
+    - Disk: SQLite database in the OmniTool data directory, shared
+      across sessions
+
+    Entries expire after `ttl` seconds, or earlier if the media URLs in
+    the info dict carry an earlier `expire=` timestamp (YouTube does).
+    """
+
+    # Default time to live; YouTube media URLs stay valid for about 6 hours
+    DEFAULT_TTL = 4 * 3600
+
+    # Stop using an entry this long before its media URLs expire
+    EXPIRY_MARGIN = 15 * 60
+
+    def __init__(self, db_path: Optional[str] = None, capacity: int = 64,
+                 ttl: float = DEFAULT_TTL):
+        """
+        Args:
+            db_path: SQLite file (default: youtube_metadata.sqlite3 in the
+                     data directory); ':memory:' keeps nothing on disk
+            capacity: Entries kept in memory
+            ttl: Seconds an entry stays valid
+        """
+        if db_path is None:
+            db_path = str(get_data_directory() / "youtube_metadata.sqlite3")
+        self.db_path = db_path
+        self.capacity = capacity
+        self.ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+        self._memory: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = self._open_database()
+
+    def _open_database(self) -> Optional[sqlite3.Connection]:
+        """Open the on-disk store; without it the cache is memory-only"""
+        try:
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                " key TEXT PRIMARY KEY,"
+                " info BLOB NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            connection.commit()
+            return connection
+        except sqlite3.Error:
+            return None
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Get the cached info dict for a URL, or None on a miss"""
+        key = canonical_key(url)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, info = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return info
+                del self._memory[key]
+
+            info = self._load(key, now)
+            if info is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.disk_hits += 1
+            return info
+
+    def _load(self, key: str, now: float) -> Optional[Dict]:
+        """Read an entry from disk into memory (lock held)"""
+        if self._connection is None:
+            return None
+        try:
+            row = self._connection.execute(
+                "SELECT info, expires_at FROM metadata WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or row[1] <= now:
+            return None
+
+        try:
+            info = json.loads(zlib.decompress(row[0]))
+        except (zlib.error, ValueError):
+            return None
+        self._remember(key, row[1], info)
+        return info
+
+    def put(self, url: str, info: Dict) -> Dict:
+        """
+        Cache the info dict extracted for a URL.
+
+        Returns:
+            dict: The cleaned copy that was stored
+        """
+        key = canonical_key(url)
+        info = clean_info(info)
+        expires_at = self._expiry_time(info)
+
+        with self._lock:
+            self._remember(key, expires_at, info)
+            if self._connection is not None:
+                try:
+                    payload = zlib.compress(json.dumps(info).encode('utf-8'))
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO metadata (key, info, expires_at) VALUES (?, ?, ?)",
+                        (key, payload, expires_at)
+                    )
+                    self._connection.commit()
+                except sqlite3.Error:
+                    pass
+        return info
+
+    def _remember(self, key: str, expires_at: float, info: Dict):
+        """Insert into the memory LRU (lock held)"""
+        self._memory[key] = (expires_at, info)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+
+    def _expiry_time(self, info: Dict) -> float:
+        """When an info dict stops being usable for downloads"""
+        expires_at = time.time() + self.ttl
+        for media_format in info.get('formats') or ():
+            expire = parse_qs(urlparse(media_format.get('url', '')).query).get('expire')
+            if expire and expire[0].isdigit():
+                expires_at = min(expires_at, int(expire[0]) - self.EXPIRY_MARGIN)
+        return expires_at
+
+    def invalidate(self, url: str):
+        """Drop the entry for a URL (e.g. its media URLs stopped working)"""
+        key = canonical_key(url)
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._connection is not None:
+                try:
+                    self._connection.execute("DELETE FROM metadata WHERE key = ?", (key,))
+                    self._connection.commit()
+                except sqlite3.Error:
+                    pass
+
+    def prune(self):
+        """Delete expired entries from disk"""
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    self._connection.execute("DELETE FROM metadata WHERE expires_at <= ?", (time.time(),))
+                    self._connection.commit()
+                except sqlite3.Error:
+                    pass
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/miss counters since the cache was created"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'memory_hits': self.hits - self.disk_hits,
+            'disk_hits': self.disk_hits,
+            'entries': len(self._memory),
+        }
+
+    def close(self):
+        """Close the on-disk store"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
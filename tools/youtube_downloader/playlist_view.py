@@ -0,0 +1,274 @@
+"""
+YouTube Downloader Playlist Preview
+Virtualized thumbnail strip for playlist entries
+"""
+
+from typing import Dict, List, Optional, Set
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QPoint, QRect, QSize, Qt, QTimer
+from PyQt6.QtGui import QColor, QFont, QPainter, QPainterPath
+from PyQt6.QtWidgets import QAbstractItemView, QListView, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from .thumbnails import ThumbnailLoader
+
+
+class PlaylistEntryModel(QAbstractListModel):
+    """
+    List model of flat playlist entries.
+
+    Thumbnails are never fetched from data(); the view asks for the rows
+    it shows with request_thumbnails(), and rows are refreshed as the
+    thumbnail loader delivers them.
+    """
+
+    VideoIdRole = Qt.ItemDataRole.UserRole + 1
+    EntryRole = Qt.ItemDataRole.UserRole + 2
+    ThumbnailStateRole = Qt.ItemDataRole.UserRole + 3
+
+    # ThumbnailStateRole values
+    THUMBNAIL_LOADING = "loading"
+    THUMBNAIL_READY = "ready"
+    THUMBNAIL_MISSING = "missing"
+
+    def __init__(self, thumbnail_loader: ThumbnailLoader, parent=None):
+        super().__init__(parent)
+        self.thumbnail_loader = thumbnail_loader
+        self.thumbnail_size = QSize()
+        self._entries: List[Dict] = []
+        self._rows_by_id: Dict[str, List[int]] = {}
+        self._requested: Set[str] = set()
+        self._failed: Set[str] = set()
+
+        thumbnail_loader.thumbnail_loaded.connect(self._on_thumbnail_changed)
+        thumbnail_loader.thumbnail_failed.connect(self._on_thumbnail_failed)
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of entries (flat list, so no children)"""
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return entry data; thumbnails only if already in memory"""
+        if not index.isValid():
+            return None
+
+        entry = self._entries[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return entry['title']
+        if role == Qt.ItemDataRole.DecorationRole:
+            if not self._has_thumbnail(entry) or not self.thumbnail_size.isValid():
+                return None
+            return self.thumbnail_loader.get_cached(entry['id'], self.thumbnail_size)
+        if role == self.ThumbnailStateRole:
+            if not self._has_thumbnail(entry) or entry['id'] in self._failed:
+                return self.THUMBNAIL_MISSING
+            if self.thumbnail_size.isValid() and self.thumbnail_loader.get_cached(entry['id'], self.thumbnail_size):
+                return self.THUMBNAIL_READY
+            return self.THUMBNAIL_LOADING
+        if role == self.VideoIdRole:
+            return entry['id']
+        if role == self.EntryRole:
+            return entry
+        return None
+
+    def set_entries(self, entries: List[Dict]):
+        """Replace the listed entries, cancelling thumbnails still queued"""
+        self._cancel_requests(set())
+        self.beginResetModel()
+        self._entries = list(entries)
+        self._rows_by_id = {}
+        for row, entry in enumerate(self._entries):
+            if entry.get('id'):
+                self._rows_by_id.setdefault(entry['id'], []).append(row)
+        self._failed.clear()
+        self.endResetModel()
+
+    def request_thumbnails(self, first: int, last: int, size: QSize):
+        """
+        Load thumbnails for rows first..last (inclusive) at `size`.
+
+        Requests for rows outside the range that have not started yet are
+        cancelled, so only what is (nearly) visible is fetched.
+        """
+        if size != self.thumbnail_size:
+            self._cancel_requests(set())
+            self.thumbnail_size = QSize(size)
+
+        wanted = set()
+        for entry in self._entries[max(first, 0):last + 1]:
+            if self._has_thumbnail(entry) and entry['id'] not in self._failed:
+                wanted.add(entry['id'])
+        self._cancel_requests(wanted)
+
+        for video_id in wanted - self._requested:
+            if self.thumbnail_loader.load(video_id, size) is None:
+                self._requested.add(video_id)
+
+    def _cancel_requests(self, keep: Set[str]):
+        """Cancel outstanding requests except those in `keep`"""
+        for video_id in list(self._requested - keep):
+            if self.thumbnail_loader.cancel(video_id, self.thumbnail_size):
+                self._requested.discard(video_id)
+
+    def _has_thumbnail(self, entry: Dict) -> bool:
+        """Only YouTube entries have thumbnails the loader can fetch"""
+        return bool(entry.get('id')) and (entry.get('extractor') or '').startswith('Youtube')
+
+    def _refresh(self, video_id: str):
+        for row in self._rows_by_id.get(video_id, ()):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole, self.ThumbnailStateRole])
+
+    def _on_thumbnail_changed(self, video_id: str, size: QSize, pixmap):
+        # Other views (and stale sizes) share the loader
+        if size == self.thumbnail_size and video_id in self._rows_by_id:
+            self._requested.discard(video_id)
+            self._refresh(video_id)
+
+    def _on_thumbnail_failed(self, video_id: str, size: QSize, message: str):
+        if size == self.thumbnail_size and video_id in self._rows_by_id:
+            self._requested.discard(video_id)
+            self._failed.add(video_id)
+            self._refresh(video_id)
+
+
+class PlaylistEntryDelegate(QStyledItemDelegate):
+    """Paints one playlist entry: thumbnail (or placeholder), index and title"""
+
+    THUMBNAIL_SIZE = QSize(128, 72)
+    MARGIN = 4
+    TITLE_HEIGHT = 20
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont("Segoe UI", 8)
+        self.badge_font = QFont("Segoe UI", 8, QFont.Weight.Bold)
+
+    def sizeHint(self, option, index):
+        """Thumbnail plus the title below it and the gap around both"""
+        return QSize(self.THUMBNAIL_SIZE.width() + 2 * self.MARGIN,
+                     self.THUMBNAIL_SIZE.height() + self.TITLE_HEIGHT + 2 * self.MARGIN)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        """Draw the entry from the model's cached thumbnail"""
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        rect = option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        thumbnail_rect = QRect(rect.topLeft(), self.THUMBNAIL_SIZE)
+
+        clip = QPainterPath()
+        clip.addRoundedRect(thumbnail_rect.toRectF(), 6, 6)
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if pixmap is not None:
+            painter.setClipPath(clip)
+            painter.drawPixmap(thumbnail_rect, pixmap)
+            painter.setClipping(False)
+        else:
+            painter.fillPath(clip, QColor("#34495e"))
+            state = index.data(PlaylistEntryModel.ThumbnailStateRole)
+            painter.setPen(QColor("#ecf0f1"))
+            painter.setFont(self.title_font)
+            painter.drawText(thumbnail_rect, Qt.AlignmentFlag.AlignCenter,
+                             "..." if state == PlaylistEntryModel.THUMBNAIL_LOADING else "No thumbnail")
+
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.setPen(QColor("#3498db"))
+            painter.drawPath(clip)
+
+        # Position in the playlist; listings may skip unavailable entries
+        painter.setFont(self.badge_font)
+        entry = index.data(PlaylistEntryModel.EntryRole) or {}
+        badge_text = str(entry.get('playlist_index') or index.row() + 1)
+        badge_rect = QRect(0, 0, painter.fontMetrics().horizontalAdvance(badge_text) + 10, 18)
+        badge_rect.moveTopLeft(thumbnail_rect.topLeft() + QPoint(4, 4))
+        badge_path = QPainterPath()
+        badge_path.addRoundedRect(badge_rect.toRectF(), 4, 4)
+        painter.fillPath(badge_path, QColor(0, 0, 0, 160))
+        painter.setPen(QColor("white"))
+        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, badge_text)
+
+        # Title, elided to one line
+        painter.setFont(self.title_font)
+        painter.setPen(option.palette.color(option.palette.ColorRole.Text))
+        title_rect = QRect(rect.left(), thumbnail_rect.bottom() + 3, rect.width(), self.TITLE_HEIGHT - 3)
+        title = painter.fontMetrics().elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole) or "", Qt.TextElideMode.ElideRight, title_rect.width()
+        )
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter, title)
+
+        painter.restore()
+
+
+class PlaylistStrip(QListView):
+    """
+    Horizontal, virtualized strip of playlist entries.
+
+    Only rows in (or just beside) the viewport request thumbnails, once
+    scrolling has settled for REQUEST_DELAY_MS, and they are fetched
+    concurrently by the shared ThumbnailLoader's bounded pool.
+    """
+
+    # Wait this long after scrolling/resizing before requesting thumbnails
+    REQUEST_DELAY_MS = 80
+
+    # Rows on each side of the viewport whose thumbnails are prefetched
+    PREFETCH_ROWS = 4
+
+    def __init__(self, thumbnail_loader: ThumbnailLoader, parent=None):
+        super().__init__(parent)
+        self.entry_model = PlaylistEntryModel(thumbnail_loader, self)
+        self.entry_delegate = PlaylistEntryDelegate(self)
+        self.setModel(self.entry_model)
+        self.setItemDelegate(self.entry_delegate)
+
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(False)
+        self.setUniformItemSizes(True)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setFixedHeight(self.entry_delegate.sizeHint(None, None).height()
+                            + self.horizontalScrollBar().sizeHint().height() + 6)
+
+        self._request_timer = QTimer(self)
+        self._request_timer.setSingleShot(True)
+        self._request_timer.setInterval(self.REQUEST_DELAY_MS)
+        self._request_timer.timeout.connect(self._request_visible_thumbnails)
+        self.horizontalScrollBar().valueChanged.connect(self._schedule_request)
+
+    def set_entries(self, entries: List[Dict]):
+        """Show a new playlist, starting at its first entry"""
+        self.entry_model.set_entries(entries)
+        self.horizontalScrollBar().setValue(0)
+        self._schedule_request()
+
+    def visible_rows(self) -> Optional[range]:
+        """Rows currently in the viewport"""
+        count = self.entry_model.rowCount()
+        if count == 0:
+            return None
+        middle = self.viewport().height() // 2
+        first = self.indexAt(QPoint(1, middle))
+        last = self.indexAt(QPoint(self.viewport().width() - 2, middle))
+        first_row = first.row() if first.isValid() else 0
+        last_row = last.row() if last.isValid() else count - 1
+        return range(first_row, last_row + 1)
+
+    def _schedule_request(self, *args):
+        self._request_timer.start()
+
+    def _request_visible_thumbnails(self):
+        rows = self.visible_rows()
+        if rows is None:
+            return
+        size = PlaylistEntryDelegate.THUMBNAIL_SIZE * self.devicePixelRatioF()
+        self.entry_model.request_thumbnails(rows.start - self.PREFETCH_ROWS,
+                                            rows.stop - 1 + self.PREFETCH_ROWS, size)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_request()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_request()
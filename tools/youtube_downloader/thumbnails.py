@@ -0,0 +1,270 @@
+"""
+YouTube Downloader Thumbnails
+Fetch, decode and cache video thumbnails off the GUI thread
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QObject, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+
+from core.http_client import HttpClient
+from core.paths import get_data_directory
+
+# Where YouTube serves thumbnails: {base_url}/{video_id}/{variant}.jpg
+YOUTUBE_THUMBNAIL_URL = "https://i.ytimg.com/vi"
+
+# Thumbnail variants from largest to smallest; not every video has all of them
+THUMBNAIL_VARIANTS = ('maxresdefault', 'sddefault', 'hqdefault', 'mqdefault', 'default')
+
+
+def decode_image(data: bytes, size: QSize) -> QImage:
+    """
+    Decode image bytes straight to `size`, cropping to fill it.
+
+    The decoder scales while decoding, so no full-size intermediate image
+    is kept. Safe to call from worker threads.
+    """
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+
+    reader = QImageReader(buffer)
+    source_size = reader.size()
+    if source_size.isValid():
+        # Scale to cover the target, then crop the overflow (letterbox bars)
+        reader.setScaledSize(source_size.scaled(size, Qt.AspectRatioMode.KeepAspectRatioByExpanding))
+    image = reader.read()
+    if image.isNull():
+        raise ValueError(f"Cannot decode thumbnail: {reader.errorString()}")
+
+    if image.size() != size:
+        x = max((image.width() - size.width()) // 2, 0)
+        y = max((image.height() - size.height()) // 2, 0)
+        image = image.copy(x, y, size.width(), size.height())
+    return image
+
+
+class ThumbnailLoader(QObject):
+    """
+    Asynchronous thumbnail loader with memory and disk caches.
+
+    load() returns a cached QPixmap immediately, or schedules a fetch on a
+    worker pool and emits `thumbnail_loaded` once the thumbnail is ready.
+
+    - Memory: LRU of QPixmaps per (video id, size), owned by the GUI thread
+    - Disk: original JPEG bytes in <data dir>/thumbnails/<video id>.jpg,
+      pruned of the least recently used files beyond `disk_limit` bytes
+    - Network: a pooled keep-alive HttpClient, trying THUMBNAIL_VARIANTS in order
+    """
+
+    # Emitted in the GUI thread: video id, requested size, thumbnail
+    thumbnail_loaded = pyqtSignal(str, QSize, QPixmap)
+
+    # Emitted in the GUI thread: video id, requested size, error message
+    thumbnail_failed = pyqtSignal(str, QSize, str)
+
+    # Default size limit of the disk cache (bytes)
+    DEFAULT_DISK_LIMIT = 64 * 1024 * 1024
+
+    # Thumbnails written to disk between two prunes
+    PRUNE_INTERVAL = 100
+
+    # Internal: worker thread -> GUI thread hand-off
+    _image_decoded = pyqtSignal(str, QSize, QImage)
+    _fetch_failed = pyqtSignal(str, QSize, str)
+
+    def __init__(self, base_url: str = YOUTUBE_THUMBNAIL_URL,
+                 cache_directory: Optional[str] = None, max_workers: int = 4,
+                 memory_capacity: int = 256, timeout: float = 5.0,
+                 http_client: Optional[HttpClient] = None,
+                 disk_limit: int = DEFAULT_DISK_LIMIT, parent=None):
+        """
+        Args:
+            base_url: Thumbnail server (override to test against a local server)
+            cache_directory: Disk cache directory (default: <data dir>/thumbnails)
+            max_workers: Concurrent fetches
+            memory_capacity: Pixmaps kept in memory
+            timeout: Per-request timeout in seconds
+            http_client: Shared HTTP client (default: a private one); its
+                         pool is grown to one connection per worker
+            disk_limit: Bytes the disk cache may hold; the least recently
+                        used thumbnails are deleted beyond it
+        """
+        super().__init__(parent)
+        self.base_url = base_url.rstrip('/')
+        self.cache_directory = Path(cache_directory) if cache_directory else get_data_directory() / "thumbnails"
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        self.memory_capacity = memory_capacity
+        self.timeout = timeout
+        self.disk_limit = disk_limit
+
+        self.http_client = http_client or HttpClient(pool_size=max_workers)
+        self.http_client.ensure_pool_size(max_workers)
+
+        self._pixmaps: OrderedDict = OrderedDict()
+        self._pending: Dict[Tuple[str, int, int], Future] = {}
+        self._disk_lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='thumbnail')
+        self._executor.submit(self.prune_disk)
+
+        self._image_decoded.connect(self._on_image_decoded)
+        self._fetch_failed.connect(self._on_fetch_failed)
+
+    def thumbnail_urls(self, video_id: str) -> List[str]:
+        """Candidate URLs for a video's thumbnail, largest first"""
+        return [f"{self.base_url}/{video_id}/{variant}.jpg" for variant in THUMBNAIL_VARIANTS]
+
+    def load(self, video_id: str, size: QSize) -> Optional[QPixmap]:
+        """
+        Get a thumbnail at `size` (device pixels).
+
+        Returns:
+            QPixmap: If it is in the memory cache; otherwise None, and
+            thumbnail_loaded (or thumbnail_failed) is emitted later
+        """
+        pixmap = self.get_cached(video_id, size)
+        if pixmap is not None:
+            return pixmap
+
+        key = (video_id, size.width(), size.height())
+        if key not in self._pending:
+            self._pending[key] = self._executor.submit(self._fetch, video_id, QSize(size))
+        return None
+
+    def get_cached(self, video_id: str, size: QSize) -> Optional[QPixmap]:
+        """Get a thumbnail from the memory cache only, never fetching"""
+        key = (video_id, size.width(), size.height())
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def cancel(self, video_id: str, size: QSize) -> bool:
+        """
+        Drop a load() request that has not started yet (e.g. the item
+        scrolled out of view). Returns False if it is already running.
+        """
+        key = (video_id, size.width(), size.height())
+        future = self._pending.get(key)
+        if future is None or not future.cancel():
+            return False
+        del self._pending[key]
+        return True
+
+    def _fetch(self, video_id: str, size: QSize):
+        """Read from disk or the network and decode (worker thread)"""
+        try:
+            data = self._read_disk(video_id)
+            if data is None:
+                data = self._download(video_id)
+                self._write_disk(video_id, data)
+            image = decode_image(data, size)
+        except Exception as error:
+            self._fetch_failed.emit(video_id, size, str(error))
+            return
+        self._image_decoded.emit(video_id, size, image)
+
+    def _download(self, video_id: str) -> bytes:
+        """Fetch the largest available thumbnail variant"""
+        last_error = "no thumbnail available"
+        for url in self.thumbnail_urls(video_id):
+            try:
+                response = self.http_client.get(url, timeout=self.timeout)
+            except IOError as error:
+                last_error = str(error)
+                continue
+            if response.status_code == 200 and response.content:
+                return response.content
+            last_error = f"HTTP {response.status_code} for {url}"
+        raise IOError(last_error)
+
+    def _disk_path(self, video_id: str) -> Path:
+        return self.cache_directory / f"{video_id}.jpg"
+
+    def _read_disk(self, video_id: str) -> Optional[bytes]:
+        path = self._disk_path(video_id)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            # Reading counts as use, so prune_disk() keeps it
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _write_disk(self, video_id: str, data: bytes):
+        path = self._disk_path(video_id)
+        temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with self._disk_lock:
+                temp_path.write_bytes(data)
+                os.replace(temp_path, path)
+                self._writes_since_prune += 1
+                prune = self._writes_since_prune >= self.PRUNE_INTERVAL
+        except OSError:
+            # A read-only data directory only costs us the disk cache
+            return
+        if prune:
+            self.prune_disk()
+
+    def prune_disk(self) -> int:
+        """
+        Delete the least recently used thumbnails until the disk cache
+        fits in `disk_limit` bytes.
+
+        Returns:
+            int: Number of thumbnails deleted
+        """
+        with self._disk_lock:
+            self._writes_since_prune = 0
+            files = []
+            try:
+                for entry in os.scandir(self.cache_directory):
+                    if entry.name.endswith('.jpg') and entry.is_file():
+                        stat = entry.stat()
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+            except OSError:
+                return 0
+
+            total = sum(size for _, size, _ in files)
+            deleted = 0
+            for _, size, path in sorted(files):
+                if total <= self.disk_limit:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                deleted += 1
+            return deleted
+
+    def _on_image_decoded(self, video_id: str, size: QSize, image: QImage):
+        """Turn the decoded image into a cached pixmap (GUI thread)"""
+        key = (video_id, size.width(), size.height())
+        self._pending.pop(key, None)
+
+        pixmap = QPixmap.fromImage(image)
+        self._pixmaps[key] = pixmap
+        self._pixmaps.move_to_end(key)
+        while len(self._pixmaps) > self.memory_capacity:
+            self._pixmaps.popitem(last=False)
+
+        self.thumbnail_loaded.emit(video_id, size, pixmap)
+
+    def _on_fetch_failed(self, video_id: str, size: QSize, message: str):
+        self._pending.pop((video_id, size.width(), size.height()), None)
+        self.thumbnail_failed.emit(video_id, size, message)
+
+    def shutdown(self):
+        """Stop fetching; thumbnails still in flight are dropped"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
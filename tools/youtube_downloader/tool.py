@@ -3,9 +3,15 @@ YouTube Downloader Tool
 Implements the BaseTool interface for OmniTool
 """
 
+import os
+from typing import TYPE_CHECKING
+
 from core.base_tool import BaseTool
+from core.discovery import load_manifest
 from core.tool_registry import ToolRegistry
-from PyQt6.QtWidgets import QMainWindow
+
+if TYPE_CHECKING:
+    from PyQt6.QtWidgets import QMainWindow
 
 
 @ToolRegistry.register
@@ -13,19 +19,20 @@ class YouTubeDownloaderTool(BaseTool):
     """YouTube Downloader - Download videos and audio with quality selection"""
 
     def get_metadata(self) -> dict:
-        """Return tool metadata"""
-        return {
-            'id': 'youtube_downloader',
-            'name': 'YouTube Downloader',
-            'description': 'Download YouTube videos and audio with quality selection, thumbnail preview, and playlist support',
-            'category': 'Media & Video',
-            'icon': '🎬',
-            'keywords': ['youtube', 'download', 'video', 'audio', 'mp3', 'music', 'playlist', 'thumbnail'],
-            'version': '2.0.0',
-            'author': 'OmniTool'
-        }
-
-    def create_window(self) -> QMainWindow:
+        """Return tool metadata (kept in manifest.json for lazy discovery)"""
+        return load_manifest(os.path.dirname(__file__))
+
+    def create_window(self) -> 'QMainWindow':
         """Create the YouTube Downloader window"""
         from tools.youtube_downloader.window import YouTubeDownloaderWindow
         return YouTubeDownloaderWindow()
+
+    def is_busy(self) -> bool:
+        """Busy while a download or info lookup is running"""
+        return self.window is not None and self.window.is_busy()
+
+    def cleanup(self):
+        """Stop the window's download queue before releasing it"""
+        if self.window is not None:
+            self.window.shutdown()
+        super().cleanup()
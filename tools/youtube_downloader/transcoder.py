@@ -0,0 +1,222 @@
+"""
+YouTube Downloader Transcoding
+Run ffmpeg conversions on a CPU-sized pool, separate from the download workers
+"""
+
+import os
+import shutil
+import subprocess
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from .formats import AUDIO_BITRATES, AUDIO_FORMATS
+
+# ffmpeg encoder for each codec in AUDIO_FORMATS
+AUDIO_ENCODERS = {'aac': 'aac', 'opus': 'libopus', 'mp3': 'libmp3lame'}
+
+# ffmpeg muxer for file extensions that are not muxer names themselves
+MUXERS = {'m4a': 'ipod'}
+
+# Codec of common audio files by extension, when ffprobe is not available
+EXTENSION_CODECS = {'m4a': 'aac', 'mp4': 'aac', 'aac': 'aac', 'webm': 'opus',
+                    'opus': 'opus', 'mp3': 'mp3', 'ogg': 'vorbis'}
+
+
+class Conversion:
+    """How a downloaded audio file was turned into the requested format"""
+    COPY = "copy"            # Already the right codec and container: kept as is
+    REMUX = "remux"          # Right codec, other container: streams copied
+    TRANSCODE = "transcode"  # Decoded and re-encoded
+
+
+class TranscodeError(Exception):
+    """ffmpeg is missing or a conversion failed"""
+
+
+class TranscodePool:
+    """
+    Second pipeline stage: converts downloaded files with ffmpeg.
+
+    Download workers hand each finished file to submit() and go straight
+    back to the network while ffmpeg runs here, one process per CPU core.
+    At most `max_pending` files may wait for a free core; beyond that
+    submit() blocks, so downloads slow down to the pace of transcoding
+    instead of piling up files on disk.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 ffmpeg: Optional[str] = None):
+        """
+        Args:
+            workers: Concurrent ffmpeg processes (default: number of CPU cores)
+            max_pending: Files allowed to wait for a worker (default: 2 per worker)
+            ffmpeg: ffmpeg executable (default: found on PATH)
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.max_pending = max_pending if max_pending is not None else 2 * self.workers
+        self.ffmpeg = ffmpeg or shutil.which('ffmpeg')
+        self.ffprobe = self._find_ffprobe(self.ffmpeg)
+
+        self.completed = 0
+        self.failed = 0
+        self.conversions = {Conversion.COPY: 0, Conversion.REMUX: 0, Conversion.TRANSCODE: 0}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_pending)
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='transcode')
+
+    @staticmethod
+    def _find_ffprobe(ffmpeg: Optional[str]) -> Optional[str]:
+        """ffprobe next to ffmpeg, else on PATH"""
+        if ffmpeg:
+            directory, name = os.path.split(ffmpeg)
+            candidate = os.path.join(directory, name.replace('ffmpeg', 'ffprobe'))
+            if candidate != ffmpeg and os.path.isfile(candidate):
+                return candidate
+        return shutil.which('ffprobe')
+
+    def is_available(self) -> bool:
+        """Check whether ffmpeg was found"""
+        return bool(self.ffmpeg)
+
+    def submit(self, source: str, target: str, arguments: List[str],
+               delete_source: bool = True) -> Future:
+        """
+        Queue `ffmpeg -i source <arguments> target`, blocking while the queue is full.
+
+        The output is written next to `target` and renamed when complete,
+        so a partial file never has the final name.
+
+        Returns:
+            Future: Resolves to `target`, or raises TranscodeError
+        """
+        return self._submit(self._run, source, target, arguments, delete_source)
+
+    def convert_audio(self, source: str, audio_format: str, bitrate: Optional[int] = None) -> Future:
+        """
+        Turn a downloaded file into `audio_format` (a key of AUDIO_FORMATS)
+        the cheapest way: keep it if it already is, copy the audio stream
+        into the right container if only that differs, else re-encode at
+        `bitrate` kbps (default: AUDIO_BITRATES). Replaces the source.
+
+        Returns:
+            Future: Resolves to {'filepath', 'conversion'} (a Conversion
+            value), or raises TranscodeError
+        """
+        if bitrate is None:
+            bitrate = AUDIO_BITRATES[audio_format]
+        return self._submit(self._run_audio, source, audio_format, bitrate)
+
+    def _submit(self, function, *args) -> Future:
+        """Run `function(*args)` on a worker, blocking while the queue is full"""
+        self._slots.acquire()
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(function, *args)
+        except RuntimeError:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _release(self):
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def _run_audio(self, source: str, audio_format: str, bitrate: int) -> Dict:
+        """Pick and run the cheapest conversion to `audio_format` (worker thread)"""
+        codec = AUDIO_FORMATS[audio_format][1]
+        extension = os.path.splitext(source)[1].lstrip('.').lower()
+        target = os.path.splitext(source)[0] + '.' + audio_format
+
+        if self.probe_audio_codec(source) == codec:
+            if extension == audio_format:
+                conversion = Conversion.COPY
+            else:
+                conversion = Conversion.REMUX
+                self._run(source, target, ['-vn', '-codec:a', 'copy'], True)
+        else:
+            conversion = Conversion.TRANSCODE
+            self._run(source, target, ['-vn', '-codec:a', AUDIO_ENCODERS[codec], '-b:a', f'{bitrate}k'], True)
+
+        with self._lock:
+            self.conversions[conversion] += 1
+            if conversion == Conversion.COPY:
+                self.completed += 1
+        return {'filepath': source if conversion == Conversion.COPY else target, 'conversion': conversion}
+
+    def probe_audio_codec(self, path: str) -> Optional[str]:
+        """Codec of a file's first audio stream (ffprobe, else guessed from the extension)"""
+        if self.ffprobe:
+            try:
+                process = subprocess.run(
+                    [self.ffprobe, '-v', 'error', '-select_streams', 'a:0',
+                     '-show_entries', 'stream=codec_name', '-of', 'default=noprint_wrappers=1:nokey=1', path],
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+                )
+                codec = process.stdout.decode('utf-8', 'replace').strip()
+                if process.returncode == 0 and codec:
+                    return codec
+            except OSError:
+                pass
+        return EXTENSION_CODECS.get(os.path.splitext(path)[1].lstrip('.').lower())
+
+    def _run(self, source: str, target: str, arguments: List[str], delete_source: bool) -> str:
+        """Run one ffmpeg conversion (worker thread)"""
+        if not self.ffmpeg:
+            self._count(False)
+            raise TranscodeError("FFmpeg not found; install it to convert audio")
+
+        partial = target + '.part'
+        extension = os.path.splitext(target)[1].lstrip('.')
+        output_format = MUXERS.get(extension, extension)
+        command = [self.ffmpeg, '-hide_banner', '-nostdin', '-loglevel', 'error', '-y',
+                   '-i', source, *arguments, '-f', output_format, partial]
+        try:
+            process = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        except OSError as error:
+            self._count(False)
+            raise TranscodeError(f"Could not run FFmpeg: {error}") from error
+
+        if process.returncode != 0:
+            self._count(False)
+            self._remove(partial)
+            message = process.stderr.decode('utf-8', 'replace').strip().splitlines()
+            raise TranscodeError(f"FFmpeg failed: {message[-1] if message else process.returncode}")
+
+        os.replace(partial, target)
+        if delete_source and os.path.abspath(source) != os.path.abspath(target):
+            self._remove(source)
+        self._count(True)
+        return target
+
+    def _count(self, success: bool):
+        with self._lock:
+            if success:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def get_stats(self) -> Dict[str, int]:
+        """Queue depth and totals since the pool was created"""
+        with self._lock:
+            return dict({
+                'workers': self.workers,
+                'pending': self._pending,
+                'completed': self.completed,
+                'failed': self.failed,
+            }, **self.conversions)
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting files; with `wait`, finish the queued conversions first"""
+        self._executor.shutdown(wait=wait)
@@ -3,43 +3,27 @@ YouTube Downloader Window
 Modern PyQt6 interface with thumbnail preview and quality selection
 """
 
-import requests
-from io import BytesIO
+import threading
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QProgressBar,
-    QTextEdit, QFileDialog, QRadioButton, QButtonGroup,
-    QGroupBox, QMessageBox
+    QTextEdit, QFileDialog, QRadioButton, QButtonGroup, QCheckBox,
+    QGroupBox, QMessageBox, QSpinBox, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QPixmap, QImage, QFont
-from PIL import Image
+from PyQt6.QtCore import Qt, QObject, QSize, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve
+from PyQt6.QtGui import QPixmap, QFont
 
 from .downloader import YouTubeDownloader
+from .download_queue import JobStatus
+from .playlist_view import PlaylistStrip
+from .thumbnails import ThumbnailLoader
 
 
-class DownloadThread(QThread):
-    """Background thread for downloading"""
-    progress = pyqtSignal(dict)
-    finished = pyqtSignal(dict)
-    
-    def __init__(self, downloader, url, download_type, quality=None):
-        super().__init__()
-        self.downloader = downloader
-        self.url = url
-        self.download_type = download_type
-        self.quality = quality
-        
-    def run(self):
-        """Run download in background"""
-        self.downloader.set_progress_callback(lambda data: self.progress.emit(data))
-        
-        if self.download_type == "video":
-            result = self.downloader.download_video(self.url, self.quality or 'best')
-        else:
-            result = self.downloader.download_audio(self.url)
-            
-        self.finished.emit(result)
+class DownloadQueueSignals(QObject):
+    """Deliver job updates from queue worker threads to the GUI thread"""
+    job_changed = pyqtSignal(object)
 
 
 class VideoInfoThread(QThread):
@@ -60,20 +44,65 @@ class VideoInfoThread(QThread):
 class YouTubeDownloaderWindow(QMainWindow):
     """Modern YouTube Downloader window"""
 
+    # Parallel downloads when the window opens
+    DEFAULT_WORKERS = 3
+
+    # Download queue table columns
+    JOB_COLUMNS = ["Job", "Type", "Progress", "Speed", "Status"]
+
+    # Audio format choices: label, format key (see formats.AUDIO_FORMATS)
+    AUDIO_FORMAT_CHOICES = [
+        ("M4A (AAC)", "m4a"),
+        ("Opus", "opus"),
+        ("MP3", "mp3"),
+    ]
+
+    # How each audio file was produced, for the activity log
+    CONVERSION_LABELS = {
+        "copy": "kept as is",
+        "remux": "remuxed, no re-encode",
+        "transcode": "re-encoded",
+    }
+
+    # Thumbnail preview size (logical pixels)
+    THUMBNAIL_SIZE = QSize(320, 180)
+
     def __init__(self):
         super().__init__()
         self.downloader = YouTubeDownloader()
         self.video_info = None
-        self.is_downloading = False
+        self.video_info_url = None
+
+        # Jobs run on the queue's worker threads; updates arrive via a signal
+        self.download_queue = self.downloader.create_queue(self.DEFAULT_WORKERS)
+        self.queue_signals = DownloadQueueSignals(self)
+        self.queue_signals.job_changed.connect(self._on_job_changed)
+        # Kept so shutdown() removes the same object (each .emit is a new one)
+        self._queue_listener = self.queue_signals.job_changed.emit
+        self.download_queue.add_listener(self._queue_listener)
+        self.job_rows = {}
+        self.finished_job_ids = set()
+
+        # Thumbnails are fetched and decoded off the GUI thread
+        self.thumbnail_loader = ThumbnailLoader(http_client=self.downloader.http_client, parent=self)
+        self.thumbnail_loader.thumbnail_loaded.connect(self._on_thumbnail_loaded)
+        self.thumbnail_loader.thumbnail_failed.connect(self._on_thumbnail_failed)
+        self.thumbnail_video_id = None
+        self.thumbnail_request_size = QSize()
 
         self._initialize_ui()
         self._apply_modern_theme()
 
+    @property
+    def is_downloading(self) -> bool:
+        """True while any queued download is running or waiting"""
+        return self.download_queue.has_unfinished_jobs()
+
     def _initialize_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle("YouTube Downloader Pro")
-        self.setMinimumSize(900, 700)
-        self.resize(1000, 750)
+        self.setMinimumSize(900, 800)
+        self.resize(1000, 880)
         
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -136,7 +165,7 @@ class YouTubeDownloaderWindow(QMainWindow):
         info_group = QGroupBox("📺 Video Information")
         info_group.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
         info_layout = QHBoxLayout()
-        
+
         # Thumbnail container
         thumbnail_container = QWidget()
         thumbnail_layout = QVBoxLayout(thumbnail_container)
@@ -183,8 +212,14 @@ class YouTubeDownloaderWindow(QMainWindow):
         info_text_layout.addWidget(self.type_label)
         info_text_layout.addStretch()
         
+        # Playlist entries, shown instead of the thumbnail for playlists
+        self.playlist_strip = PlaylistStrip(self.thumbnail_loader)
+        self.playlist_strip.hide()
+
         info_layout.addWidget(thumbnail_container)
         info_layout.addWidget(info_text_container, 1)
+        info_layout.addWidget(self.playlist_strip, 3)
+        self.thumbnail_container = thumbnail_container
         info_group.setLayout(info_layout)
         
         # Initially hidden
@@ -209,15 +244,27 @@ class YouTubeDownloaderWindow(QMainWindow):
         self.video_radio.setChecked(True)
         self.video_radio.toggled.connect(self._on_download_type_changed)
 
-        self.audio_radio = QRadioButton("🎵 Audio (MP3)")
+        self.audio_radio = QRadioButton("🎵 Audio")
         self.audio_radio.setFont(QFont("Segoe UI", 10))
 
+        # Sources already in the chosen codec are kept without re-encoding
+        self.audio_format_selector = QComboBox()
+        self.audio_format_selector.setFont(QFont("Segoe UI", 10))
+        for label, audio_format in self.AUDIO_FORMAT_CHOICES:
+            self.audio_format_selector.addItem(label, audio_format)
+        self.audio_format_selector.setCurrentIndex(
+            self.audio_format_selector.findData("mp3")
+        )
+        self.audio_format_selector.setEnabled(False)
+        self.audio_format_selector.currentIndexChanged.connect(self._update_size_estimate)
+
         self.download_type_button_group.addButton(self.video_radio)
         self.download_type_button_group.addButton(self.audio_radio)
 
         type_layout.addWidget(type_label)
         type_layout.addWidget(self.video_radio)
         type_layout.addWidget(self.audio_radio)
+        type_layout.addWidget(self.audio_format_selector)
         type_layout.addStretch()
         
         # Quality selection
@@ -241,20 +288,36 @@ class YouTubeDownloaderWindow(QMainWindow):
         
         quality_layout.addWidget(quality_label)
         quality_layout.addWidget(self.quality_selector, 1)
+        self.quality_selector.currentTextChanged.connect(self._update_size_estimate)
+
+        # Picked from the fetched format list, no extra network request
+        self.size_estimate_label = QLabel("Estimated size: -")
+        self.size_estimate_label.setFont(QFont("Segoe UI", 9))
+        self.size_estimate_label.setStyleSheet("color: #7f8c8d;")
+
+        # The archive knows videos by id only, not by quality, format or folder
+        self.skip_archived_checkbox = QCheckBox("Skip videos already downloaded")
+        self.skip_archived_checkbox.setFont(QFont("Segoe UI", 10))
+        self.skip_archived_checkbox.setChecked(True)
+        self.skip_archived_checkbox.setToolTip(
+            "Untick to download videos again, e.g. in another quality, format or folder"
+        )
 
         options_layout.addLayout(type_layout)
         options_layout.addLayout(quality_layout)
+        options_layout.addWidget(self.size_estimate_label)
+        options_layout.addWidget(self.skip_archived_checkbox)
         options_group.setLayout(options_layout)
         parent_layout.addWidget(options_group)
         
     def _create_progress_section(self, parent_layout):
         """Create progress section"""
-        progress_group = QGroupBox("📊 Download Progress")
+        progress_group = QGroupBox("📊 Download Queue")
         progress_group.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
         progress_layout = QVBoxLayout()
         
         # Download button
-        self.download_button = QPushButton("⬇️ Start Download")
+        self.download_button = QPushButton("⬇️ Add to Queue")
         self.download_button.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
         self.download_button.setMinimumHeight(50)
         self.download_button.clicked.connect(self._start_download)
@@ -278,7 +341,43 @@ class YouTubeDownloaderWindow(QMainWindow):
             }
         """)
         
-        # Progress bar
+        # Parallel downloads
+        workers_layout = QHBoxLayout()
+        workers_label = QLabel("Parallel downloads:")
+        workers_label.setFont(QFont("Segoe UI", 10))
+
+        self.workers_spinbox = QSpinBox()
+        self.workers_spinbox.setFont(QFont("Segoe UI", 10))
+        self.workers_spinbox.setRange(1, 8)
+        self.workers_spinbox.setValue(self.DEFAULT_WORKERS)
+        self.workers_spinbox.valueChanged.connect(self.download_queue.set_max_workers)
+
+        # Jobs left unfinished when the app last stopped
+        self.resume_button = QPushButton()
+        self.resume_button.setFont(QFont("Segoe UI", 10))
+        self.resume_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.resume_button.clicked.connect(self._resume_unfinished)
+
+        workers_layout.addWidget(workers_label)
+        workers_layout.addWidget(self.workers_spinbox)
+        workers_layout.addStretch()
+        workers_layout.addWidget(self.resume_button)
+        self._update_resume_button()
+
+        # One row per job
+        self.jobs_table = QTableWidget(0, len(self.JOB_COLUMNS))
+        self.jobs_table.setHorizontalHeaderLabels(self.JOB_COLUMNS)
+        self.jobs_table.setFont(QFont("Segoe UI", 9))
+        self.jobs_table.setMinimumHeight(140)
+        self.jobs_table.verticalHeader().setVisible(False)
+        self.jobs_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.jobs_table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        header = self.jobs_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column in range(1, len(self.JOB_COLUMNS)):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+
+        # Overall progress of unfinished jobs
         self.progress_bar = QProgressBar()
         self.progress_bar.setMinimumHeight(30)
         self.progress_bar.setTextVisible(True)
@@ -291,6 +390,8 @@ class YouTubeDownloaderWindow(QMainWindow):
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         progress_layout.addWidget(self.download_button)
+        progress_layout.addLayout(workers_layout)
+        progress_layout.addWidget(self.jobs_table)
         progress_layout.addWidget(self.progress_bar)
         progress_layout.addWidget(self.status_label)
         progress_group.setLayout(progress_layout)
@@ -416,10 +517,37 @@ class YouTubeDownloaderWindow(QMainWindow):
             }
         """)
         
+    def is_busy(self) -> bool:
+        """Check whether a download or info lookup is still running"""
+        info_thread = getattr(self, 'info_thread', None)
+        return self.is_downloading or (info_thread is not None and info_thread.isRunning())
+
     def _on_download_type_changed(self):
         """Handle download type change"""
         is_video_mode = self.video_radio.isChecked()
         self.quality_selector.setEnabled(is_video_mode)
+        self.audio_format_selector.setEnabled(not is_video_mode)
+        self._update_size_estimate()
+
+    def _update_size_estimate(self):
+        """Show the formats and size the current options would download"""
+        if not self.video_info or self.video_info['type'] != 'video':
+            self.size_estimate_label.setText("Estimated size: -")
+            return
+
+        download_type = "video" if self.video_radio.isChecked() else "audio"
+        estimate = self.downloader.estimate_download(
+            self.video_info_url, self.quality_selector.currentText(), download_type,
+            self.audio_format_selector.currentData()
+        )
+        if estimate['status'] != 'success':
+            self.size_estimate_label.setText("Estimated size: -")
+            return
+
+        size = self.downloader.format_bytes(estimate['size']) if estimate['size'] else "unknown"
+        self.size_estimate_label.setText(
+            f"Estimated size: ~{size} ({estimate['resolution']}, format {estimate['format_id']})"
+        )
 
     def _fetch_video_info(self):
         """Fetch video information"""
@@ -449,19 +577,26 @@ class YouTubeDownloaderWindow(QMainWindow):
             return
             
         self.video_info = video_info
+        self.video_info_url = self.info_thread.url
 
         # Animate info section
         self._animate_height(self.video_info_group, 0, 250)
 
-        # Update info display
-        if video_info['type'] == 'playlist':
+        # Update info display; playlists show their entries instead of a thumbnail
+        is_playlist = video_info['type'] == 'playlist'
+        self.thumbnail_container.setVisible(not is_playlist)
+        self.playlist_strip.setVisible(is_playlist)
+
+        if is_playlist:
             self.title_label.setText(f"📁 {video_info['title']}")
             self.duration_label.setText(f"Videos: {video_info['count']}")
             self.uploader_label.setText(f"Uploader: {video_info['uploader']}")
             self.views_label.setText("")
             self.type_label.setText("Type: Playlist")
-            self.thumbnail_label.setText("Playlist\n\n(No thumbnail)")
+            self.thumbnail_video_id = None
+            self.playlist_strip.set_entries(video_info.get('entries', []))
             self._log_message(f"✓ Playlist: {video_info['title']} ({video_info['count']} videos)")
+            self._update_size_estimate()
         else:
             self.title_label.setText(f"🎬 {video_info['title']}")
             duration_min = video_info['duration'] // 60
@@ -470,43 +605,42 @@ class YouTubeDownloaderWindow(QMainWindow):
             self.uploader_label.setText(f"Uploader: {video_info['uploader']}")
             self.views_label.setText(f"Views: {video_info['view_count']:,}")
             self.type_label.setText("Type: Single Video")
+            self.playlist_strip.set_entries([])
             self._log_message(f"✓ Video: {video_info['title']}")
+            self._update_size_estimate()
 
             # Load thumbnail
             self._load_thumbnail()
 
     def _load_thumbnail(self):
-        """Load video thumbnail"""
-        try:
-            url = self.url_input.text().strip()
-
-            # Extract video ID
-            if 'youtube.com/watch?v=' in url:
-                video_id = url.split('watch?v=')[1].split('&')[0]
-            elif 'youtu.be/' in url:
-                video_id = url.split('youtu.be/')[1].split('?')[0]
-            else:
-                return
-                
-            thumbnail_url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-            
-            # Download and display thumbnail
-            response = requests.get(thumbnail_url, timeout=5)
-            if response.status_code == 200:
-                image = Image.open(BytesIO(response.content))
-                image = image.resize((320, 180), Image.Resampling.LANCZOS)
-                
-                # Convert to QPixmap
-                image_bytes = BytesIO()
-                image.save(image_bytes, format='PNG')
-                qimage = QImage()
-                qimage.loadFromData(image_bytes.getvalue())
-                pixmap = QPixmap.fromImage(qimage)
-                
-                self.thumbnail_label.setPixmap(pixmap)
-                self.thumbnail_label.setScaledContents(True)
-        except Exception as error:
-            self._log_message(f"⚠️ Could not load thumbnail: {str(error)}")
+        """Show the video thumbnail, fetching it in the background if needed"""
+        video_id = self.video_info.get('id')
+        if not video_id or not self.video_info.get('extractor', '').startswith('Youtube'):
+            self.thumbnail_video_id = None
+            self.thumbnail_label.setText("No thumbnail")
+            return
+
+        self.thumbnail_video_id = video_id
+        self.thumbnail_request_size = self.THUMBNAIL_SIZE * self.devicePixelRatioF()
+        pixmap = self.thumbnail_loader.load(video_id, self.thumbnail_request_size)
+        if pixmap is not None:
+            self._on_thumbnail_loaded(video_id, self.thumbnail_request_size, pixmap)
+        else:
+            self.thumbnail_label.setText("Loading thumbnail...")
+
+    def _on_thumbnail_loaded(self, video_id, size, pixmap):
+        """Display a thumbnail unless another video (or size) was requested meanwhile"""
+        if video_id != self.thumbnail_video_id or size != self.thumbnail_request_size:
+            return
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self.thumbnail_label.setPixmap(pixmap)
+
+    def _on_thumbnail_failed(self, video_id, size, message):
+        """Report a thumbnail that could not be loaded"""
+        if video_id != self.thumbnail_video_id or size != self.thumbnail_request_size:
+            return
+        self.thumbnail_label.setText("No thumbnail")
+        self._log_message(f"⚠️ Could not load thumbnail: {message}")
 
     def _animate_height(self, widget, start_height, end_height):
         """Animate widget height"""
@@ -518,11 +652,7 @@ class YouTubeDownloaderWindow(QMainWindow):
         self.height_animation.start()
 
     def _start_download(self):
-        """Start download process"""
-        if self.is_downloading:
-            QMessageBox.warning(self, "Warning", "A download is already in progress")
-            return
-            
+        """Add the current URL to the download queue"""
         url = self.url_input.text().strip()
         if not url:
             QMessageBox.warning(self, "Warning", "Please enter a YouTube URL")
@@ -530,59 +660,137 @@ class YouTubeDownloaderWindow(QMainWindow):
             
         download_type = "video" if self.video_radio.isChecked() else "audio"
         quality = self.quality_selector.currentText()
+        audio_format = self.audio_format_selector.currentData()
 
-        self.is_downloading = True
-        self.download_button.setEnabled(False)
-        self.download_button.setText("⏳ Downloading...")
-        self.progress_bar.setValue(0)
-        self.status_label.setText("Initializing download...")
-        
         if download_type == "video":
-            self._log_message(f"\n📥 Starting video download ({quality})...")
+            self._log_message(f"\n📥 Queued video download ({quality}): {url}")
         else:
-            self._log_message("\n🎵 Starting audio download (MP3)...")
+            self._log_message(f"\n🎵 Queued audio download ({audio_format.upper()}): {url}")
+
+        skip_archived = self.skip_archived_checkbox.isChecked()
+        if not skip_archived:
+            self._log_message("🔁 Downloading again even if already downloaded")
+
+        self.download_queue.submit(url, download_type, quality, audio_format, skip_archived=skip_archived)
+
+    def _resume_unfinished(self):
+        """Queue the jobs the journal has as unfinished"""
+        for job in self.download_queue.resume_unfinished():
+            self._log_message(f"\n🔁 Resuming download: {job.url}")
+        self._update_resume_button()
+
+    def _update_resume_button(self):
+        """Show how many unfinished jobs can be resumed"""
+        count = self.download_queue.get_resumable_count()
+        self.resume_button.setText(f"🔁 Resume ({count})" if count else "🔁 Resume")
+        self.resume_button.setEnabled(count > 0)
+
+    def _add_job_row(self, job) -> int:
+        """Append a table row for a new job"""
+        row = self.jobs_table.rowCount()
+        self.jobs_table.insertRow(row)
+
+        self.jobs_table.setItem(row, 0, QTableWidgetItem(job.url))
+        self.jobs_table.setItem(row, 1, QTableWidgetItem(
+            "🎬 Video" if job.download_type == "video" else f"🎵 {job.audio_format.upper()}"
+        ))
+
+        progress_bar = QProgressBar()
+        progress_bar.setTextVisible(True)
+        self.jobs_table.setCellWidget(row, 2, progress_bar)
+
+        self.jobs_table.setItem(row, 3, QTableWidgetItem("-"))
+        self.jobs_table.setItem(row, 4, QTableWidgetItem(""))
+        self.job_rows[job.job_id] = row
+        return row
+
+    def _on_job_changed(self, job):
+        """Update a job's row (runs in the GUI thread)"""
+        if job.job_id in self.finished_job_ids:
+            # A snapshot queued before the job ended; the row is already final
+            return
+        row = self.job_rows.get(job.job_id)
+        if row is None:
+            row = self._add_job_row(job)
+            self._update_resume_button()
+        if job.is_done:
+            self.finished_job_ids.add(job.job_id)
+            self._update_resume_button()
+
+        self.jobs_table.cellWidget(row, 2).setValue(int(job.percentage))
+        speed_text = f"{self.downloader.format_bytes(job.speed)}/s" if job.speed else "-"
+        self.jobs_table.item(row, 3).setText(speed_text)
+        status_text = self._describe_job_status(job)
+        if job.is_playlist:
+            total = job.items_total if job.items_total is not None else f"{job.items_enumerated}+"
+            status_text += f" ({job.items_completed}/{total}"
+            status_text += f", {job.items_failed} failed)" if job.items_failed else ")"
+        self.jobs_table.item(row, 4).setText(status_text)
+
+        if job.status == JobStatus.FINISHED:
+            self._log_message(f"✓ {job.result['message']}")
+            for converted in job.result.get('files', []):
+                label = self.CONVERSION_LABELS.get(converted['conversion'], converted['conversion'])
+                self._log_message(f"  🎵 {converted['filename']}: {label}")
+            for failure in job.result.get('failed', []):
+                self._log_message(f"  ❌ #{failure['index']} {failure['title']}: {failure['error']}")
+            if job.result.get('skipped'):
+                self._log_message("  ℹ️ Untick \"Skip videos already downloaded\" to download them again")
+            self._log_message(f"📂 Saved to: {self.downloader.get_download_directory()}")
+        elif job.status == JobStatus.FAILED:
+            self._log_message(f"❌ {job.result['message']}")
+
+        self._update_queue_summary()
+
+    def _describe_job_status(self, job) -> str:
+        """Short status text for the jobs table"""
+        return {
+            JobStatus.QUEUED: "⏳ Queued",
+            JobStatus.DOWNLOADING: "⬇️ Downloading",
+            JobStatus.PROCESSING: "⚙️ Processing",
+            JobStatus.FINISHED: "✓ Done",
+            JobStatus.FAILED: "❌ Failed",
+            JobStatus.CANCELLED: "Cancelled",
+        }[job.status]
+
+    def _update_queue_summary(self):
+        """Show overall progress and combined throughput"""
+        jobs = self.download_queue.get_jobs()
+        unfinished = [job for job in jobs if not job.is_done]
+
+        if not unfinished:
+            finished = sum(1 for job in jobs if job.status == JobStatus.FINISHED)
+            failed = sum(1 for job in jobs if job.status == JobStatus.FAILED)
+            self.progress_bar.setValue(100 if jobs else 0)
+            self.status_label.setText(f"✓ Queue complete: {finished} done, {failed} failed")
+            return
 
-        # Start download thread
-        self.download_thread = DownloadThread(
-            self.downloader, url, download_type, quality
+        overall = sum(job.percentage for job in unfinished) / len(unfinished)
+        speed = self.download_queue.get_aggregate_speed()
+        self.progress_bar.setValue(int(overall))
+        self.status_label.setText(
+            f"{self.download_queue.get_active_count()} active | "
+            f"{self.download_queue.get_pending_count()} queued | "
+            f"Total speed: {self.downloader.format_bytes(speed)}/s"
         )
-        self.download_thread.progress.connect(self._on_download_progress)
-        self.download_thread.finished.connect(self._on_download_finished)
-        self.download_thread.start()
-        
-    def _on_download_progress(self, progress_data):
-        """Handle download progress"""
-        if progress_data['status'] == 'downloading':
-            percentage = progress_data['percentage']
-            speed = progress_data['speed']
-
-            self.progress_bar.setValue(int(percentage))
-            self.status_label.setText(f"Downloading: {percentage:.1f}% | Speed: {speed}")
-        elif progress_data['status'] == 'finished':
-            self.status_label.setText("Processing... Please wait")
-            
-    def _on_download_finished(self, result):
-        """Handle download completion"""
-        self.is_downloading = False
-        self.download_button.setEnabled(True)
-        self.download_button.setText("⬇️ Start Download")
-
-        if result['status'] == 'success':
-            self.progress_bar.setValue(100)
-            self.status_label.setText("✓ Download completed!")
-            self._log_message(f"✓ {result['message']}")
-            self._log_message(f"📂 Saved to: {self.downloader.get_download_directory()}")
 
-            QMessageBox.information(
-                self, "Success",
-                f"{result['message']}\n\nSaved to:\n{self.downloader.get_download_directory()}"
-            )
-        else:
-            self.progress_bar.setValue(0)
-            self.status_label.setText("❌ Download failed")
-            self._log_message(f"❌ {result['message']}")
-            QMessageBox.critical(self, "Error", result['message'])
-            
+    def shutdown(self):
+        """Stop the download queue; running downloads still finish"""
+        self.download_queue.remove_listener(self._queue_listener)
+        self.download_queue.shutdown()
+        self.thumbnail_loader.shutdown()
+        self.downloader.http_client.close()
+
+        # Running downloads may still hand files to the transcode pool
+        threading.Thread(
+            target=self._shutdown_transcode_pool, name='transcode-shutdown', daemon=True
+        ).start()
+
+    def _shutdown_transcode_pool(self):
+        """Close the transcode pool once the running downloads are done"""
+        self.download_queue.wait()
+        self.downloader.transcode_pool.shutdown()
+
     def _change_directory(self):
         """Change download directory"""
         new_directory = QFileDialog.getExistingDirectory(